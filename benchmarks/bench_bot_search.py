@@ -0,0 +1,118 @@
+"""Bot search benchmark: time per move and depth reached by the search bots' budgets.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bot_search
+    python -m benchmarks.bench_bot_search --positions 200 --output search.json
+
+Plays the alpha-beta search of each bot_search model of the tressette config, with its depth
+and budgets, on random solo positions with cards still to draw (the endgame solver takes over
+once the pile is empty), from the opening deal up to 7 tricks in. "baseline_depth_2" and
+"baseline_depth_3" time the plain minimax the bots used before (benchmarks/baseline_minimax.py)
+on the same positions, at the fixed depths of the old D and E bots: the per-move cost the budgets
+are held to.
+"""
+import argparse
+import collections
+import json
+import random
+import statistics
+import time
+
+from benchmarks.baseline_minimax import find_optimal_card
+from src.game.bot.minimax_tressette import AlphaBetaSearch, TranspositionTable
+from src.game.tressette_bitboard import from_cards
+from src.game.tressette_config import config as tress_config
+from src.game.tressette_constants import get_score, get_stronger_card, get_suit
+
+HAND_SIZE = 10
+POINT_TO_WIN = 63  # thirds of a point, a game to 21
+BASELINE_DEPTHS = (2, 3)  # fixed depths of the old D and E bots
+
+
+def random_positions(count: int, seed: int) -> list[tuple]:
+    """(hands, draws) as card lists: a deal after 0 to 7 tricks, with at least one card to draw each."""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        deck = list(range(40))
+        rng.shuffle(deck)
+        rest = deck[rng.randrange(0, 8) * 2:]
+        pile = rest[2 * HAND_SIZE:]
+        positions.append(((rest[:HAND_SIZE], rest[HAND_SIZE:2 * HAND_SIZE]), (pile[0::2], pile[1::2])))
+    return positions
+
+
+def report(times: list[float], depths: collections.Counter) -> dict:
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "worst_ms": max(times) * 1000,
+        "mean_ms": statistics.mean(times) * 1000,
+        "mean_depth": sum(depth * n for depth, n in depths.items()) / len(times),
+        "depths": {str(depth): depths[depth] for depth in sorted(depths)},
+    }
+
+
+def measure_baseline(positions: list[tuple], depth: int) -> dict:
+    times = []
+    for (bot_cards, player_cards), (bot_draws, player_draws) in positions:
+        start = time.perf_counter()
+        find_optimal_card(
+            "bot", 0, 0, bot_cards, player_cards, bot_draws, player_draws,
+            get_suit, get_score, get_stronger_card, POINT_TO_WIN, None, depth,
+        )
+        times.append(time.perf_counter() - start)
+    return report(times, collections.Counter({depth: len(positions)}))
+
+
+def measure(positions: list[tuple], max_depth: int, time_budget: float = None, node_budget: int = None) -> dict:
+    times = []
+    depths = collections.Counter()
+    for hands, draws in positions:
+        search = AlphaBetaSearch(
+            (from_cards(hands[0]), from_cards(hands[1])), (0, 0), (bytes(draws[0]), bytes(draws[1])),
+            POINT_TO_WIN, TranspositionTable(),
+        )
+        start = time.perf_counter()
+        _, depth = search.iterative_deepening(max_depth, time_budget, node_budget)
+        times.append(time.perf_counter() - start)
+        depths[depth] += 1
+    return report(times, depths)
+
+
+def run(positions: int, seed: int) -> dict:
+    deals = random_positions(positions, seed)
+    results = {f"baseline_depth_{depth}": measure_baseline(deals, depth) for depth in BASELINE_DEPTHS}
+    for model, search in tress_config.get("bot_search", {}).items():
+        if "max_depth" not in search:
+            continue  # not an alpha-beta bot
+        time_budget_ms = search.get("time_budget_ms")
+        results[f"model_{model}"] = measure(
+            deals, search["max_depth"],
+            time_budget_ms / 1000 if time_budget_ms is not None else None,
+            search.get("node_budget"),
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.positions, args.seed)
+    for name, result in results.items():
+        print(
+            f"{name:16} median {result['median_ms']:7.2f} ms  worst {result['worst_ms']:7.2f} ms  "
+            f"mean {result['mean_ms']:7.2f} ms  depth {result['mean_depth']:4.2f}  {result['depths']}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
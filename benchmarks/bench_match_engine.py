@@ -0,0 +1,82 @@
+"""Match engine throughput benchmark: bot only tables played headless on a virtual clock.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_match_engine
+    python -m benchmarks.bench_match_engine --output bench.json
+    python -m benchmarks.bench_match_engine --baseline bench.json --tolerance 0.2
+
+With --baseline, exits with status 1 when a scenario's games/sec is more than `tolerance` below
+the baseline, so it can gate a deploy.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from src.game.match import PLAYER_DUO_MODE, PLAYER_SOLO_MODE
+from src.game.simulation import run_simulation
+
+SCENARIOS = {
+    "solo_1_table": dict(games=20, tables=1, player_mode=PLAYER_SOLO_MODE),
+    "solo_100_tables": dict(games=300, tables=100, player_mode=PLAYER_SOLO_MODE),
+    "duo_50_tables": dict(games=100, tables=50, player_mode=PLAYER_DUO_MODE),
+    "solo_21_points": dict(games=100, tables=20, player_mode=PLAYER_SOLO_MODE, point_mode=21),
+}
+
+
+async def run_scenarios(names: list[str], repeat: int, seed: int, trace_alloc: bool) -> dict:
+    results = {}
+    for name in names:
+        best = None
+        for _ in range(repeat):
+            report = await run_simulation(seed=seed, trace_alloc=trace_alloc, **SCENARIOS[name])
+            if best is None or report["games_per_sec"] > best["games_per_sec"]:
+                best = report
+        results[name] = best
+        print(f"{name:18} {best['games_per_sec']:9.1f} games/s {best['hands_per_sec']:10.1f} hands/s "
+              f"p50 {best['command_p50_us']:7.1f}us p99 {best['command_p99_us']:8.1f}us "
+              f"blocks {best['allocated_blocks_delta']:+d}")
+    return results
+
+
+def check_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    failures = []
+    for name, report in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["games_per_sec"]
+        if report["games_per_sec"] < expected * (1 - tolerance):
+            failures.append(f"{name}: {report['games_per_sec']:.1f} games/s, baseline {expected:.1f}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="default: all")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario, the best one is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-alloc", action="store_true", help="report tracemalloc peak, slower")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="JSON written by --output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = asyncio.run(run_scenarios(args.scenario or list(SCENARIOS), args.repeat, args.seed, args.trace_alloc))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        failures = check_regressions(results, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
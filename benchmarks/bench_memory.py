@@ -0,0 +1,115 @@
+"""Memory benchmark: bytes per live table and per cached user, measured with tracemalloc.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --tables 2000 --users 50000 --output memory.json
+
+A table is a TressetteMatch with every seat taken by a bot, its mailbox and game flow; the UserInfo
+of its bots is cached beforehand so it is not counted. A user is a UserInfo in the users cache.
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import logging
+import os
+import tracemalloc
+
+from src.game.clock import VirtualClock
+from src.game.game_vars import game_vars
+from src.game.match import PLAYER_DUO_MODE, PLAYER_SOLO_MODE
+from src.game.models import UserInfo
+from src.game.simulation import NullGameClient
+from src.game.users_info_mgr import users_info_mgr
+
+FIRST_UID = 50_000_000  # above the bot uids
+
+
+def traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def make_user(uid: int) -> UserInfo:
+    user = UserInfo(uid, f"player {uid}", 100_000_000, 1, str(uid % 10), "", True, 0)
+    user.game_count = uid % 100
+    return user
+
+
+async def measure_tables(count: int, player_mode: int) -> float:
+    match_mgr = game_vars.get_match_mgr()
+    uids = list(range(FIRST_UID, FIRST_UID + count * player_mode))
+    for uid in uids:
+        users_info_mgr.users[uid] = make_user(uid)
+
+    before = traced_bytes()
+    matches = []
+    for i in range(count):
+        match = await match_mgr._create_match(1000, player_mode, True, 11)
+        for uid in uids[i * player_mode:(i + 1) * player_mode]:
+            await match.user_join(uid, is_bot=True)
+        matches.append(match)
+    per_table = (traced_bytes() - before) / count
+
+    for match in matches:
+        match_mgr.destroy_match(match.match_id)
+    for uid in uids:
+        users_info_mgr.users.pop(uid)
+    return per_table
+
+
+def measure_users(count: int) -> float:
+    before = traced_bytes()
+    for uid in range(FIRST_UID, FIRST_UID + count):
+        users_info_mgr.users[uid] = make_user(uid)
+    per_user = (traced_bytes() - before) / count
+
+    for uid in range(FIRST_UID, FIRST_UID + count):
+        users_info_mgr.users.pop(uid)
+    return per_user
+
+
+async def run(tables: int, users: int) -> dict:
+    old_clock, old_client = game_vars.clock, game_vars.game_client
+    game_vars.set_clock(VirtualClock())
+    game_vars.game_client = NullGameClient()
+    old_max_size = users_info_mgr.users.max_size
+    users_info_mgr.users.max_size = max(old_max_size, tables * PLAYER_DUO_MODE, users) + 1
+    logging.disable(logging.INFO)
+    tracemalloc.start()
+    # matches print a lot, keep the report readable
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return {
+                "bytes_per_solo_table": await measure_tables(tables, PLAYER_SOLO_MODE),
+                "bytes_per_duo_table": await measure_tables(tables, PLAYER_DUO_MODE),
+                "bytes_per_cached_user": measure_users(users),
+            }
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+        users_info_mgr.users.max_size = old_max_size
+        game_vars.set_clock(old_clock)
+        game_vars.game_client = old_client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.tables, args.users))
+    for name, value in results.items():
+        print(f"{name:24} {value:10.0f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+"""Equivalence checks of the optimized engines against plain reference implementations.
+
+Run from the repository root:
+
+    python -m benchmarks.check_engines
+    python -m benchmarks.check_engines --check search --check endgame --seed 3
+
+Each check plays random cases through the fast code and a slow, obviously right version of the
+same thing, and reports the cases where they disagree. Exits with status 1 on a mismatch, so it
+can run next to the benchmarks before a deploy.
+"""
+import argparse
+import asyncio
+import random
+import sys
+
+import numpy as np
+
+from src.base.network.inbound_queue import OVERFLOW_DROP, OVERFLOW_PAUSE, InboundQueue
+from src.base.network.rate_limiter import BucketGroup
+from src.base.network.resume import ResumeState
+from src.game import tressette_bitboard as bitboard
+from src.game.bot.minimax_tressette import WIN_SCORE, AlphaBetaSearch, EndgameSolver, TranspositionTable
+from src.game.bot.pimc_tressette import pimc_move, sample_deals
+from src.game.match import MatchState
+from src.game.match_index import MatchIndex
+from src.game.table_list import TableListCache, bucket_gold, gold_bucket
+from src.game.tressette_config import config as tress_config
+from src.game.tressette_constants import TRESSETTE_CARD_STRONGS, TRESSETTE_CARD_VALUES
+
+LAST_TRICK_BONUS = 3
+
+
+def strength(card: int) -> int:
+    return TRESSETTE_CARD_STRONGS[card // 4]
+
+
+# bitboard helpers against card lists
+
+def check_bitboard(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    for _ in range(cases):
+        cards = rng.sample(range(40), rng.randint(0, 12))
+        hand = bitboard.from_cards(cards)
+        lead_suit = rng.choice([-1, 0, 1, 2, 3])
+        if sorted(cards) != bitboard.to_cards(hand) or len(cards) != bitboard.count(hand):
+            failures.append(f"to_cards/count {cards}")
+
+        follow = [card for card in cards if card % 4 == lead_suit]
+        expected = sorted(follow or cards)
+        if bitboard.to_cards(bitboard.legal_moves(hand, lead_suit)) != expected:
+            failures.append(f"legal_moves {cards} lead suit {lead_suit}")
+
+        if bitboard.points(hand) != sum(TRESSETTE_CARD_VALUES[card] for card in cards):
+            failures.append(f"points {cards}")
+
+        napoli = [suit for suit in range(4) if {suit, suit + 4, suit + 8} <= set(cards)]
+        if bitboard.napoli_suits(hand) != napoli:
+            failures.append(f"napoli_suits {cards}")
+
+        strongest = max(cards, key=lambda card: (strength(card), -card)) if cards else -1
+        if bitboard.strongest_card(hand) != strongest:
+            failures.append(f"strongest_card {cards}")
+
+        cost = lambda card: (TRESSETTE_CARD_VALUES[card], strength(card))
+        cheapest = bitboard.cheapest_card(hand)
+        if (cheapest == -1) != (not cards) or (cards and cost(cheapest) != min(map(cost, cards))):
+            failures.append(f"cheapest_card {cards}")
+
+        if cards and lead_suit != -1 and follow:
+            winner = max(follow, key=strength)
+            if bitboard.trick_winner(hand, lead_suit) != winner:
+                failures.append(f"trick_winner {cards} lead suit {lead_suit}")
+            if any(bitboard.beats(card, winner) for card in follow):
+                failures.append(f"beats {cards} lead suit {lead_suit}")
+    return failures
+
+
+# alpha-beta search and endgame solver against plain minimax
+
+def minimax(hands, scores, draws, drawn, lead, to_move, depth, point_to_win) -> int:
+    """Value for the side to move: the score difference, WIN_SCORE more once a side reaches
+    point_to_win. depth counts tricks, the value of the position is taken after depth of them."""
+    if lead == -1:
+        if not hands[0] and not hands[1]:
+            # end of round, partial points are dropped
+            return scores[to_move] // 3 * 3 - scores[1 - to_move] // 3 * 3
+        if depth <= 0:
+            return scores[to_move] - scores[1 - to_move]
+        moves = bitboard.to_cards(hands[to_move])
+    else:
+        moves = bitboard.to_cards(bitboard.legal_moves(hands[to_move], lead % 4))
+    return max(move_value(hands, scores, draws, drawn, lead, to_move, depth, point_to_win, card) for card in moves)
+
+
+def move_value(hands, scores, draws, drawn, lead, to_move, depth, point_to_win, card) -> int:
+    hands = list(hands)
+    hands[to_move] ^= bitboard.CARD_BITS[card]
+    if lead == -1:
+        return -minimax(hands, scores, draws, drawn, card, 1 - to_move, depth, point_to_win)
+
+    takes = card % 4 == lead % 4 and strength(card) > strength(lead)
+    winner = to_move if takes else 1 - to_move
+    points = TRESSETTE_CARD_VALUES[card] + TRESSETTE_CARD_VALUES[lead]
+    if drawn < len(draws[0]):
+        hands[0] |= bitboard.CARD_BITS[draws[0][drawn]]
+        hands[1] |= bitboard.CARD_BITS[draws[1][drawn]]
+        drawn += 1
+    elif not hands[0] and not hands[1]:
+        points += LAST_TRICK_BONUS
+    scores = list(scores)
+    scores[winner] += points
+    if scores[winner] >= point_to_win:
+        value = WIN_SCORE + scores[winner] - scores[1 - winner]
+    else:
+        value = minimax(hands, scores, draws, drawn, -1, winner, depth - 1, point_to_win)
+    return value if winner == to_move else -value
+
+
+def random_position(rng: random.Random, max_cards: int, max_draws: int):
+    """(hands, scores, draws, lead, point_to_win) with side 0 to move; side 1 led `lead`, or -1."""
+    deck = list(range(40))
+    rng.shuffle(deck)
+    n = rng.randint(1, max_cards)
+    hands = [bitboard.from_cards(deck[:n]), bitboard.from_cards(deck[n:2 * n])]
+    num_draws = rng.randint(0, max_draws)
+    pile = deck[2 * n:2 * n + 2 * num_draws]
+    point_to_win = rng.choice([33, 63])
+    scores = [rng.randint(0, point_to_win - 1), rng.randint(0, point_to_win - 1)]
+    lead = -1
+    if rng.random() < 0.5:
+        lead = deck[2 * n - 1]
+        hands[1] ^= bitboard.CARD_BITS[lead]
+    return hands, scores, (pile[0::2], pile[1::2]), lead, point_to_win
+
+
+def check_search(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    for _ in range(cases):
+        hands, scores, draws, lead, point_to_win = random_position(rng, 4, 3)
+        depth = rng.randint(1, 5)
+        search = AlphaBetaSearch(hands, scores, (bytes(draws[0]), bytes(draws[1])), point_to_win, TranspositionTable(8))
+        if lead != -1:
+            search.set_lead(lead)
+        card, value = search.best_move(depth)
+        expected = minimax(hands, scores, draws, 0, lead, 0, depth, point_to_win)
+        if value != expected:
+            failures.append(f"alpha-beta value {value}, minimax {expected}: {hands} {scores} {draws} lead {lead} depth {depth}")
+        elif move_value(hands, scores, draws, 0, lead, 0, depth, point_to_win, card) != expected:
+            failures.append(f"alpha-beta move {card} does not reach {expected}: {hands} {scores} {draws} lead {lead}")
+    return failures
+
+
+def check_endgame(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    solver = EndgameSolver()  # shared, so memo and table entries of earlier cases are reused
+    for _ in range(cases):
+        hands, scores, _, lead, point_to_win = random_position(rng, 5, 0)
+        card, value = solver.best_move(hands, scores, point_to_win, lead)
+        no_draws = ([], [])
+        expected = minimax(hands, scores, no_draws, 0, lead, 0, 2 * 40, point_to_win)
+        if value != expected:
+            failures.append(f"endgame value {value}, minimax {expected}: {hands} {scores} lead {lead}")
+        elif move_value(hands, scores, no_draws, 0, lead, 0, 2 * 40, point_to_win, card) != expected:
+            failures.append(f"endgame move {card} does not reach {expected}: {hands} {scores} lead {lead}")
+    return failures
+
+
+# PIMC deals and moves
+
+def check_pimc(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    for _ in range(cases):
+        deck = list(range(40))
+        rng.shuffle(deck)
+        played = rng.randint(0, 10) * 2
+        bot_cards = deck[played:played + 10]
+        opp_cards = deck[played + 10:played + 20]
+        opp_shown = bitboard.from_cards(rng.sample(opp_cards, rng.randint(0, 2)))
+        opp_suits = {card % 4 for card in opp_cards}
+        void_suits = sum(1 << suit for suit in range(4) if suit not in opp_suits and rng.random() < 0.7)
+        bot_hand = bitboard.from_cards(bot_cards)
+        played_cards = bitboard.from_cards(deck[:played])
+
+        unknown = np.array(bitboard.to_cards(bitboard.FULL_DECK & ~(bot_hand | opp_shown | played_cards)), dtype=np.int64)
+        opp_hidden = len(opp_cards) - bitboard.count(opp_shown)
+        samples = 16
+        deal_opp, pile = sample_deals(np.random.default_rng(rng.getrandbits(32)), unknown, opp_hidden, void_suits, samples)
+        non_void = sum(1 for card in unknown if not void_suits >> (card % 4) & 1)
+        for row in range(samples):
+            if sorted(deal_opp[row].tolist() + pile[row].tolist()) != sorted(unknown.tolist()):
+                failures.append(f"sample_deals row {row} is not a split of the unknown cards")
+            if non_void >= opp_hidden and any(void_suits >> (card % 4) & 1 for card in deal_opp[row].tolist()):
+                failures.append(f"sample_deals gave the opponent a card of a void suit {void_suits:04b}")
+
+        lead = -1
+        if rng.random() < 0.5:
+            lead = rng.choice(opp_cards)
+            played_cards |= bitboard.CARD_BITS[lead]
+            opp_shown &= ~bitboard.CARD_BITS[lead]
+        state = (bot_hand, opp_shown, len(opp_cards) - (lead != -1), played_cards, void_suits, lead,
+                 rng.randint(0, 30), rng.randint(0, 30), 63, 8, rng.getrandbits(32))
+        card = pimc_move(state)
+        legal = bitboard.legal_moves(bot_hand, lead % 4 if lead != -1 else -1)
+        if not legal >> card & 1:
+            failures.append(f"pimc_move played {card}, not a legal move")
+        if pimc_move(state) != card:
+            failures.append("pimc_move is not deterministic for a seed")
+    return failures
+
+
+# match index and table list against scans of every match
+
+class FakeMatch:
+    """The fields MatchIndex and TableListCache read from a match."""
+    def __init__(self, match_id: int, bet: int, player_mode: int):
+        self.match_id = match_id
+        self.game_mode = 0
+        self.player_mode = player_mode
+        self.bet = bet
+        self.is_public = True
+        self.state = MatchState.WAITING
+        self.open = True
+        self.players = []
+
+    def is_open_for_quick_play(self) -> bool:
+        return self.open
+
+    def get_num_players(self) -> int:
+        return len(self.players)
+
+
+def check_indexes(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    index, table_list = MatchIndex(), TableListCache()
+    matches: dict[int, FakeMatch] = {}
+    keys: dict[int, tuple] = {}  # match_id -> key the scan sees the match under
+    opened: dict[int, int] = {}  # match_id -> step the match got its key, the oldest comes first
+    bets = [1000, 3000, 5000, 50000, 200000]
+    for step in range(cases):
+        op = rng.random()
+        if op < 0.25 or not matches:
+            match = FakeMatch(step, rng.choice(bets), rng.choice([2, 4]))
+            matches[match.match_id] = match
+        else:
+            match = matches[rng.choice(list(matches))]
+            if op < 0.35:
+                del matches[match.match_id]
+                keys.pop(match.match_id, None)
+                index.remove(match)
+                table_list.remove(match)
+                continue
+            if op < 0.55:
+                match.open = not match.open
+            elif op < 0.7:
+                match.state = rng.choice([MatchState.WAITING, MatchState.PLAYING])
+            elif op < 0.85:
+                match.is_public = not match.is_public
+            else:
+                match.bet = rng.choice(bets)
+        key = (match.game_mode, match.player_mode, match.bet) if match.open else None
+        if keys.get(match.match_id) != key:
+            keys[match.match_id] = key
+            opened[match.match_id] = step
+        index.update(match)
+        table_list.update(match)
+
+        player_mode = rng.choice([2, 4])
+        target_bet = rng.uniform(0, 250000)
+        max_bet = rng.uniform(target_bet, 300000)
+        found = index.find_closest(0, player_mode, target_bet, max_bet)
+        candidates = [m for m in matches.values() if keys.get(m.match_id) and m.player_mode == player_mode and m.bet <= max_bet]
+        below = [m.bet for m in candidates if m.bet <= target_bet]
+        above = [m.bet for m in candidates if m.bet > target_bet]
+        best_bet = max(below) if below else None
+        if above and (best_bet is None or min(above) - target_bet < target_bet - best_bet):
+            best_bet = min(above)
+        expected = min((m for m in candidates if m.bet == best_bet), key=lambda m: opened[m.match_id], default=None)
+        if found is not expected:
+            failures.append(f"find_closest step {step}: {getattr(found, 'match_id', None)}, "
+                            f"scan {getattr(expected, 'match_id', None)}")
+
+        gold = rng.randint(1, 2_000_000)
+        target = bucket_gold(gold_bucket(gold)) / tress_config.get('bet_multiplier_min')
+        listed = table_list.closest_matches(bucket_gold(gold_bucket(gold)))
+        public = [m for m in matches.values() if m.is_public]
+        waiting = sorted(abs(m.bet - target) for m in public if m.state == MatchState.WAITING)
+        others = sorted(abs(m.bet - target) for m in public if m.state != MatchState.WAITING)
+        scan = (waiting + others)[:20]
+        got = [abs(m.bet - target) for m in listed]
+        num_waiting = min(len(waiting), 20)
+        if (len({m.match_id for m in listed}) != len(listed) or any(not m.is_public for m in listed)
+                or sorted(got[:num_waiting]) != scan[:num_waiting] or sorted(got[num_waiting:]) != scan[num_waiting:]
+                or any(m.state != MatchState.WAITING for m in listed[:num_waiting])):
+            failures.append(f"closest_matches step {step}")
+        if table_list.get_payload(gold) != table_list.build(bucket_gold(gold_bucket(gold))).SerializeToString():
+            failures.append(f"stale TableList payload step {step}")
+    return failures
+
+
+# network pipeline pieces
+
+def check_resume(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    for _ in range(cases):
+        buffer_size = rng.randint(1, 16)
+        state = ResumeState(1, buffer_size)
+        sent = [state.number(bytes([i % 256])) for i in range(rng.randint(0, 40))]
+        last_seq = rng.randint(0, len(sent) + 1)
+        oldest_kept = max(1, len(sent) - buffer_size + 1)
+        can_replay = last_seq <= len(sent) and last_seq + 1 >= oldest_kept
+        if state.can_replay_from(last_seq) != can_replay:
+            failures.append(f"can_replay_from {last_seq}, {len(sent)} sent, buffer {buffer_size}")
+        if can_replay and state.frames_after(last_seq) != sent[last_seq:]:
+            failures.append(f"frames_after {last_seq}, {len(sent)} sent, buffer {buffer_size}")
+    return failures
+
+
+def check_rate_limiter(rng: random.Random, cases: int) -> list[str]:
+    failures = []
+    for _ in range(cases):
+        rate, burst = rng.uniform(0.5, 20), rng.randint(1, 20)
+        swept, plain = BucketGroup(rate, burst), BucketGroup(rate, burst)
+        now = 0.0
+        allowed = []
+        for _ in range(200):
+            now += rng.expovariate(rate * 1.5)
+            if rng.random() < 0.1:
+                swept.sweep(now)  # only drops buckets that are full, the answers stay the same
+            ok = swept.consume("key", now)
+            if ok != plain.consume("key", now):
+                failures.append(f"sweep changed an answer, rate {rate:.2f} burst {burst}")
+                break
+            if ok:
+                allowed.append(now)
+        # never more than burst + rate * window in any window
+        for i, start in enumerate(allowed):
+            for j in range(i, len(allowed)):
+                if j - i + 1 > burst + rate * (allowed[j] - start) + 1e-9:
+                    failures.append(f"{j - i + 1} allowed in {allowed[j] - start:.3f}s, rate {rate:.2f} burst {burst}")
+                    break
+    return failures
+
+
+async def _inbound_case(rng: random.Random, policy: str) -> list[str]:
+    handled = []
+    gate = asyncio.Event()
+
+    async def handler(packet):
+        await gate.wait()
+        handled.append(packet)
+
+    max_pending = rng.randint(1, 5)
+    queue = InboundQueue(handler, max_pending, policy)
+    queue.start()
+    num_packets = rng.randint(1, 12)
+    if policy == OVERFLOW_DROP:
+        accepted = [i for i in range(num_packets) if await queue.put(i)]
+        gate.set()
+        await asyncio.sleep(0.01)
+        queue.close()
+        # the puts do not yield, the worker has taken nothing yet: the first max_pending fit
+        if accepted != list(range(min(num_packets, max_pending))) or handled != accepted:
+            return [f"drop: accepted {accepted}, handled {handled}, max_pending {max_pending}"]
+        return []
+
+    async def read():
+        # one reader, like the connection's receive loop
+        for i in range(num_packets):
+            await queue.put(i)
+
+    reader = asyncio.create_task(read())
+    await asyncio.sleep(0.01)
+    paused = queue.is_paused()
+    gate.set()
+    await asyncio.sleep(0.01)
+    failures = []
+    if handled != list(range(num_packets)):
+        failures.append(f"pause: handled {handled} of {num_packets}")
+    if paused != (num_packets > max_pending + 1):
+        failures.append(f"pause: paused {paused} with {num_packets} packets, max_pending {max_pending}")
+    await reader
+
+    # a reader paused on a full queue is released by close()
+    gate.clear()
+    for i in range(max_pending + 1):
+        await queue.put(i)
+    await asyncio.sleep(0.01)
+    blocked = asyncio.create_task(queue.put("blocked"))
+    await asyncio.sleep(0.01)
+    queue.close()
+    try:
+        if await asyncio.wait_for(blocked, 1) is not False:
+            failures.append("pause: put after close did not report the packet as rejected")
+    except asyncio.TimeoutError:
+        failures.append("pause: close left the reader blocked")
+    return failures
+
+
+def check_inbound(rng: random.Random, cases: int) -> list[str]:
+    async def run() -> list[str]:
+        failures = []
+        for _ in range(max(1, cases // 10)):
+            for policy in (OVERFLOW_DROP, OVERFLOW_PAUSE):
+                failures += await _inbound_case(rng, policy)
+        return failures
+    return asyncio.run(run())
+
+
+CHECKS = {
+    "bitboard": (check_bitboard, 5000),
+    "search": (check_search, 300),
+    "endgame": (check_endgame, 300),
+    "pimc": (check_pimc, 100),
+    "indexes": (check_indexes, 2000),
+    "resume": (check_resume, 2000),
+    "rate_limiter": (check_rate_limiter, 100),
+    "inbound": (check_inbound, 100),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="append", choices=list(CHECKS), help="default: all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies the number of cases")
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.check or list(CHECKS):
+        fn, cases = CHECKS[name]
+        failures = fn(random.Random(args.seed), max(1, int(cases * args.scale)))
+        print(f"{name:14} {'ok' if not failures else f'{len(failures)} mismatches'}")
+        for failure in failures[:10]:
+            print(f"  {failure}")
+        failed = failed or bool(failures)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from src.config.settings import settings
 from src.game.users_info_mgr import users_info_mgr
 from src.game.game_vars import game_vars
 import src.game.game_client as game_client
+from src.game import match_flow
 from src.base.payment.apple_pay import cheat_test_sandbox
 from src.base.payment.paypal_pay import create_paypal_order, handle_paypal_success
 
@@ -30,6 +31,7 @@ async def lifespan(app: FastAPI):
     # init game vars
     asyncio.create_task(game_vars.init_game_vars())
     yield
+    game_vars.get_bot_pool().shutdown()
 if settings.ENABLE_SWAGGER:
     app = FastAPI(lifespan=lifespan)
 else:
@@ -102,13 +104,47 @@ async def get_data_cmds(password, cmd, data: Optional[str] = None):
             return "Invalid password"
         if cmd == 'ccu':
             return await game_vars.get_game_live_performance().get_ccu()
+        if cmd == 'network_stats':
+            return connection_manager.get_network_stats()
+        if cmd == 'cmd_stats':
+            return game_vars.get_game_client().get_cmd_stats()
+        if cmd == 'match_scheduler_stats':
+            return game_vars.get_match_mgr().scheduler.get_stats()
+        if cmd == 'match_index_stats':
+            return game_vars.get_match_mgr().match_index.get_stats()
+        if cmd == 'user_cache_stats':
+            return users_info_mgr.users.get_stats()
+        if cmd == 'table_list_stats':
+            return game_vars.get_match_mgr().table_list.get_stats()
+        if cmd == 'bot_pool_stats':
+            return game_vars.get_bot_pool().get_stats()
+        if cmd == 'match_inspect':
+            if data is None:
+                raise HTTPException(status_code=400, detail="Missing data for match_inspect command")
+            match = await game_vars.get_match_mgr().get_match(int(data))
+            if match is None:
+                return f"Match {data} not found"
+            return match.snapshot()
+        if cmd == 'match_fast_forward':
+            if data is None:
+                raise HTTPException(status_code=400, detail="Missing data for match_fast_forward command")
+            match = await game_vars.get_match_mgr().get_match(int(data))
+            if match is None:
+                return f"Match {data} not found"
+            await match.mailbox.call(match.fast_forward)
+            return match.snapshot()
+        if cmd == 'flow_timings':
+            if data is not None:
+                name, value = data.split(',')
+                match_flow.set_timing(name, float(value))
+            return match_flow.timings
         if cmd == 'cheat_refresh':
             if data is None:
                 raise HTTPException(status_code=400, detail="Missing data for cheat command")
             await users_info_mgr.remove_cache_user(int(data))
             return 'cheat ok'
         elif cmd == 'cheat_refresh_all_cache':
-            for uid in users_info_mgr.users:
+            for uid in list(users_info_mgr.users):
                 await users_info_mgr.remove_cache_user(uid)
             return 'cheat ok'
         elif cmd == "cheat_gold":
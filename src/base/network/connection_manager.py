@@ -6,11 +6,17 @@ import time
 import traceback
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
-from src.base.security.jwt import create_session_token, verify_token
+from src.config.settings import settings
+from src.base.security.jwt import SESSION_TOKEN_EXPIRE_MINUTES, create_session_token, verify_token
 from src.constants import *
 from src.game.users_info_mgr import users_info_mgr
 from src.game.game_vars import game_vars
 from src.base.network.packets import packet_pb2
+from src.base.network.heartbeat import HeartbeatScheduler
+from src.base.network.inbound_queue import OVERFLOW_DISCONNECT
+from src.base.network.rate_limiter import rate_limiter
+from src.base.network.resume import ResumeState
+from src.base.network.session import Session
 from src.game.cmds import CMDs
 
 logging.basicConfig(
@@ -25,18 +31,22 @@ CMD_LOGIN = 1
 CMD_CREATE_GUEST_ACCOUNT = 2
 CMD_LOGIN_FIREBASE = 3
 CMD_APP_VERSION = 5
+# CMD_PACKET_BATCH = 6, server -> client only, see outbound_queue.py
+CMD_RESUME_SESSION = 7
 PING_INTERVAL = 10  # Interval between pings
 
+# the ping packet never changes, serialize it once
+PING_FRAME = packet_pb2.Packet(cmd_id=CMD_PING_PONG, payload=packet_pb2.PingPong().SerializeToString()).SerializeToString()
+
 with open('config/app_version.json', 'r') as file:
     app_version_config = json.load(file)
     
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: set[WebSocket] = set()
-        self.ping_tasks: dict[WebSocket, asyncio.Task] = {}
-        self.ping_responses: dict[WebSocket, int] = {}  # Track pongs received per connection
-        self.user_websockets: dict[int, WebSocket] = {}  # Track user IDs to WebSockets
-        self.guest_create_times: dict[WebSocket, int] = {} # timestamp of guest account creation, to prevent spam
+        self.sessions: dict[WebSocket, Session] = {}  # every open connection
+        self.user_sessions: dict[int, Session] = {}  # logged in connections, uid -> Session
+        self.resume_states: dict[int, ResumeState] = {}  # uid -> ResumeState, kept for a grace period after disconnect
+        self.heartbeat = HeartbeatScheduler(PING_INTERVAL, MAX_RETRY_PINGS, PING_FRAME, self._on_heartbeat_timeout)
 
     async def handle_new_connection(self, websocket: WebSocket):
         """Handles a new WebSocket connection."""
@@ -52,15 +62,41 @@ class ConnectionManager:
         app_version_pkg.ios_forced_update_version = app_version_config.get("ios_forced_update_version")
         app_version_pkg.ios_remind_update_version = app_version_config.get("ios_remind_update_version")
         app_version_pkg.ios_reviewing_version = app_version_config.get("ios_reviewing_version")
+        app_version_pkg.support_packet_batch = settings.ENABLE_PACKET_BATCH
 
         # send app version
         p = app_version_pkg.SerializeToString()
         await self.send_packet(websocket, CMD_APP_VERSION, p)
 
         try:
-            while websocket in self.active_connections:
+            while websocket in self.sessions:
                 raw_data = await websocket.receive_bytes()
-                asyncio.create_task(self.handle_received_packet(websocket, raw_data))
+                session = self.sessions.get(websocket)
+                if session is None:
+                    break
+                packet = packet_pb2.Packet()
+                try:
+                    packet.ParseFromString(raw_data)
+                except Exception as e:
+                    logger.info(f"Failed to parse packet: {e}")
+                    continue
+                if packet.cmd_id == CMD_PING_PONG:
+                    # answered right away, a pong must not wait behind a slow handler
+                    session.pong_count += 1
+                    continue
+                if not rate_limiter.allow(packet.cmd_id, session.uid, session.ip, session.conn_id):
+                    logger.info(f"Rate limited: cmd_id={packet.cmd_id}, uid={session.uid}, ip={session.ip}")
+                    continue
+                # handled in order by the session's worker
+                if not await session.inbound_queue.put(packet):
+                    if session.inbound_queue.closed:
+                        # closed while the reader was paused on a full queue
+                        break
+                    print(f"Inbound queue full, packet dropped: cmd_id={packet.cmd_id}")
+                    if session.inbound_queue.policy == OVERFLOW_DISCONNECT:
+                        await websocket.close()
+                        await self.disconnect(websocket)
+                        break
         except WebSocketDisconnect:
             await self.disconnect(websocket)
             print(f"WebSocket disconnected: {websocket}")
@@ -68,118 +104,147 @@ class ConnectionManager:
             print(f"Error: {e}")
             await self.disconnect(websocket)
 
-    async def ping_client(self, websocket: WebSocket):
-        """Sends a ping message and waits for pong responses."""
-        self.ping_responses[websocket] = 0  # Reset pong counter
-        num_pings = 0
-
-        while websocket in self.active_connections:
-            try:
-                await self._send_ping_packet(websocket)
-                num_pings += 1
-                await asyncio.sleep(PING_INTERVAL)
-
-                if self.ping_responses[websocket] == 0:
-                    if num_pings >= MAX_RETRY_PINGS:
-                        print(f"Max retries for ping reached. Disconnecting WebSocket: {websocket}.")
-                        await self.disconnect(websocket)
-                        break
-                else:
-                    num_pings = 0  # Reset ping count if pong received
-                    self.ping_responses[websocket] = 0  # Reset pong counter after receiving pong
-            except WebSocketDisconnect:
-                print(f"WebSocket closed during ping: {websocket}")
-                break
-            except Exception as e:
-                print(f"Error during ping: {e}. Retrying...")
-                await asyncio.sleep(1)
-
-    async def _send_ping_packet(self, websocket: WebSocket):
-        """Sends a ping packet."""
-        ping = packet_pb2.PingPong()  # Empty message
-        payload_ping = ping.SerializeToString()
-        await self.send_packet(websocket, CMD_PING_PONG, payload_ping)
+    def _on_heartbeat_timeout(self, session: Session):
+        """Called by the heartbeat scheduler when a connection stopped answering pings."""
+        asyncio.create_task(self.disconnect(session.websocket))
+        session.outbound_queue.close(close_socket=True)
 
     async def connect(self, websocket: WebSocket):
         """Handles accepting and adding a new connection."""
         await websocket.accept()
-        self.active_connections.add(websocket)
-        ping_task = asyncio.create_task(self.ping_client(websocket))
-        self.ping_tasks[websocket] = ping_task  # Track the ping task
+        session = Session(websocket, self._process_packet)
+        session.start()
+        self.sessions[websocket] = session
+        self.heartbeat.add(session)
 
     async def disconnect(self, websocket: WebSocket):
         """Disconnects and cleans up resources for a WebSocket."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.ping_tasks:
-            self.ping_tasks[websocket].cancel()  # Cancel the ping task
-            del self.ping_tasks[websocket]
-        if websocket in self.ping_responses:
-            del self.ping_responses[websocket]  # Remove pong tracking
+        session = self.sessions.pop(websocket, None)
+        if session is None:
+            return
+        self.heartbeat.remove(session)
+        session.close()
 
         print(f"WebSocket disconnected: {websocket}")
 
-        # find user id
-        user_id = None
-        for uid, ws in self.user_websockets.items():
-            if ws == websocket:
-                user_id = uid
-                del self.user_websockets[uid]
-                break
-        if user_id:
+        user_id = self._unbind_user(session)
+        if user_id and not self._suspend_resume(user_id):
             await game_vars.get_game_mgr().on_user_disconnect(user_id)
 
+    def _suspend_resume(self, uid: int) -> bool:
+        """Keeps the user's replay buffer for RESUME_GRACE_SECONDS, packets sent meanwhile are buffered.
+        The game hears of the disconnect only once the grace period is over. Returns False if the
+        user cannot resume."""
+        state = self.resume_states.get(uid)
+        if state is None:
+            return False
+        state.disconnected_at = time.monotonic()
+        asyncio.get_running_loop().call_later(int(settings.RESUME_GRACE_SECONDS) + 1, self._expire_resume, uid, state)
+        return True
+
+    def _expire_resume(self, uid: int, state: ResumeState):
+        if self.resume_states.get(uid) is state and state.is_expired():
+            del self.resume_states[uid]
+            asyncio.create_task(game_vars.get_game_mgr().on_user_disconnect(uid))
+
+    def _bind_user(self, session: Session, uid: int):
+        self._unbind_user(session)
+        session.uid = uid
+        session.auth_expires_at = time.time() + SESSION_TOKEN_EXPIRE_MINUTES * 60
+        self.user_sessions[uid] = session
+
+    def _unbind_user(self, session: Session):
+        """Removes the uid -> session mapping if it still points to this session, returns the uid."""
+        uid = session.uid
+        session.uid = None
+        session.auth_expires_at = 0.0
+        session.resume = None
+        if uid is not None and self.user_sessions.get(uid) is session:
+            del self.user_sessions[uid]
+            return uid
+        return None
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Sends a personal message to a WebSocket."""
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
         """Broadcasts a message to all active connections."""
-        for connection in self.active_connections:
+        for connection in list(self.sessions):
             await connection.send_text(message)
 
     async def send_packet(self, websocket: WebSocket, cmd_id: int, payload: bytes):
-        """Sends a serialized packet to the WebSocket."""
+        """Queues a serialized packet for the WebSocket, the connection's writer task sends it."""
         if cmd_id != 0:
             logger.info(f"Sending packet: cmd_id={cmd_id}")
         
-        packet = packet_pb2.Packet(cmd_id=cmd_id, payload=payload)
-        serialized_packet = packet.SerializeToString()
+        session = self.sessions.get(websocket)
+        if session is None:
+            print(f"No session for WebSocket: {websocket}")
+            return
+        self._send_to_session(session, cmd_id, payload)
 
-        # Send the serialized packet
-        await websocket.send_bytes(serialized_packet)
+    def _send_to_session(self, session: Session, cmd_id: int, payload: bytes):
+        packet = packet_pb2.Packet(cmd_id=cmd_id, payload=payload)
+        session.send_frame(packet.SerializeToString())
+
+    def _send_frame_to_user(self, uid: int, frame: bytes) -> bool:
+        """Queues the frame on the user's connection. While the user can still resume, the frame is
+        only buffered for replay. Returns True if it was queued on a connection."""
+        session = self.user_sessions.get(uid)
+        if session:
+            return session.send_frame(frame)
+        state = self.resume_states.get(uid)
+        if state is not None and not state.is_expired():
+            state.number(frame)
+        return False
+
+    def get_network_stats(self) -> dict:
+        """Outbound queue counters, for monitoring slow clients."""
+        queues = [session.outbound_queue for session in self.sessions.values()]
+        depths = [q.depth() for q in queues]
+        inbound_queues = [session.inbound_queue for session in self.sessions.values()]
+        return {
+            "connections": len(self.sessions),
+            "users": len(self.user_sessions),
+            "queued_frames": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "backed_up_connections": sum(1 for q in queues if q.backed_up_since),
+            "dropped_frames": sum(q.dropped_count for q in queues),
+            "batching_connections": sum(1 for q in queues if q.batching),
+            "batched_frames": sum(q.batch_count for q in queues),
+            "inbound_queued_packets": sum(q.depth() for q in inbound_queues),
+            "inbound_max_lag": max((q.max_lag for q in inbound_queues), default=0),
+            "inbound_last_lag_max": max((q.last_lag for q in inbound_queues), default=0),
+            "inbound_dropped_packets": sum(q.dropped_count for q in inbound_queues),
+            "inbound_paused_sessions": sum(1 for q in inbound_queues if q.is_paused()),
+            "inbound_max_pause": max((q.max_pause for q in inbound_queues), default=0),
+            "heartbeat": self.heartbeat.get_stats(),
+            "rate_limit": rate_limiter.get_stats(),
+            "resumable_users": len(self.resume_states),
+        }
 
     def _authenticate_user(self):
         return True
 
-    async def handle_received_packet(self, websocket: WebSocket, raw_data: bytes):
+    async def _process_packet(self, session: Session, packet):
         """Handles incoming packets and responds accordingly."""
+        websocket = session.websocket
         try:
-            packet = packet_pb2.Packet()
-            packet.ParseFromString(raw_data)
             cmd_id = packet.cmd_id
             payload = packet.payload
             token = packet.token
             if cmd_id != 0:
                 logger.info(f"Packet received: cmd_id={cmd_id}")
 
-            if cmd_id == CMD_PING_PONG:
-                if websocket not in self.ping_responses:
-                    print(f"Received pong from untracked WebSocket: {websocket}")
-                    return
-                self.ping_responses[websocket] += 1  # Increment pong counter
-            elif cmd_id == CMD_CREATE_GUEST_ACCOUNT:
-                if websocket in self.guest_create_times:
-                    last_create_time = self.guest_create_times[websocket]
-                    if last_create_time + 300 > int(time.time()): # 5 minutes
-                        print(f"Guest account creation too fast. Disconnecting WebSocket: {websocket}")
-                        return
-                self.guest_create_times[websocket] = int(time.time())
+            if cmd_id == CMD_CREATE_GUEST_ACCOUNT:
                 guest_id = await game_vars.get_guest_mgr().create_guest_account()
                 guest_account = packet_pb2.GuestAccount()
                 guest_account.guest_id = guest_id
                 p = guest_account.SerializeToString()
                 await self.send_packet(websocket, CMD_CREATE_GUEST_ACCOUNT, p)
+            elif cmd_id == CMD_RESUME_SESSION:
+                await self._handle_resume_session(session, payload)
             elif cmd_id == CMD_LOGIN_FIREBASE:
                 await self._handle_login_firebase(websocket, payload)   
             elif cmd_id == CMD_LOGIN:
@@ -215,10 +280,10 @@ class ConnectionManager:
                     logger.info("User inactive") # removed, or banned, disabled
                     return
                 # Check if user is already logged in, if so, disconnect the old connection
-                old_websocket = self.user_websockets.get(uid)
-                if old_websocket:
+                old_session = self.user_sessions.get(uid)
+                if old_session and old_session is not session:
                     print(f"User with ID {uid} is already logged in. Disconnecting old connection.")
-                
+                    old_websocket = old_session.websocket
                     if old_websocket.application_state == WebSocketState.CONNECTED:
                         await old_websocket.close()
 
@@ -228,29 +293,44 @@ class ConnectionManager:
                 login_response.uid = uid
                 login_response.error = LOGIN_ERROR_SUCCESS
 
+                # full login, packets are numbered from 1 again
+                resume_state = ResumeState(uid)
+                self.resume_states[uid] = resume_state
+                login_response.resume_token = resume_state.token
+
                 p = login_response.SerializeToString()
 
-                self.user_websockets[uid] = websocket
+                self._bind_user(session, uid)
+                session.resume = resume_state
+                # old clients leave the flag unset and keep getting one packet per frame
+                session.outbound_queue.batching = settings.ENABLE_PACKET_BATCH and login_client_pkg.support_packet_batch
                 await self.send_packet(websocket, CMD_LOGIN, p)
                 await game_vars.get_game_client().user_login_success(uid=uid, device_model=device_model, platform=platform, device_country=device_country,
                                                                      app_version_code=app_version_code)
             else:
-                if not token:
-                    logger.info("Unauthorized")
-                    return
+                # The login was verified once and cached on the session, packets from a logged in
+                # socket are authorized by the socket itself, the token is not needed anymore
+                if not session.is_authenticated():
+                    if not token or session.uid is None:
+                        logger.info("Unauthorized")
+                        return
+
+                    # login expired, accept a still valid session token to extend it
+                    user = verify_token(token)
+                    if not user:
+                        logger.info("Unauthorized")
+                        return
+
+                    # Prevent user play game from multiple devices
+                    if session.uid != user.get("uid"):
+                        print("Not allow user play game from multiple devices")
+                        return
+                    session.auth_expires_at = float(user.get("exp", 0))
+                    if not session.is_authenticated():
+                        logger.info("Unauthorized")
+                        return
+                uid = session.uid
 
-                user = verify_token(token)
-                if not user:
-                    logger.info("Unauthorized")
-                    return
-                
-                # Prevent user play game from multiple devices
-                if self.user_websockets.get(user.get("uid")) != websocket:
-                    print("Not allow user play game from multiple devices")
-                    return
-                print(f"User: {user}")
-                uid = user.get("uid")
-                
                 await game_vars.get_game_client().on_receive_packet(uid=uid, cmd_id=cmd_id, payload=payload)
         except Exception as e:
             logger.info(f"Failed to parse packet: {e}")
@@ -260,38 +340,75 @@ class ConnectionManager:
 
     async def send_packet_to_user(self, uid: int, cmd_id: int, payload: bytes):
         try:
-            websocket_ref = self.user_websockets.get(uid)
-            if websocket_ref:
-                # check active, other wise remove from user_websockets
-                if websocket_ref not in self.active_connections:
-                    print(f"User with ID {uid} has no active WebSocket connection")
-                    del self.user_websockets[uid]
-                    return
-                await self.send_packet(websocket_ref, cmd_id, payload)
-            else:
+            frame = packet_pb2.Packet(cmd_id=cmd_id, payload=payload).SerializeToString()
+            if not self._send_frame_to_user(uid, frame):
                 print(f"User with ID {uid} not has no active WebSocket connection")
         except Exception as e:
             print(f"Error: {e}")
 
     async def user_logout(self, uid: int):
-        # remove from user_websockets
-        if uid in self.user_websockets:
-            del self.user_websockets[uid]
+        # remove from user_sessions, the connection stays open but is no longer logged in
+        self.resume_states.pop(uid, None)
+        session = self.user_sessions.get(uid)
+        if session:
+            self._unbind_user(session)
 
     def check_user_active_online(self, uid: int):
-        is_active = False
-        if uid in self.user_websockets:
-            ws = self.user_websockets[uid]
-            if ws in self.active_connections:
-                is_active = True
-        return is_active
+        return uid in self.user_sessions
     
+    def get_online_count(self) -> int:
+        return len(self.user_sessions)
+
     def get_random_user_online(self, size: int) -> list[int]:
-        users = list(self.user_websockets.keys())
+        users = list(self.user_sessions.keys())
         if len(users) <= size:
             return users
         return random.sample(users, size)  # Randomly select `size` users
             
+    async def _handle_resume_session(self, session: Session, payload: bytes):
+        """Rebinds a reconnected client to its user and replays the packets it missed, instead of a full login."""
+        resume_pkg = packet_pb2.ResumeSession()
+        resume_pkg.ParseFromString(payload)
+        uid = resume_pkg.uid
+        response = packet_pb2.ResumeSessionResponse()
+
+        state = self.resume_states.get(uid)
+        if state is None or not state.check_token(resume_pkg.resume_token) or state.is_expired():
+            response.error = RESUME_ERROR_INVALID
+        elif not state.can_replay_from(resume_pkg.last_seq):
+            response.error = RESUME_ERROR_TOO_OLD
+        else:
+            user = await users_info_mgr.get_user_info(uid)
+            if not user or not user.is_active:
+                response.error = RESUME_ERROR_INVALID
+        if response.error != RESUME_ERROR_SUCCESS:
+            logger.info(f"Resume failed: uid={uid}, error={response.error}")
+            self._send_to_session(session, CMD_RESUME_SESSION, response.SerializeToString())
+            return
+
+        old_session = self.user_sessions.get(uid)
+        if old_session and old_session is not session:
+            print(f"User with ID {uid} resumed on a new connection. Disconnecting old connection.")
+            self._unbind_user(old_session)
+            old_websocket = old_session.websocket
+            if old_websocket.application_state == WebSocketState.CONNECTED:
+                await old_websocket.close()
+
+        self._bind_user(session, uid)
+        state.disconnected_at = 0.0
+        session.resume = state
+        session.outbound_queue.batching = settings.ENABLE_PACKET_BATCH and resume_pkg.support_packet_batch
+
+        response.error = RESUME_ERROR_SUCCESS
+        response.token = create_session_token({"uid": uid, "active": True})
+        response_frame = packet_pb2.Packet(cmd_id=CMD_RESUME_SESSION, payload=response.SerializeToString()).SerializeToString()
+        session.send_frame(response_frame, sequenced=False)
+        missed = state.frames_after(resume_pkg.last_seq)
+        for frame in missed:
+            session.send_frame(frame, sequenced=False)
+        logger.info(f"Session resumed: uid={uid}, replayed {len(missed)} packets")
+        await game_vars.get_game_mgr().on_user_resume(uid)
+
     async def _handle_login_firebase(self, websocket, payload):
         login_firebase_pkg = packet_pb2.LoginFirebase()
         login_firebase_pkg.ParseFromString(payload)
@@ -326,13 +443,26 @@ class ConnectionManager:
         p = login_response.SerializeToString()
         await self.send_packet(websocket, CMD_LOGIN_FIREBASE, p)   
 
+    def broadcast_packet_to_users(self, uids, cmd_id: int, payload: bytes, ignore_uids=()) -> int:
+        """Sends one packet to many users. The frame is built once and the same bytes are queued on
+        every recipient's connection, their writer tasks send it concurrently. Returns the number of
+        connections it was queued on."""
+        frame = packet_pb2.Packet(cmd_id=cmd_id, payload=payload).SerializeToString()
+        count = 0
+        for uid in uids:
+            if uid in ignore_uids:
+                continue
+            if self._send_frame_to_user(uid, frame):
+                count += 1
+        return count
+
     async def admin_broadcast(self, message: str):
         # sent to all users
         pkg = packet_pb2.AdminBroadcast()
         pkg.mes = message
-        for uid, ws in self.user_websockets.items():
-            await self.send_packet_to_user(uid, CMDs.ADMIN_BROADCAST, pkg.SerializeToString())
-            
+        count = self.broadcast_packet_to_users(list(self.user_sessions), CMDs.ADMIN_BROADCAST, pkg.SerializeToString())
+        logger.info(f"Admin broadcast queued for {count} users")
+
 
 # Instantiate the ConnectionManager for usage
 connection_manager = ConnectionManager()
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import traceback
+
+from src.base.network.session import Session
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("heartbeat")  # Name your logger
+
+
+class HeartbeatScheduler:
+    """Hashed timer wheel that pings every connection from one task.
+
+    The wheel has one slot per tick and turns once per ping interval, so a session stays in the
+    slot it was added to and is swept exactly once per interval. Removing a session is O(1).
+    """
+    def __init__(self, interval: float, max_missed: int, ping_frame: bytes, on_timeout, tick: float = 1.0):
+        self.tick = tick
+        self.max_missed = max_missed
+        self.ping_frame = ping_frame  # pre-serialized ping packet, shared by all sessions
+        self.on_timeout = on_timeout  # called with the session once it missed max_missed pings
+        self.slots: list[set[Session]] = [set() for _ in range(max(1, int(round(interval / tick))))]
+        self.cursor = 0  # next slot to sweep
+        self._task: asyncio.Task = None
+
+    def add(self, session: Session):
+        """Pings the session now and schedules the next check one interval later."""
+        self._ensure_started()
+        slot = (self.cursor - 1) % len(self.slots)  # the slot swept last, comes around again in one interval
+        session.wheel_slot = slot
+        session.pong_count = 0
+        session.missed_pings = 0
+        self.slots[slot].add(session)
+        self._ping(session)
+
+    def remove(self, session: Session):
+        if session.wheel_slot >= 0:
+            self.slots[session.wheel_slot].discard(session)
+            session.wheel_slot = -1
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _ping(self, session: Session):
+        session.send_frame(self.ping_frame, sequenced=False)
+        session.missed_pings += 1
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while True:
+                self._sweep(self.slots[self.cursor])
+                self.cursor = (self.cursor + 1) % len(self.slots)
+                next_tick += self.tick
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        except asyncio.CancelledError:
+            logger.info("Heartbeat scheduler has been stopped.")
+
+    def _sweep(self, slot: set[Session]):
+        for session in list(slot):
+            try:
+                if session.pong_count > 0 or session.inbound_queue.is_paused():
+                    # pong received since the last sweep, or the pong is unread: the reader waits
+                    # for the client's own packets to be handled
+                    session.pong_count = 0
+                    session.missed_pings = 0
+                elif session.missed_pings >= self.max_missed:
+                    print(f"Max retries for ping reached. Disconnecting WebSocket: {session.websocket}.")
+                    self.remove(session)
+                    self.on_timeout(session)
+                    continue
+                self._ping(session)
+            except Exception as e:
+                print(f"Error during ping: {e}")
+                traceback.print_exc()
+
+    def get_stats(self) -> dict:
+        return {
+            "sessions": sum(len(slot) for slot in self.slots),
+            "slots": len(self.slots),
+        }
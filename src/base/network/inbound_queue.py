@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+import traceback
+
+from src.config.settings import settings
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("inbound_queue")  # Name your logger
+
+OVERFLOW_DROP = "drop"              # drop the new packet
+OVERFLOW_DISCONNECT = "disconnect"  # close the connection
+OVERFLOW_PAUSE = "pause"            # stop reading the socket until the worker catches up
+
+
+class InboundQueue:
+    """Bounded queue of received packets for one connection, processed in order by a single worker task.
+
+    Two packets from the same client are never handled concurrently, and a flooding client can only
+    hold max_pending packets in memory.
+    """
+    def __init__(self, handler, max_pending: int = None, policy: str = None):
+        self.handler = handler  # async callable, receives one packet
+        self.max_pending = int(max_pending or settings.RECV_QUEUE_MAX_PENDING)
+        self.policy = policy or settings.RECV_QUEUE_POLICY
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+        self.task: asyncio.Task = None
+        self.closed = False
+        self._closed_event = asyncio.Event()  # wakes a reader paused on a full queue
+        self.paused_since: float = None  # monotonic time the reader paused, None while reading
+        self._backlog_since: float = None  # start of the last pause, the next packet waited since then
+
+        # metrics
+        self.processed_count = 0
+        self.dropped_count = 0
+        self.last_lag = 0.0  # seconds between receive and the start of processing, pauses included
+        self.max_lag = 0.0
+        self.paused_seconds = 0.0  # time the reader spent waiting on a full queue
+        self.max_pause = 0.0
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._worker())
+
+    def close(self):
+        self.closed = True
+        self._closed_event.set()
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+        self.task = None
+
+    def is_paused(self) -> bool:
+        """True while the reader waits for room in the queue, it reads nothing then, not even pongs."""
+        return self.paused_since is not None
+
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    async def put(self, packet) -> bool:
+        """Queues a packet. Returns False if it was rejected because the queue is full, or the
+        queue was closed while the reader was paused."""
+        if self.closed:
+            return False
+        received_at = time.monotonic()
+        if self._backlog_since is not None:
+            # the packet sat in the socket while the reader was paused
+            received_at = self._backlog_since
+            self._backlog_since = None
+        item = (received_at, packet)
+        if self.policy == OVERFLOW_PAUSE:
+            if not self.queue.full():
+                self.queue.put_nowait(item)
+                return True
+            return await self._put_paused(item)
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            return False
+
+    async def _put_paused(self, item) -> bool:
+        self.paused_since = time.monotonic()
+        put = asyncio.ensure_future(self.queue.put(item))
+        closed = asyncio.ensure_future(self._closed_event.wait())
+        try:
+            await asyncio.wait([put, closed], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            closed.cancel()
+            if not put.done():
+                put.cancel()
+            pause = time.monotonic() - self.paused_since
+            self.paused_seconds += pause
+            if pause > self.max_pause:
+                self.max_pause = pause
+            self._backlog_since = self.paused_since
+            self.paused_since = None
+        return put.done() and not put.cancelled()
+
+    async def _worker(self):
+        try:
+            while True:
+                received_at, packet = await self.queue.get()
+                lag = time.monotonic() - received_at
+                self.last_lag = lag
+                if lag > self.max_lag:
+                    self.max_lag = lag
+                try:
+                    await self.handler(packet)
+                except Exception as e:
+                    logger.info(f"Error handling packet: {e}")
+                    traceback.print_exc()
+                self.processed_count += 1
+        except asyncio.CancelledError:
+            pass
+
+    def get_stats(self) -> dict:
+        return {
+            "depth": self.queue.qsize(),
+            "processed": self.processed_count,
+            "dropped": self.dropped_count,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "paused": self.is_paused(),
+            "paused_seconds": self.paused_seconds,
+            "max_pause": self.max_pause,
+        }
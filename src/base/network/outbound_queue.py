@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from fastapi import WebSocket
+
+from src.base.network.packets import packet_pb2
+from src.config.settings import settings
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("outbound_queue")  # Name your logger
+
+POLICY_DROP = "drop"    # drop new frames while the client is backed up
+POLICY_CLOSE = "close"  # close the connection as soon as the client is backed up
+
+CMD_PACKET_BATCH = 6  # Packet whose payload is a PacketBatch
+
+
+class OutboundQueue:
+    """Bounded queue of serialized frames for one WebSocket, drained by its own writer task.
+
+    Senders only enqueue bytes, so a slow client never stalls the coroutine that sends to it.
+    """
+    def __init__(self, websocket: WebSocket, high_water: int = None, policy: str = None, backlog_timeout: float = None):
+        self.websocket = websocket
+        self.high_water = int(high_water or settings.SEND_QUEUE_HIGH_WATER)
+        self.policy = policy or settings.SEND_QUEUE_POLICY
+        self.backlog_timeout = float(backlog_timeout or settings.SEND_QUEUE_BACKLOG_TIMEOUT)
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.task: asyncio.Task = None
+        self.closed = False
+        self.backed_up_since = 0.0  # monotonic time the queue first hit high water, 0 if not backed up
+        self.batching = False  # set once the client said it reads PacketBatch frames
+        self.batch_window = int(settings.PACKET_BATCH_WINDOW_MS) / 1000
+        self.batch_max_frames = int(settings.PACKET_BATCH_MAX_FRAMES)
+
+        # counters
+        self.sent_count = 0
+        self.batch_count = 0  # websocket frames that carried a PacketBatch
+        self.dropped_count = 0
+        self.max_depth = 0
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._writer())
+
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    def put(self, frame: bytes) -> bool:
+        """Enqueues a frame without waiting. Returns False if the frame was dropped."""
+        if self.closed:
+            return False
+
+        depth = self.queue.qsize()
+        if depth >= self.high_water:
+            now = time.monotonic()
+            if not self.backed_up_since:
+                self.backed_up_since = now
+            self.dropped_count += 1
+            if self.policy == POLICY_CLOSE or now - self.backed_up_since > self.backlog_timeout:
+                logger.warning(f"Outbound queue backed up ({depth} frames), closing WebSocket: {self.websocket}")
+                self.close(close_socket=True)
+            return False
+
+        self.backed_up_since = 0.0
+        self.queue.put_nowait(frame)
+        if depth + 1 > self.max_depth:
+            self.max_depth = depth + 1
+        return True
+
+    def close(self, close_socket=False):
+        """Stops the writer task, pending frames are discarded."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+        if close_socket:
+            # the reader loop sees the close and runs the normal disconnect path
+            asyncio.create_task(self._close_socket())
+
+    async def _close_socket(self):
+        try:
+            await self.websocket.close()
+        except Exception as e:
+            logger.info(f"Error closing WebSocket: {e}")
+
+    async def _writer(self):
+        try:
+            while True:
+                frame = await self.queue.get()
+                if not self.batching:
+                    await self.websocket.send_bytes(frame)
+                    self.sent_count += 1
+                    continue
+
+                # let the frames sent right after this one pile up, then send them together
+                await asyncio.sleep(self.batch_window)
+                frames = [frame]
+                while len(frames) < self.batch_max_frames and not self.queue.empty():
+                    frames.append(self.queue.get_nowait())
+                if len(frames) == 1:
+                    await self.websocket.send_bytes(frame)
+                else:
+                    batch = packet_pb2.PacketBatch(packets=frames)
+                    packet = packet_pb2.Packet(cmd_id=CMD_PACKET_BATCH, payload=batch.SerializeToString())
+                    await self.websocket.send_bytes(packet.SerializeToString())
+                    self.batch_count += 1
+                self.sent_count += len(frames)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info(f"Writer stopped, error sending to WebSocket: {e}")
+            self.close(close_socket=True)
+
+    def get_stats(self) -> dict:
+        return {
+            "depth": self.queue.qsize(),
+            "max_depth": self.max_depth,
+            "sent": self.sent_count,
+            "batches": self.batch_count,
+            "dropped": self.dropped_count,
+        }
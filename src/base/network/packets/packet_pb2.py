@@ -2,7 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: src/base/network/packets/packet.proto
-# Protobuf Python Version: 5.28.1
+# Protobuf Python Version: 5.29.0
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
@@ -12,8 +12,8 @@ from google.protobuf.internal import builder as _builder
 _runtime_version.ValidateProtobufRuntimeVersion(
     _runtime_version.Domain.PUBLIC,
     5,
-    28,
-    1,
+    29,
+    0,
     '',
     'src/base/network/packets/packet.proto'
 )
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%src/base/network/packets/packet.proto\"\x07\n\x05\x45mpty\"8\n\x06Packet\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0e\n\x06\x63md_id\x18\x02 \x01(\x05\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"j\n\x0b\x43hatMessage\x12\x0b\n\x03\x61\x62\x63\x18\x01 \x01(\x01\x12\x10\n\x08username\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\x03\x12\x0c\n\x04gold\x18\x04 \x01(\x03\x12\x0c\n\x04\x61\x62\x63\x64\x18\x05 \x01(\t\x12\x11\n\tis_active\x18\x06 \x01(\x08\"\n\n\x08PingPong\"~\n\x05Login\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x65vice_model\x18\x03 \x01(\t\x12\x10\n\x08platform\x18\x04 \x01(\t\x12\x16\n\x0e\x64\x65vice_country\x18\x05 \x01(\t\x12\x18\n\x10\x61pp_version_code\x18\x06 \x01(\x05\"H\n\rLoginFirebase\x12\x10\n\x08sub_type\x18\x01 \x01(\x05\x12\x13\n\x0blogin_token\x18\x02 \x01(\t\x12\x10\n\x08guest_id\x18\x03 \x01(\t\"\x08\n\x06Logout\":\n\rLoginResponse\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\x05\"\xf2\x02\n\x08UserInfo\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04gold\x18\x03 \x01(\x03\x12\x0e\n\x06scores\x18\x04 \x03(\x05\x12\r\n\x05names\x18\x05 \x03(\t\x12\x0b\n\x03\x61\x62\x63\x18\x06 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x07 \x01(\t\x12\x1a\n\x12\x61vatar_third_party\x18\x08 \x01(\t\x12\r\n\x05level\x18\t \x01(\x05\x12\x13\n\x0bsupport_num\x18\n \x01(\x05\x12\x11\n\twin_count\x18\x0b \x01(\x05\x12\x12\n\ngame_count\x18\x0c \x01(\x05\x12\x0b\n\x03\x65xp\x18\r \x01(\x03\x12\x14\n\x0cstartup_gold\x18\x0e \x01(\x05\x12\x15\n\rhas_first_buy\x18\x0f \x01(\x08\x12\x15\n\rtime_show_ads\x18\x10 \x01(\x05\x12\x12\n\nlogin_type\x18\x11 \x01(\x05\x12\x17\n\x0ftime_ads_reward\x18\x12 \x01(\x05\x12\x1c\n\x14\x61\x64\x64_for_user_support\x18\x13 \x01(\x08\"\xde\x03\n\x08GameInfo\x12\x10\n\x08match_id\x18\x01 \x01(\x05\x12\x11\n\tgame_mode\x18\x02 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x03 \x01(\x05\x12\x0c\n\x04uids\x18\x04 \x03(\x05\x12\x12\n\nuser_golds\x18\x05 \x03(\x03\x12\x12\n\nuser_names\x18\x06 \x03(\t\x12\x15\n\rcards_compare\x18\x07 \x03(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x08 \x01(\x05\x12\x12\n\ngame_state\x18\t \x01(\x05\x12\x10\n\x08my_cards\x18\n \x03(\x05\x12\x14\n\x0cremain_cards\x18\x0b \x01(\x05\x12\x13\n\x0buser_points\x18\x0c \x03(\x05\x12\x10\n\x08team_ids\x18\r \x03(\x05\x12\x11\n\thand_suit\x18\x0e \x01(\x05\x12\x0f\n\x07\x61vatars\x18\x0f \x03(\t\x12\x1b\n\x13is_registered_leave\x18\x10 \x01(\x08\x12\x0b\n\x03\x62\x65t\x18\x11 \x01(\x05\x12\x11\n\tpot_value\x18\x12 \x01(\x03\x12\x15\n\rcurrent_round\x18\x13 \x01(\x05\x12\x15\n\rhand_in_round\x18\x14 \x01(\x05\x12\x14\n\x0cpoint_to_win\x18\x15 \x01(\x05\x12\x1c\n\x14\x65nable_bet_win_score\x18\x16 \x01(\x08\x12\x0f\n\x07is_vips\x18\x17 \x03(\x08\"#\n\x11RegisterLeaveGame\x12\x0e\n\x06status\x18\x01 \x01(\x05\"\x81\x01\n\x10NewUserJoinMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0bseat_server\x18\x04 \x01(\x05\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x06 \x01(\t\x12\x0e\n\x06is_vip\x18\x07 \x01(\x08\"-\n\x0eUserLeaveMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06reason\x18\x02 \x01(\x05\"/\n\x08\x44\x65\x61lCard\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\x12\x14\n\x0cremain_cards\x18\x02 \x01(\x05\"\xc0\x01\n\x08PlayCard\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07\x63\x61rd_id\x18\x02 \x01(\x05\x12\x0c\n\x04\x61uto\x18\x03 \x01(\x08\x12\x14\n\x0c\x63urrent_turn\x18\x04 \x01(\x05\x12\x11\n\thand_suit\x18\x05 \x01(\x05\x12\x13\n\x0bis_end_hand\x18\x06 \x01(\x08\x12\x0f\n\x07win_uid\x18\x07 \x01(\x05\x12\x11\n\twin_point\x18\x08 \x01(\x05\x12\x14\n\x0cis_end_round\x18\t \x01(\x08\x12\x10\n\x08win_card\x18\n \x01(\x05\"4\n\tStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\"1\n\x07NewHand\x12\x14\n\x0c\x63urrent_turn\x18\x01 \x01(\x05\x12\x10\n\x08my_cards\x18\x02 \x03(\x05\"!\n\x0fUpdateGamePoint\x12\x0e\n\x06points\x18\x01 \x03(\x05\"j\n\x07\x45ndHand\x12\x0f\n\x07win_uid\x18\x01 \x01(\x05\x12\x10\n\x08win_card\x18\x02 \x01(\x05\x12\x13\n\x0buser_points\x18\x03 \x03(\x05\x12\x11\n\twin_point\x18\x04 \x01(\x05\x12\x14\n\x0cis_end_round\x18\x05 \x01(\x08\"\x19\n\x08\x44rawCard\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\"\xf6\x01\n\x0bGeneralInfo\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\x1d\n\x15time_thinking_in_turn\x18\x02 \x01(\x05\x12\x16\n\x0etressette_bets\x18\x03 \x03(\x05\x12\x1a\n\x12\x62\x65t_multiplier_min\x18\x04 \x01(\x05\x12\x12\n\nexp_levels\x18\x05 \x03(\x05\x12\x17\n\x0f\x66\x65\x65_mode_no_bet\x18\x06 \x01(\x05\x12\x12\n\nenable_ads\x18\x07 \x01(\x08\x12\x1d\n\x15sette_mezzo_bet_scale\x18\x08 \x01(\x05\x12!\n\x19min_gold_play_sette_mezzo\x18\t \x01(\x05\"\xb6\x01\n\x07\x45ndGame\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\x13\n\x0bwin_team_id\x18\x05 \x01(\x05\x12\x13\n\x0bscore_cards\x18\x02 \x03(\x05\x12\x19\n\x11score_last_tricks\x18\x03 \x03(\x05\x12\x14\n\x0cscore_totals\x18\x04 \x03(\x05\x12\x14\n\x0cgold_changes\x18\x06 \x03(\x03\x12\x14\n\x0cplayers_gold\x18\x07 \x03(\x03\x12\x16\n\x0egold_win_score\x18\x08 \x01(\x03\"&\n\x10PrepareStartGame\x12\x12\n\ntime_start\x18\x01 \x01(\x05\"6\n\x11InGameChatMessage\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x14\n\x0c\x63hat_message\x18\x02 \x01(\t\"n\n\x14PaymentGoogleConsume\x12\x16\n\x0epurchase_token\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x0c\n\x04skus\x18\x03 \x03(\t\x12\x11\n\tsignature\x18\x04 \x01(\t\x12\x0b\n\x03sku\x18\x05 \x01(\t\"/\n\x0ePaymentSuccess\x12\x0c\n\x04gold\x18\x01 \x01(\x03\x12\x0f\n\x07pack_id\x18\x02 \x01(\t\"\x1b\n\x0bUpdateMoney\x12\x0c\n\x04gold\x18\x01 \x01(\x03\"\x91\x01\n\tTableList\x12\x11\n\ttable_ids\x18\x01 \x03(\x05\x12\x0c\n\x04\x62\x65ts\x18\x02 \x03(\x05\x12\x13\n\x0bnum_players\x18\x03 \x03(\x05\x12\x14\n\x0cplayer_modes\x18\x04 \x03(\x05\x12\x13\n\x0bplayer_uids\x18\x05 \x03(\x05\x12\x0f\n\x07\x61vatars\x18\x06 \x03(\t\x12\x12\n\ngame_modes\x18\x07 \x03(\x05\"\xf6\x01\n\nShopConfig\x12\x10\n\x08pack_ids\x18\x01 \x03(\t\x12\r\n\x05golds\x18\x02 \x03(\x03\x12\x0e\n\x06prices\x18\x03 \x03(\x01\x12\x12\n\ncurrencies\x18\x04 \x03(\t\x12\x13\n\x0bno_ads_days\x18\x05 \x03(\x05\x12\x18\n\x10gold_offer_first\x18\x06 \x01(\x05\x12\x1e\n\x16no_ads_day_offer_first\x18\x07 \x01(\x05\x12\x19\n\x11price_offer_first\x18\x08 \x01(\x05\x12\x1c\n\x14\x63urrency_offer_first\x18\t \x01(\t\x12\x1b\n\x13pack_id_offer_first\x18\n \x01(\t\" \n\x0cGuestAccount\x12\x10\n\x08guest_id\x18\x01 \x01(\t\"!\n\x0c\x43hangeAvatar\x12\x11\n\tavatar_id\x18\x01 \x01(\x05\"3\n\x12InGameChatEmoticon\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x10\n\x08\x65moticon\x18\x02 \x01(\x05\"\x1b\n\x0cSearchFriend\x12\x0b\n\x03uid\x18\x01 \x01(\x05\"\xb6\x01\n\x14SearchFriendResponse\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0e\n\x06\x61vatar\x18\x04 \x01(\t\x12\x11\n\twin_count\x18\x05 \x01(\x05\x12\x12\n\ngame_count\x18\x06 \x01(\x01\x12\r\n\x05\x65rror\x18\x07 \x01(\x05\x12\r\n\x05level\x18\x08 \x01(\x05\x12\x0b\n\x03\x65xp\x18\t \x01(\x03\x12\x13\n\x0bis_verified\x18\n \x01(\x08\"\x1d\n\rCheatGoldUser\x12\x0c\n\x04gold\x18\x01 \x01(\x03\"\x7f\n\nFriendList\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\x12\x0f\n\x07onlines\x18\x06 \x03(\x08\x12\x13\n\x0bis_playings\x18\x07 \x03(\x08\"p\n\x0e\x46riendRequests\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\x12\x11\n\tsent_uids\x18\x06 \x03(\x05\"\'\n\tAddFriend\x12\r\n\x05\x65rror\x18\x01 \x01(\x05\x12\x0b\n\x03uid\x18\x02 \x01(\x05\"2\n\x13RequestFriendAccept\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\x05\"\x1b\n\x0cRemoveFriend\x12\x0b\n\x03uid\x18\x01 \x01(\x05\"Z\n\x10NewFriendRequest\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\x05\x12\x0c\n\x04gold\x18\x05 \x01(\x03\"_\n\x15\x46riendRequestAccepted\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06\x61vatar\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\x05\x12\x0c\n\x04gold\x18\x05 \x01(\x03\"_\n\x10RecommendFriends\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\"<\n\x13PaymentAppleConsume\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\x12\x14\n\x0creceipt_data\x18\x02 \x01(\t\"2\n\x1fPaymentFinishedAppleTransaction\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\"J\n\x08NewRound\x12\x15\n\rcurrent_round\x18\x01 \x01(\x05\x12\x11\n\tpot_value\x18\x02 \x01(\x03\x12\x14\n\x0cplayers_gold\x18\x03 \x03(\x03\"i\n\x0b\x43reateTable\x12\x0b\n\x03\x62\x65t\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x02 \x01(\x05\x12\x12\n\nis_private\x18\x03 \x01(\x08\x12\x12\n\npoint_mode\x18\x04 \x01(\x05\x12\x10\n\x08\x62\x65t_mode\x18\x05 \x01(\x08\"!\n\rJoinTableById\x12\x10\n\x08match_id\x18\x01 \x01(\x05\"\"\n\x11JoinTableResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\x05\"&\n\x0c\x43laimSupport\x12\x16\n\x0esupport_amount\x18\x01 \x01(\x05\"\xf1\x01\n\x0e\x41ppCodeVersion\x12\x17\n\x0f\x61ndroid_version\x18\x01 \x01(\x05\x12%\n\x1d\x61ndroid_forced_update_version\x18\x02 \x01(\x05\x12%\n\x1d\x61ndroid_remind_update_version\x18\x03 \x01(\x05\x12\x13\n\x0bios_version\x18\x04 \x01(\x05\x12!\n\x19ios_forced_update_version\x18\x05 \x01(\x05\x12!\n\x19ios_remind_update_version\x18\x06 \x01(\x05\x12\x1d\n\x15ios_reviewing_version\x18\x07 \x01(\x05\"\"\n\x10PlayCardResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\"!\n\x10\x43heatViewCardBot\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\"0\n\x10InviteFriendPlay\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07room_id\x18\x02 \x01(\x05\"A\n\x10GameActionNapoli\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x11\n\tpoint_add\x18\x02 \x01(\x05\x12\r\n\x05suits\x18\x03 \x03(\x05\"D\n\x15\x43ustomerServiceReport\x12\x13\n\x0breport_type\x18\x01 \x01(\x05\x12\x16\n\x0ereport_content\x18\x02 \x01(\t\"\x1d\n\x0e\x41\x64minBroadcast\x12\x0b\n\x03mes\x18\x01 \x01(\t\",\n\x19PaymentPaypalRequestOrder\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\"\'\n\x12PaymentPaypalOrder\x12\x11\n\torder_url\x18\x01 \x01(\t\"\x0b\n\tQuickPlay\"{\n\x1aSetteMezzoNewUserJoinMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0bseat_server\x18\x04 \x01(\x05\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x06 \x01(\t\"E\n\x1aSetteMezzoPrepareStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\"\xfc\x03\n\x12SetteMezzoGameInfo\x12\x10\n\x08match_id\x18\x01 \x01(\x05\x12\x11\n\tgame_mode\x18\x02 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x03 \x01(\x05\x12\x0c\n\x04uids\x18\x04 \x03(\x05\x12\x12\n\nuser_golds\x18\x05 \x03(\x03\x12\x12\n\nuser_names\x18\x06 \x03(\t\x12\x12\n\nbanker_uid\x18\x07 \x01(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x08 \x01(\x05\x12\x12\n\ngame_state\x18\t \x01(\x05\x12\x13\n\x0buser_points\x18\x0b \x03(\x05\x12\x10\n\x08team_ids\x18\x0c \x03(\x05\x12\x11\n\thand_suit\x18\r \x01(\x05\x12\x0f\n\x07\x61vatars\x18\x0e \x03(\t\x12\x1b\n\x13is_registered_leave\x18\x0f \x01(\x08\x12\x0b\n\x03\x62\x65t\x18\x10 \x01(\x05\x12\x11\n\tpot_value\x18\x11 \x01(\x03\x12\x15\n\rcurrent_round\x18\x12 \x01(\x05\x12\x15\n\rhand_in_round\x18\x13 \x01(\x05\x12\x13\n\x0bis_in_games\x18\x14 \x03(\x08\x12\x16\n\x0eplay_turn_time\x18\x15 \x01(\x05\x12\x14\n\x0cplayer_infos\x18\x16 \x03(\x0c\x12\x14\n\x0c\x62\x61nker_cards\x18\x17 \x03(\x05\x12\x13\n\x0bplayer_bets\x18\x18 \x03(\x03\x12\x14\n\x0ctime_end_bet\x18\x19 \x01(\x05\"(\n\x14SetteMezzoPlayerInfo\x12\x10\n\x08\x63\x61rd_ids\x18\x01 \x03(\x05\"\x15\n\x13SetteMezzoQuickPlay\"[\n\x13SetteMezzoStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\x12\x0c\n\x04uids\x18\x03 \x03(\x05\x12\r\n\x05\x63\x61rds\x18\x04 \x03(\x05\"\xb8\x01\n\x0bRankingInfo\x12\x11\n\tseason_id\x18\x01 \x01(\x05\x12\x12\n\ntime_start\x18\x02 \x01(\x05\x12\x10\n\x08time_end\x18\x03 \x01(\x05\x12\x0f\n\x07rewards\x18\x04 \x03(\x05\x12\x0c\n\x04uids\x18\x05 \x03(\x05\x12\x0f\n\x07\x61vatars\x18\x06 \x03(\t\x12\r\n\x05names\x18\x07 \x03(\t\x12\x0e\n\x06scores\x18\x08 \x03(\x05\x12\x0f\n\x07my_rank\x18\t \x01(\x05\x12\x10\n\x08my_score\x18\n \x01(\x05\"E\n\rRankingResult\x12\x11\n\tseason_id\x18\x01 \x01(\x05\x12\x13\n\x0bgold_reward\x18\x02 \x01(\x05\x12\x0c\n\x04rank\x18\x03 \x01(\x05\"\'\n\x12RankingClaimReward\x12\x11\n\tseason_id\x18\x01 \x01(\x05\"\"\n\tUpdateAds\x12\x15\n\rtime_show_ads\x18\x01 \x01(\x05\"2\n\tAdsReward\x12\x0c\n\x04gold\x18\x01 \x01(\x05\x12\x17\n\x0ftime_ads_reward\x18\x02 \x01(\x05\"\x1e\n\x0e\x43hangeUserName\x12\x0c\n\x04name\x18\x01 \x01(\t\"3\n\x13SetteMezzoActionHit\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07\x63\x61rd_id\x18\x02 \x01(\x05\"D\n\x14SetteMezzoUpdateTurn\x12\x14\n\x0c\x63urrent_turn\x18\x01 \x01(\x05\x12\x16\n\x0eplay_turn_time\x18\x02 \x01(\x05\"R\n\x15SetteMezzoActionStand\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x02 \x01(\x05\x12\x16\n\x0eplay_turn_time\x18\x03 \x01(\x05\"n\n\x11SetteMezzoEndGame\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x0f\n\x07is_wins\x18\x03 \x03(\x08\x12\x14\n\x0cgolds_change\x18\x04 \x03(\x03\x12\x14\n\x0cplayer_golds\x18\x05 \x03(\x03\"+\n\x18SetteMezzoShowBankerCard\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\"?\n\x11SetteMezzoBetting\x12\x14\n\x0ctime_end_bet\x18\x01 \x01(\x05\x12\x14\n\x0cplaying_uids\x18\x02 \x03(\x05\"-\n\x11SetteMezzoUserBet\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0b\n\x03\x62\x65t\x18\x02 \x01(\x03\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%src/base/network/packets/packet.proto\"\x07\n\x05\x45mpty\"E\n\x06Packet\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0e\n\x06\x63md_id\x18\x02 \x01(\x05\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12\x0b\n\x03seq\x18\x04 \x01(\x05\"\x1e\n\x0bPacketBatch\x12\x0f\n\x07packets\x18\x01 \x03(\x0c\"j\n\x0b\x43hatMessage\x12\x0b\n\x03\x61\x62\x63\x18\x01 \x01(\x01\x12\x10\n\x08username\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\x03\x12\x0c\n\x04gold\x18\x04 \x01(\x03\x12\x0c\n\x04\x61\x62\x63\x64\x18\x05 \x01(\t\x12\x11\n\tis_active\x18\x06 \x01(\x08\"\n\n\x08PingPong\"\x9c\x01\n\x05Login\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x65vice_model\x18\x03 \x01(\t\x12\x10\n\x08platform\x18\x04 \x01(\t\x12\x16\n\x0e\x64\x65vice_country\x18\x05 \x01(\t\x12\x18\n\x10\x61pp_version_code\x18\x06 \x01(\x05\x12\x1c\n\x14support_packet_batch\x18\x07 \x01(\x08\"H\n\rLoginFirebase\x12\x10\n\x08sub_type\x18\x01 \x01(\x05\x12\x13\n\x0blogin_token\x18\x02 \x01(\t\x12\x10\n\x08guest_id\x18\x03 \x01(\t\"\x08\n\x06Logout\"P\n\rLoginResponse\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\x05\x12\x14\n\x0cresume_token\x18\x04 \x01(\t\"b\n\rResumeSession\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x14\n\x0cresume_token\x18\x02 \x01(\t\x12\x10\n\x08last_seq\x18\x03 \x01(\x05\x12\x1c\n\x14support_packet_batch\x18\x04 \x01(\x08\"5\n\x15ResumeSessionResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\t\"\xf2\x02\n\x08UserInfo\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04gold\x18\x03 \x01(\x03\x12\x0e\n\x06scores\x18\x04 \x03(\x05\x12\r\n\x05names\x18\x05 \x03(\t\x12\x0b\n\x03\x61\x62\x63\x18\x06 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x07 \x01(\t\x12\x1a\n\x12\x61vatar_third_party\x18\x08 \x01(\t\x12\r\n\x05level\x18\t \x01(\x05\x12\x13\n\x0bsupport_num\x18\n \x01(\x05\x12\x11\n\twin_count\x18\x0b \x01(\x05\x12\x12\n\ngame_count\x18\x0c \x01(\x05\x12\x0b\n\x03\x65xp\x18\r \x01(\x03\x12\x14\n\x0cstartup_gold\x18\x0e \x01(\x05\x12\x15\n\rhas_first_buy\x18\x0f \x01(\x08\x12\x15\n\rtime_show_ads\x18\x10 \x01(\x05\x12\x12\n\nlogin_type\x18\x11 \x01(\x05\x12\x17\n\x0ftime_ads_reward\x18\x12 \x01(\x05\x12\x1c\n\x14\x61\x64\x64_for_user_support\x18\x13 \x01(\x08\"\xde\x03\n\x08GameInfo\x12\x10\n\x08match_id\x18\x01 \x01(\x05\x12\x11\n\tgame_mode\x18\x02 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x03 \x01(\x05\x12\x0c\n\x04uids\x18\x04 \x03(\x05\x12\x12\n\nuser_golds\x18\x05 \x03(\x03\x12\x12\n\nuser_names\x18\x06 \x03(\t\x12\x15\n\rcards_compare\x18\x07 \x03(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x08 \x01(\x05\x12\x12\n\ngame_state\x18\t \x01(\x05\x12\x10\n\x08my_cards\x18\n \x03(\x05\x12\x14\n\x0cremain_cards\x18\x0b \x01(\x05\x12\x13\n\x0buser_points\x18\x0c \x03(\x05\x12\x10\n\x08team_ids\x18\r \x03(\x05\x12\x11\n\thand_suit\x18\x0e \x01(\x05\x12\x0f\n\x07\x61vatars\x18\x0f \x03(\t\x12\x1b\n\x13is_registered_leave\x18\x10 \x01(\x08\x12\x0b\n\x03\x62\x65t\x18\x11 \x01(\x05\x12\x11\n\tpot_value\x18\x12 \x01(\x03\x12\x15\n\rcurrent_round\x18\x13 \x01(\x05\x12\x15\n\rhand_in_round\x18\x14 \x01(\x05\x12\x14\n\x0cpoint_to_win\x18\x15 \x01(\x05\x12\x1c\n\x14\x65nable_bet_win_score\x18\x16 \x01(\x08\x12\x0f\n\x07is_vips\x18\x17 \x03(\x08\"#\n\x11RegisterLeaveGame\x12\x0e\n\x06status\x18\x01 \x01(\x05\"\x81\x01\n\x10NewUserJoinMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0bseat_server\x18\x04 \x01(\x05\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x06 \x01(\t\x12\x0e\n\x06is_vip\x18\x07 \x01(\x08\"-\n\x0eUserLeaveMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06reason\x18\x02 \x01(\x05\"/\n\x08\x44\x65\x61lCard\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\x12\x14\n\x0cremain_cards\x18\x02 \x01(\x05\"\xc0\x01\n\x08PlayCard\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07\x63\x61rd_id\x18\x02 \x01(\x05\x12\x0c\n\x04\x61uto\x18\x03 \x01(\x08\x12\x14\n\x0c\x63urrent_turn\x18\x04 \x01(\x05\x12\x11\n\thand_suit\x18\x05 \x01(\x05\x12\x13\n\x0bis_end_hand\x18\x06 \x01(\x08\x12\x0f\n\x07win_uid\x18\x07 \x01(\x05\x12\x11\n\twin_point\x18\x08 \x01(\x05\x12\x14\n\x0cis_end_round\x18\t \x01(\x08\x12\x10\n\x08win_card\x18\n \x01(\x05\"4\n\tStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\"1\n\x07NewHand\x12\x14\n\x0c\x63urrent_turn\x18\x01 \x01(\x05\x12\x10\n\x08my_cards\x18\x02 \x03(\x05\"!\n\x0fUpdateGamePoint\x12\x0e\n\x06points\x18\x01 \x03(\x05\"j\n\x07\x45ndHand\x12\x0f\n\x07win_uid\x18\x01 \x01(\x05\x12\x10\n\x08win_card\x18\x02 \x01(\x05\x12\x13\n\x0buser_points\x18\x03 \x03(\x05\x12\x11\n\twin_point\x18\x04 \x01(\x05\x12\x14\n\x0cis_end_round\x18\x05 \x01(\x08\"\x19\n\x08\x44rawCard\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\"\xf6\x01\n\x0bGeneralInfo\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\x1d\n\x15time_thinking_in_turn\x18\x02 \x01(\x05\x12\x16\n\x0etressette_bets\x18\x03 \x03(\x05\x12\x1a\n\x12\x62\x65t_multiplier_min\x18\x04 \x01(\x05\x12\x12\n\nexp_levels\x18\x05 \x03(\x05\x12\x17\n\x0f\x66\x65\x65_mode_no_bet\x18\x06 \x01(\x05\x12\x12\n\nenable_ads\x18\x07 \x01(\x08\x12\x1d\n\x15sette_mezzo_bet_scale\x18\x08 \x01(\x05\x12!\n\x19min_gold_play_sette_mezzo\x18\t \x01(\x05\"\xb6\x01\n\x07\x45ndGame\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\x13\n\x0bwin_team_id\x18\x05 \x01(\x05\x12\x13\n\x0bscore_cards\x18\x02 \x03(\x05\x12\x19\n\x11score_last_tricks\x18\x03 \x03(\x05\x12\x14\n\x0cscore_totals\x18\x04 \x03(\x05\x12\x14\n\x0cgold_changes\x18\x06 \x03(\x03\x12\x14\n\x0cplayers_gold\x18\x07 \x03(\x03\x12\x16\n\x0egold_win_score\x18\x08 \x01(\x03\"&\n\x10PrepareStartGame\x12\x12\n\ntime_start\x18\x01 \x01(\x05\"6\n\x11InGameChatMessage\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x14\n\x0c\x63hat_message\x18\x02 \x01(\t\"n\n\x14PaymentGoogleConsume\x12\x16\n\x0epurchase_token\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x0c\n\x04skus\x18\x03 \x03(\t\x12\x11\n\tsignature\x18\x04 \x01(\t\x12\x0b\n\x03sku\x18\x05 \x01(\t\"/\n\x0ePaymentSuccess\x12\x0c\n\x04gold\x18\x01 \x01(\x03\x12\x0f\n\x07pack_id\x18\x02 \x01(\t\"\x1b\n\x0bUpdateMoney\x12\x0c\n\x04gold\x18\x01 \x01(\x03\"\x91\x01\n\tTableList\x12\x11\n\ttable_ids\x18\x01 \x03(\x05\x12\x0c\n\x04\x62\x65ts\x18\x02 \x03(\x05\x12\x13\n\x0bnum_players\x18\x03 \x03(\x05\x12\x14\n\x0cplayer_modes\x18\x04 \x03(\x05\x12\x13\n\x0bplayer_uids\x18\x05 \x03(\x05\x12\x0f\n\x07\x61vatars\x18\x06 \x03(\t\x12\x12\n\ngame_modes\x18\x07 \x03(\x05\"\xf6\x01\n\nShopConfig\x12\x10\n\x08pack_ids\x18\x01 \x03(\t\x12\r\n\x05golds\x18\x02 \x03(\x03\x12\x0e\n\x06prices\x18\x03 \x03(\x01\x12\x12\n\ncurrencies\x18\x04 \x03(\t\x12\x13\n\x0bno_ads_days\x18\x05 \x03(\x05\x12\x18\n\x10gold_offer_first\x18\x06 \x01(\x05\x12\x1e\n\x16no_ads_day_offer_first\x18\x07 \x01(\x05\x12\x19\n\x11price_offer_first\x18\x08 \x01(\x05\x12\x1c\n\x14\x63urrency_offer_first\x18\t \x01(\t\x12\x1b\n\x13pack_id_offer_first\x18\n \x01(\t\" \n\x0cGuestAccount\x12\x10\n\x08guest_id\x18\x01 \x01(\t\"!\n\x0c\x43hangeAvatar\x12\x11\n\tavatar_id\x18\x01 \x01(\x05\"3\n\x12InGameChatEmoticon\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x10\n\x08\x65moticon\x18\x02 \x01(\x05\"\x1b\n\x0cSearchFriend\x12\x0b\n\x03uid\x18\x01 \x01(\x05\"\xb6\x01\n\x14SearchFriendResponse\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0e\n\x06\x61vatar\x18\x04 \x01(\t\x12\x11\n\twin_count\x18\x05 \x01(\x05\x12\x12\n\ngame_count\x18\x06 \x01(\x01\x12\r\n\x05\x65rror\x18\x07 \x01(\x05\x12\r\n\x05level\x18\x08 \x01(\x05\x12\x0b\n\x03\x65xp\x18\t \x01(\x03\x12\x13\n\x0bis_verified\x18\n \x01(\x08\"\x1d\n\rCheatGoldUser\x12\x0c\n\x04gold\x18\x01 \x01(\x03\"\x7f\n\nFriendList\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\x12\x0f\n\x07onlines\x18\x06 \x03(\x08\x12\x13\n\x0bis_playings\x18\x07 \x03(\x08\"p\n\x0e\x46riendRequests\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\x12\x11\n\tsent_uids\x18\x06 \x03(\x05\"\'\n\tAddFriend\x12\r\n\x05\x65rror\x18\x01 \x01(\x05\x12\x0b\n\x03uid\x18\x02 \x01(\x05\"2\n\x13RequestFriendAccept\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\x05\"\x1b\n\x0cRemoveFriend\x12\x0b\n\x03uid\x18\x01 \x01(\x05\"Z\n\x10NewFriendRequest\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\x05\x12\x0c\n\x04gold\x18\x05 \x01(\x03\"_\n\x15\x46riendRequestAccepted\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06\x61vatar\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\x05\x12\x0c\n\x04gold\x18\x05 \x01(\x03\"_\n\x10RecommendFriends\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x0f\n\x07\x61vatars\x18\x03 \x03(\t\x12\x0e\n\x06levels\x18\x04 \x03(\x05\x12\r\n\x05golds\x18\x05 \x03(\x03\"<\n\x13PaymentAppleConsume\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\x12\x14\n\x0creceipt_data\x18\x02 \x01(\t\"2\n\x1fPaymentFinishedAppleTransaction\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\"J\n\x08NewRound\x12\x15\n\rcurrent_round\x18\x01 \x01(\x05\x12\x11\n\tpot_value\x18\x02 \x01(\x03\x12\x14\n\x0cplayers_gold\x18\x03 \x03(\x03\"i\n\x0b\x43reateTable\x12\x0b\n\x03\x62\x65t\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x02 \x01(\x05\x12\x12\n\nis_private\x18\x03 \x01(\x08\x12\x12\n\npoint_mode\x18\x04 \x01(\x05\x12\x10\n\x08\x62\x65t_mode\x18\x05 \x01(\x08\"!\n\rJoinTableById\x12\x10\n\x08match_id\x18\x01 \x01(\x05\"\"\n\x11JoinTableResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\x05\"&\n\x0c\x43laimSupport\x12\x16\n\x0esupport_amount\x18\x01 \x01(\x05\"\x8f\x02\n\x0e\x41ppCodeVersion\x12\x17\n\x0f\x61ndroid_version\x18\x01 \x01(\x05\x12%\n\x1d\x61ndroid_forced_update_version\x18\x02 \x01(\x05\x12%\n\x1d\x61ndroid_remind_update_version\x18\x03 \x01(\x05\x12\x13\n\x0bios_version\x18\x04 \x01(\x05\x12!\n\x19ios_forced_update_version\x18\x05 \x01(\x05\x12!\n\x19ios_remind_update_version\x18\x06 \x01(\x05\x12\x1d\n\x15ios_reviewing_version\x18\x07 \x01(\x05\x12\x1c\n\x14support_packet_batch\x18\x08 \x01(\x08\"\"\n\x10PlayCardResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\"!\n\x10\x43heatViewCardBot\x12\r\n\x05\x63\x61rds\x18\x01 \x03(\x05\"0\n\x10InviteFriendPlay\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07room_id\x18\x02 \x01(\x05\"A\n\x10GameActionNapoli\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x11\n\tpoint_add\x18\x02 \x01(\x05\x12\r\n\x05suits\x18\x03 \x03(\x05\"D\n\x15\x43ustomerServiceReport\x12\x13\n\x0breport_type\x18\x01 \x01(\x05\x12\x16\n\x0ereport_content\x18\x02 \x01(\t\"\x1d\n\x0e\x41\x64minBroadcast\x12\x0b\n\x03mes\x18\x01 \x01(\t\",\n\x19PaymentPaypalRequestOrder\x12\x0f\n\x07pack_id\x18\x01 \x01(\t\"\'\n\x12PaymentPaypalOrder\x12\x11\n\torder_url\x18\x01 \x01(\t\"\x0b\n\tQuickPlay\"{\n\x1aSetteMezzoNewUserJoinMatch\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0c\n\x04gold\x18\x02 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0bseat_server\x18\x04 \x01(\x05\x12\x0f\n\x07team_id\x18\x05 \x01(\x05\x12\x0e\n\x06\x61vatar\x18\x06 \x01(\t\"E\n\x1aSetteMezzoPrepareStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\"\xfc\x03\n\x12SetteMezzoGameInfo\x12\x10\n\x08match_id\x18\x01 \x01(\x05\x12\x11\n\tgame_mode\x18\x02 \x01(\x05\x12\x13\n\x0bplayer_mode\x18\x03 \x01(\x05\x12\x0c\n\x04uids\x18\x04 \x03(\x05\x12\x12\n\nuser_golds\x18\x05 \x03(\x03\x12\x12\n\nuser_names\x18\x06 \x03(\t\x12\x12\n\nbanker_uid\x18\x07 \x01(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x08 \x01(\x05\x12\x12\n\ngame_state\x18\t \x01(\x05\x12\x13\n\x0buser_points\x18\x0b \x03(\x05\x12\x10\n\x08team_ids\x18\x0c \x03(\x05\x12\x11\n\thand_suit\x18\r \x01(\x05\x12\x0f\n\x07\x61vatars\x18\x0e \x03(\t\x12\x1b\n\x13is_registered_leave\x18\x0f \x01(\x08\x12\x0b\n\x03\x62\x65t\x18\x10 \x01(\x05\x12\x11\n\tpot_value\x18\x11 \x01(\x03\x12\x15\n\rcurrent_round\x18\x12 \x01(\x05\x12\x15\n\rhand_in_round\x18\x13 \x01(\x05\x12\x13\n\x0bis_in_games\x18\x14 \x03(\x08\x12\x16\n\x0eplay_turn_time\x18\x15 \x01(\x05\x12\x14\n\x0cplayer_infos\x18\x16 \x03(\x0c\x12\x14\n\x0c\x62\x61nker_cards\x18\x17 \x03(\x05\x12\x13\n\x0bplayer_bets\x18\x18 \x03(\x03\x12\x14\n\x0ctime_end_bet\x18\x19 \x01(\x05\"(\n\x14SetteMezzoPlayerInfo\x12\x10\n\x08\x63\x61rd_ids\x18\x01 \x03(\x05\"\x15\n\x13SetteMezzoQuickPlay\"[\n\x13SetteMezzoStartGame\x12\x11\n\tpot_value\x18\x01 \x01(\x05\x12\x14\n\x0cplayers_gold\x18\x02 \x03(\x03\x12\x0c\n\x04uids\x18\x03 \x03(\x05\x12\r\n\x05\x63\x61rds\x18\x04 \x03(\x05\"\xb8\x01\n\x0bRankingInfo\x12\x11\n\tseason_id\x18\x01 \x01(\x05\x12\x12\n\ntime_start\x18\x02 \x01(\x05\x12\x10\n\x08time_end\x18\x03 \x01(\x05\x12\x0f\n\x07rewards\x18\x04 \x03(\x05\x12\x0c\n\x04uids\x18\x05 \x03(\x05\x12\x0f\n\x07\x61vatars\x18\x06 \x03(\t\x12\r\n\x05names\x18\x07 \x03(\t\x12\x0e\n\x06scores\x18\x08 \x03(\x05\x12\x0f\n\x07my_rank\x18\t \x01(\x05\x12\x10\n\x08my_score\x18\n \x01(\x05\"E\n\rRankingResult\x12\x11\n\tseason_id\x18\x01 \x01(\x05\x12\x13\n\x0bgold_reward\x18\x02 \x01(\x05\x12\x0c\n\x04rank\x18\x03 \x01(\x05\"\'\n\x12RankingClaimReward\x12\x11\n\tseason_id\x18\x01 \x01(\x05\"\"\n\tUpdateAds\x12\x15\n\rtime_show_ads\x18\x01 \x01(\x05\"2\n\tAdsReward\x12\x0c\n\x04gold\x18\x01 \x01(\x05\x12\x17\n\x0ftime_ads_reward\x18\x02 \x01(\x05\"\x1e\n\x0e\x43hangeUserName\x12\x0c\n\x04name\x18\x01 \x01(\t\"3\n\x13SetteMezzoActionHit\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0f\n\x07\x63\x61rd_id\x18\x02 \x01(\x05\"D\n\x14SetteMezzoUpdateTurn\x12\x14\n\x0c\x63urrent_turn\x18\x01 \x01(\x05\x12\x16\n\x0eplay_turn_time\x18\x02 \x01(\x05\"R\n\x15SetteMezzoActionStand\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x14\n\x0c\x63urrent_turn\x18\x02 \x01(\x05\x12\x16\n\x0eplay_turn_time\x18\x03 \x01(\x05\"n\n\x11SetteMezzoEndGame\x12\x0c\n\x04uids\x18\x01 \x03(\x05\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x0f\n\x07is_wins\x18\x03 \x03(\x08\x12\x14\n\x0cgolds_change\x18\x04 \x03(\x03\x12\x14\n\x0cplayer_golds\x18\x05 \x03(\x03\"+\n\x18SetteMezzoShowBankerCard\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\"?\n\x11SetteMezzoBetting\x12\x14\n\x0ctime_end_bet\x18\x01 \x01(\x05\x12\x14\n\x0cplaying_uids\x18\x02 \x03(\x05\"-\n\x11SetteMezzoUserBet\x12\x0b\n\x03uid\x18\x01 \x01(\x05\x12\x0b\n\x03\x62\x65t\x18\x02 \x01(\x03\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,159 +34,165 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EMPTY']._serialized_start=41
   _globals['_EMPTY']._serialized_end=48
   _globals['_PACKET']._serialized_start=50
-  _globals['_PACKET']._serialized_end=106
-  _globals['_CHATMESSAGE']._serialized_start=108
-  _globals['_CHATMESSAGE']._serialized_end=214
-  _globals['_PINGPONG']._serialized_start=216
-  _globals['_PINGPONG']._serialized_end=226
-  _globals['_LOGIN']._serialized_start=228
-  _globals['_LOGIN']._serialized_end=354
-  _globals['_LOGINFIREBASE']._serialized_start=356
-  _globals['_LOGINFIREBASE']._serialized_end=428
-  _globals['_LOGOUT']._serialized_start=430
-  _globals['_LOGOUT']._serialized_end=438
-  _globals['_LOGINRESPONSE']._serialized_start=440
-  _globals['_LOGINRESPONSE']._serialized_end=498
-  _globals['_USERINFO']._serialized_start=501
-  _globals['_USERINFO']._serialized_end=871
-  _globals['_GAMEINFO']._serialized_start=874
-  _globals['_GAMEINFO']._serialized_end=1352
-  _globals['_REGISTERLEAVEGAME']._serialized_start=1354
-  _globals['_REGISTERLEAVEGAME']._serialized_end=1389
-  _globals['_NEWUSERJOINMATCH']._serialized_start=1392
-  _globals['_NEWUSERJOINMATCH']._serialized_end=1521
-  _globals['_USERLEAVEMATCH']._serialized_start=1523
-  _globals['_USERLEAVEMATCH']._serialized_end=1568
-  _globals['_DEALCARD']._serialized_start=1570
-  _globals['_DEALCARD']._serialized_end=1617
-  _globals['_PLAYCARD']._serialized_start=1620
-  _globals['_PLAYCARD']._serialized_end=1812
-  _globals['_STARTGAME']._serialized_start=1814
-  _globals['_STARTGAME']._serialized_end=1866
-  _globals['_NEWHAND']._serialized_start=1868
-  _globals['_NEWHAND']._serialized_end=1917
-  _globals['_UPDATEGAMEPOINT']._serialized_start=1919
-  _globals['_UPDATEGAMEPOINT']._serialized_end=1952
-  _globals['_ENDHAND']._serialized_start=1954
-  _globals['_ENDHAND']._serialized_end=2060
-  _globals['_DRAWCARD']._serialized_start=2062
-  _globals['_DRAWCARD']._serialized_end=2087
-  _globals['_GENERALINFO']._serialized_start=2090
-  _globals['_GENERALINFO']._serialized_end=2336
-  _globals['_ENDGAME']._serialized_start=2339
-  _globals['_ENDGAME']._serialized_end=2521
-  _globals['_PREPARESTARTGAME']._serialized_start=2523
-  _globals['_PREPARESTARTGAME']._serialized_end=2561
-  _globals['_INGAMECHATMESSAGE']._serialized_start=2563
-  _globals['_INGAMECHATMESSAGE']._serialized_end=2617
-  _globals['_PAYMENTGOOGLECONSUME']._serialized_start=2619
-  _globals['_PAYMENTGOOGLECONSUME']._serialized_end=2729
-  _globals['_PAYMENTSUCCESS']._serialized_start=2731
-  _globals['_PAYMENTSUCCESS']._serialized_end=2778
-  _globals['_UPDATEMONEY']._serialized_start=2780
-  _globals['_UPDATEMONEY']._serialized_end=2807
-  _globals['_TABLELIST']._serialized_start=2810
-  _globals['_TABLELIST']._serialized_end=2955
-  _globals['_SHOPCONFIG']._serialized_start=2958
-  _globals['_SHOPCONFIG']._serialized_end=3204
-  _globals['_GUESTACCOUNT']._serialized_start=3206
-  _globals['_GUESTACCOUNT']._serialized_end=3238
-  _globals['_CHANGEAVATAR']._serialized_start=3240
-  _globals['_CHANGEAVATAR']._serialized_end=3273
-  _globals['_INGAMECHATEMOTICON']._serialized_start=3275
-  _globals['_INGAMECHATEMOTICON']._serialized_end=3326
-  _globals['_SEARCHFRIEND']._serialized_start=3328
-  _globals['_SEARCHFRIEND']._serialized_end=3355
-  _globals['_SEARCHFRIENDRESPONSE']._serialized_start=3358
-  _globals['_SEARCHFRIENDRESPONSE']._serialized_end=3540
-  _globals['_CHEATGOLDUSER']._serialized_start=3542
-  _globals['_CHEATGOLDUSER']._serialized_end=3571
-  _globals['_FRIENDLIST']._serialized_start=3573
-  _globals['_FRIENDLIST']._serialized_end=3700
-  _globals['_FRIENDREQUESTS']._serialized_start=3702
-  _globals['_FRIENDREQUESTS']._serialized_end=3814
-  _globals['_ADDFRIEND']._serialized_start=3816
-  _globals['_ADDFRIEND']._serialized_end=3855
-  _globals['_REQUESTFRIENDACCEPT']._serialized_start=3857
-  _globals['_REQUESTFRIENDACCEPT']._serialized_end=3907
-  _globals['_REMOVEFRIEND']._serialized_start=3909
-  _globals['_REMOVEFRIEND']._serialized_end=3936
-  _globals['_NEWFRIENDREQUEST']._serialized_start=3938
-  _globals['_NEWFRIENDREQUEST']._serialized_end=4028
-  _globals['_FRIENDREQUESTACCEPTED']._serialized_start=4030
-  _globals['_FRIENDREQUESTACCEPTED']._serialized_end=4125
-  _globals['_RECOMMENDFRIENDS']._serialized_start=4127
-  _globals['_RECOMMENDFRIENDS']._serialized_end=4222
-  _globals['_PAYMENTAPPLECONSUME']._serialized_start=4224
-  _globals['_PAYMENTAPPLECONSUME']._serialized_end=4284
-  _globals['_PAYMENTFINISHEDAPPLETRANSACTION']._serialized_start=4286
-  _globals['_PAYMENTFINISHEDAPPLETRANSACTION']._serialized_end=4336
-  _globals['_NEWROUND']._serialized_start=4338
-  _globals['_NEWROUND']._serialized_end=4412
-  _globals['_CREATETABLE']._serialized_start=4414
-  _globals['_CREATETABLE']._serialized_end=4519
-  _globals['_JOINTABLEBYID']._serialized_start=4521
-  _globals['_JOINTABLEBYID']._serialized_end=4554
-  _globals['_JOINTABLERESPONSE']._serialized_start=4556
-  _globals['_JOINTABLERESPONSE']._serialized_end=4590
-  _globals['_CLAIMSUPPORT']._serialized_start=4592
-  _globals['_CLAIMSUPPORT']._serialized_end=4630
-  _globals['_APPCODEVERSION']._serialized_start=4633
-  _globals['_APPCODEVERSION']._serialized_end=4874
-  _globals['_PLAYCARDRESPONSE']._serialized_start=4876
-  _globals['_PLAYCARDRESPONSE']._serialized_end=4910
-  _globals['_CHEATVIEWCARDBOT']._serialized_start=4912
-  _globals['_CHEATVIEWCARDBOT']._serialized_end=4945
-  _globals['_INVITEFRIENDPLAY']._serialized_start=4947
-  _globals['_INVITEFRIENDPLAY']._serialized_end=4995
-  _globals['_GAMEACTIONNAPOLI']._serialized_start=4997
-  _globals['_GAMEACTIONNAPOLI']._serialized_end=5062
-  _globals['_CUSTOMERSERVICEREPORT']._serialized_start=5064
-  _globals['_CUSTOMERSERVICEREPORT']._serialized_end=5132
-  _globals['_ADMINBROADCAST']._serialized_start=5134
-  _globals['_ADMINBROADCAST']._serialized_end=5163
-  _globals['_PAYMENTPAYPALREQUESTORDER']._serialized_start=5165
-  _globals['_PAYMENTPAYPALREQUESTORDER']._serialized_end=5209
-  _globals['_PAYMENTPAYPALORDER']._serialized_start=5211
-  _globals['_PAYMENTPAYPALORDER']._serialized_end=5250
-  _globals['_QUICKPLAY']._serialized_start=5252
-  _globals['_QUICKPLAY']._serialized_end=5263
-  _globals['_SETTEMEZZONEWUSERJOINMATCH']._serialized_start=5265
-  _globals['_SETTEMEZZONEWUSERJOINMATCH']._serialized_end=5388
-  _globals['_SETTEMEZZOPREPARESTARTGAME']._serialized_start=5390
-  _globals['_SETTEMEZZOPREPARESTARTGAME']._serialized_end=5459
-  _globals['_SETTEMEZZOGAMEINFO']._serialized_start=5462
-  _globals['_SETTEMEZZOGAMEINFO']._serialized_end=5970
-  _globals['_SETTEMEZZOPLAYERINFO']._serialized_start=5972
-  _globals['_SETTEMEZZOPLAYERINFO']._serialized_end=6012
-  _globals['_SETTEMEZZOQUICKPLAY']._serialized_start=6014
-  _globals['_SETTEMEZZOQUICKPLAY']._serialized_end=6035
-  _globals['_SETTEMEZZOSTARTGAME']._serialized_start=6037
-  _globals['_SETTEMEZZOSTARTGAME']._serialized_end=6128
-  _globals['_RANKINGINFO']._serialized_start=6131
-  _globals['_RANKINGINFO']._serialized_end=6315
-  _globals['_RANKINGRESULT']._serialized_start=6317
-  _globals['_RANKINGRESULT']._serialized_end=6386
-  _globals['_RANKINGCLAIMREWARD']._serialized_start=6388
-  _globals['_RANKINGCLAIMREWARD']._serialized_end=6427
-  _globals['_UPDATEADS']._serialized_start=6429
-  _globals['_UPDATEADS']._serialized_end=6463
-  _globals['_ADSREWARD']._serialized_start=6465
-  _globals['_ADSREWARD']._serialized_end=6515
-  _globals['_CHANGEUSERNAME']._serialized_start=6517
-  _globals['_CHANGEUSERNAME']._serialized_end=6547
-  _globals['_SETTEMEZZOACTIONHIT']._serialized_start=6549
-  _globals['_SETTEMEZZOACTIONHIT']._serialized_end=6600
-  _globals['_SETTEMEZZOUPDATETURN']._serialized_start=6602
-  _globals['_SETTEMEZZOUPDATETURN']._serialized_end=6670
-  _globals['_SETTEMEZZOACTIONSTAND']._serialized_start=6672
-  _globals['_SETTEMEZZOACTIONSTAND']._serialized_end=6754
-  _globals['_SETTEMEZZOENDGAME']._serialized_start=6756
-  _globals['_SETTEMEZZOENDGAME']._serialized_end=6866
-  _globals['_SETTEMEZZOSHOWBANKERCARD']._serialized_start=6868
-  _globals['_SETTEMEZZOSHOWBANKERCARD']._serialized_end=6911
-  _globals['_SETTEMEZZOBETTING']._serialized_start=6913
-  _globals['_SETTEMEZZOBETTING']._serialized_end=6976
-  _globals['_SETTEMEZZOUSERBET']._serialized_start=6978
-  _globals['_SETTEMEZZOUSERBET']._serialized_end=7023
+  _globals['_PACKET']._serialized_end=119
+  _globals['_PACKETBATCH']._serialized_start=121
+  _globals['_PACKETBATCH']._serialized_end=151
+  _globals['_CHATMESSAGE']._serialized_start=153
+  _globals['_CHATMESSAGE']._serialized_end=259
+  _globals['_PINGPONG']._serialized_start=261
+  _globals['_PINGPONG']._serialized_end=271
+  _globals['_LOGIN']._serialized_start=274
+  _globals['_LOGIN']._serialized_end=430
+  _globals['_LOGINFIREBASE']._serialized_start=432
+  _globals['_LOGINFIREBASE']._serialized_end=504
+  _globals['_LOGOUT']._serialized_start=506
+  _globals['_LOGOUT']._serialized_end=514
+  _globals['_LOGINRESPONSE']._serialized_start=516
+  _globals['_LOGINRESPONSE']._serialized_end=596
+  _globals['_RESUMESESSION']._serialized_start=598
+  _globals['_RESUMESESSION']._serialized_end=696
+  _globals['_RESUMESESSIONRESPONSE']._serialized_start=698
+  _globals['_RESUMESESSIONRESPONSE']._serialized_end=751
+  _globals['_USERINFO']._serialized_start=754
+  _globals['_USERINFO']._serialized_end=1124
+  _globals['_GAMEINFO']._serialized_start=1127
+  _globals['_GAMEINFO']._serialized_end=1605
+  _globals['_REGISTERLEAVEGAME']._serialized_start=1607
+  _globals['_REGISTERLEAVEGAME']._serialized_end=1642
+  _globals['_NEWUSERJOINMATCH']._serialized_start=1645
+  _globals['_NEWUSERJOINMATCH']._serialized_end=1774
+  _globals['_USERLEAVEMATCH']._serialized_start=1776
+  _globals['_USERLEAVEMATCH']._serialized_end=1821
+  _globals['_DEALCARD']._serialized_start=1823
+  _globals['_DEALCARD']._serialized_end=1870
+  _globals['_PLAYCARD']._serialized_start=1873
+  _globals['_PLAYCARD']._serialized_end=2065
+  _globals['_STARTGAME']._serialized_start=2067
+  _globals['_STARTGAME']._serialized_end=2119
+  _globals['_NEWHAND']._serialized_start=2121
+  _globals['_NEWHAND']._serialized_end=2170
+  _globals['_UPDATEGAMEPOINT']._serialized_start=2172
+  _globals['_UPDATEGAMEPOINT']._serialized_end=2205
+  _globals['_ENDHAND']._serialized_start=2207
+  _globals['_ENDHAND']._serialized_end=2313
+  _globals['_DRAWCARD']._serialized_start=2315
+  _globals['_DRAWCARD']._serialized_end=2340
+  _globals['_GENERALINFO']._serialized_start=2343
+  _globals['_GENERALINFO']._serialized_end=2589
+  _globals['_ENDGAME']._serialized_start=2592
+  _globals['_ENDGAME']._serialized_end=2774
+  _globals['_PREPARESTARTGAME']._serialized_start=2776
+  _globals['_PREPARESTARTGAME']._serialized_end=2814
+  _globals['_INGAMECHATMESSAGE']._serialized_start=2816
+  _globals['_INGAMECHATMESSAGE']._serialized_end=2870
+  _globals['_PAYMENTGOOGLECONSUME']._serialized_start=2872
+  _globals['_PAYMENTGOOGLECONSUME']._serialized_end=2982
+  _globals['_PAYMENTSUCCESS']._serialized_start=2984
+  _globals['_PAYMENTSUCCESS']._serialized_end=3031
+  _globals['_UPDATEMONEY']._serialized_start=3033
+  _globals['_UPDATEMONEY']._serialized_end=3060
+  _globals['_TABLELIST']._serialized_start=3063
+  _globals['_TABLELIST']._serialized_end=3208
+  _globals['_SHOPCONFIG']._serialized_start=3211
+  _globals['_SHOPCONFIG']._serialized_end=3457
+  _globals['_GUESTACCOUNT']._serialized_start=3459
+  _globals['_GUESTACCOUNT']._serialized_end=3491
+  _globals['_CHANGEAVATAR']._serialized_start=3493
+  _globals['_CHANGEAVATAR']._serialized_end=3526
+  _globals['_INGAMECHATEMOTICON']._serialized_start=3528
+  _globals['_INGAMECHATEMOTICON']._serialized_end=3579
+  _globals['_SEARCHFRIEND']._serialized_start=3581
+  _globals['_SEARCHFRIEND']._serialized_end=3608
+  _globals['_SEARCHFRIENDRESPONSE']._serialized_start=3611
+  _globals['_SEARCHFRIENDRESPONSE']._serialized_end=3793
+  _globals['_CHEATGOLDUSER']._serialized_start=3795
+  _globals['_CHEATGOLDUSER']._serialized_end=3824
+  _globals['_FRIENDLIST']._serialized_start=3826
+  _globals['_FRIENDLIST']._serialized_end=3953
+  _globals['_FRIENDREQUESTS']._serialized_start=3955
+  _globals['_FRIENDREQUESTS']._serialized_end=4067
+  _globals['_ADDFRIEND']._serialized_start=4069
+  _globals['_ADDFRIEND']._serialized_end=4108
+  _globals['_REQUESTFRIENDACCEPT']._serialized_start=4110
+  _globals['_REQUESTFRIENDACCEPT']._serialized_end=4160
+  _globals['_REMOVEFRIEND']._serialized_start=4162
+  _globals['_REMOVEFRIEND']._serialized_end=4189
+  _globals['_NEWFRIENDREQUEST']._serialized_start=4191
+  _globals['_NEWFRIENDREQUEST']._serialized_end=4281
+  _globals['_FRIENDREQUESTACCEPTED']._serialized_start=4283
+  _globals['_FRIENDREQUESTACCEPTED']._serialized_end=4378
+  _globals['_RECOMMENDFRIENDS']._serialized_start=4380
+  _globals['_RECOMMENDFRIENDS']._serialized_end=4475
+  _globals['_PAYMENTAPPLECONSUME']._serialized_start=4477
+  _globals['_PAYMENTAPPLECONSUME']._serialized_end=4537
+  _globals['_PAYMENTFINISHEDAPPLETRANSACTION']._serialized_start=4539
+  _globals['_PAYMENTFINISHEDAPPLETRANSACTION']._serialized_end=4589
+  _globals['_NEWROUND']._serialized_start=4591
+  _globals['_NEWROUND']._serialized_end=4665
+  _globals['_CREATETABLE']._serialized_start=4667
+  _globals['_CREATETABLE']._serialized_end=4772
+  _globals['_JOINTABLEBYID']._serialized_start=4774
+  _globals['_JOINTABLEBYID']._serialized_end=4807
+  _globals['_JOINTABLERESPONSE']._serialized_start=4809
+  _globals['_JOINTABLERESPONSE']._serialized_end=4843
+  _globals['_CLAIMSUPPORT']._serialized_start=4845
+  _globals['_CLAIMSUPPORT']._serialized_end=4883
+  _globals['_APPCODEVERSION']._serialized_start=4886
+  _globals['_APPCODEVERSION']._serialized_end=5157
+  _globals['_PLAYCARDRESPONSE']._serialized_start=5159
+  _globals['_PLAYCARDRESPONSE']._serialized_end=5193
+  _globals['_CHEATVIEWCARDBOT']._serialized_start=5195
+  _globals['_CHEATVIEWCARDBOT']._serialized_end=5228
+  _globals['_INVITEFRIENDPLAY']._serialized_start=5230
+  _globals['_INVITEFRIENDPLAY']._serialized_end=5278
+  _globals['_GAMEACTIONNAPOLI']._serialized_start=5280
+  _globals['_GAMEACTIONNAPOLI']._serialized_end=5345
+  _globals['_CUSTOMERSERVICEREPORT']._serialized_start=5347
+  _globals['_CUSTOMERSERVICEREPORT']._serialized_end=5415
+  _globals['_ADMINBROADCAST']._serialized_start=5417
+  _globals['_ADMINBROADCAST']._serialized_end=5446
+  _globals['_PAYMENTPAYPALREQUESTORDER']._serialized_start=5448
+  _globals['_PAYMENTPAYPALREQUESTORDER']._serialized_end=5492
+  _globals['_PAYMENTPAYPALORDER']._serialized_start=5494
+  _globals['_PAYMENTPAYPALORDER']._serialized_end=5533
+  _globals['_QUICKPLAY']._serialized_start=5535
+  _globals['_QUICKPLAY']._serialized_end=5546
+  _globals['_SETTEMEZZONEWUSERJOINMATCH']._serialized_start=5548
+  _globals['_SETTEMEZZONEWUSERJOINMATCH']._serialized_end=5671
+  _globals['_SETTEMEZZOPREPARESTARTGAME']._serialized_start=5673
+  _globals['_SETTEMEZZOPREPARESTARTGAME']._serialized_end=5742
+  _globals['_SETTEMEZZOGAMEINFO']._serialized_start=5745
+  _globals['_SETTEMEZZOGAMEINFO']._serialized_end=6253
+  _globals['_SETTEMEZZOPLAYERINFO']._serialized_start=6255
+  _globals['_SETTEMEZZOPLAYERINFO']._serialized_end=6295
+  _globals['_SETTEMEZZOQUICKPLAY']._serialized_start=6297
+  _globals['_SETTEMEZZOQUICKPLAY']._serialized_end=6318
+  _globals['_SETTEMEZZOSTARTGAME']._serialized_start=6320
+  _globals['_SETTEMEZZOSTARTGAME']._serialized_end=6411
+  _globals['_RANKINGINFO']._serialized_start=6414
+  _globals['_RANKINGINFO']._serialized_end=6598
+  _globals['_RANKINGRESULT']._serialized_start=6600
+  _globals['_RANKINGRESULT']._serialized_end=6669
+  _globals['_RANKINGCLAIMREWARD']._serialized_start=6671
+  _globals['_RANKINGCLAIMREWARD']._serialized_end=6710
+  _globals['_UPDATEADS']._serialized_start=6712
+  _globals['_UPDATEADS']._serialized_end=6746
+  _globals['_ADSREWARD']._serialized_start=6748
+  _globals['_ADSREWARD']._serialized_end=6798
+  _globals['_CHANGEUSERNAME']._serialized_start=6800
+  _globals['_CHANGEUSERNAME']._serialized_end=6830
+  _globals['_SETTEMEZZOACTIONHIT']._serialized_start=6832
+  _globals['_SETTEMEZZOACTIONHIT']._serialized_end=6883
+  _globals['_SETTEMEZZOUPDATETURN']._serialized_start=6885
+  _globals['_SETTEMEZZOUPDATETURN']._serialized_end=6953
+  _globals['_SETTEMEZZOACTIONSTAND']._serialized_start=6955
+  _globals['_SETTEMEZZOACTIONSTAND']._serialized_end=7037
+  _globals['_SETTEMEZZOENDGAME']._serialized_start=7039
+  _globals['_SETTEMEZZOENDGAME']._serialized_end=7149
+  _globals['_SETTEMEZZOSHOWBANKERCARD']._serialized_start=7151
+  _globals['_SETTEMEZZOSHOWBANKERCARD']._serialized_end=7194
+  _globals['_SETTEMEZZOBETTING']._serialized_start=7196
+  _globals['_SETTEMEZZOBETTING']._serialized_end=7259
+  _globals['_SETTEMEZZOUSERBET']._serialized_start=7261
+  _globals['_SETTEMEZZOUSERBET']._serialized_end=7306
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,118 @@
+import json
+import time
+
+KEY_UID = "uid"  # one bucket per logged in user, falls back to the IP before login
+KEY_IP = "ip"    # one bucket per client IP
+KEY_CONNECTION = "connection"  # one bucket per websocket, many clients can share an IP behind a NAT
+
+SWEEP_INTERVAL = 60  # seconds between removals of idle buckets
+
+
+class TokenBucket:
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+
+
+class BucketGroup:
+    """Token buckets with the same rate and burst, one per key. A bucket that has refilled
+    completely holds no information and is dropped on the next sweep."""
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate  # tokens added per second
+        self.burst = burst  # bucket size
+        self.buckets: dict = {}
+
+    def consume(self, key, now: float) -> bool:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.burst, now)
+            self.buckets[key] = bucket
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+        if bucket.tokens < 1:
+            return False
+        bucket.tokens -= 1
+        return True
+
+    def sweep(self, now: float):
+        full = [key for key, bucket in self.buckets.items()
+                if bucket.tokens + (now - bucket.updated) * self.rate >= self.burst]
+        for key in full:
+            del self.buckets[key]
+
+
+class RateLimiter:
+    """Limits packets per IP, per user and per cmd, configured in config/rate_limit.json."""
+    def __init__(self, config: dict):
+        self.ip_group = BucketGroup(config["ip"]["rate"], config["ip"]["burst"]) if "ip" in config else None
+        self.uid_group = BucketGroup(config["uid"]["rate"], config["uid"]["burst"]) if "uid" in config else None
+        self.cmd_groups: dict[int, BucketGroup] = {}
+        self.cmd_keys: dict[int, str] = {}
+        for cmd in config.get("cmds", []):
+            self.cmd_groups[cmd["cmd_id"]] = BucketGroup(cmd["rate"], cmd["burst"])
+            self.cmd_keys[cmd["cmd_id"]] = cmd.get("key", KEY_UID)
+        self.last_sweep = time.monotonic()
+
+        # metrics
+        self.rejected_by_cmd: dict[int, int] = {}
+        self.rejected_by_scope = {"ip": 0, "uid": 0, "cmd": 0}
+
+    def allow(self, cmd_id: int, uid: int, ip: str, connection=None) -> bool:
+        """Takes a token from every bucket the packet belongs to, False if one of them is empty.
+        connection identifies the websocket, for KEY_CONNECTION cmds."""
+        now = time.monotonic()
+        if now - self.last_sweep > SWEEP_INTERVAL:
+            self._sweep(now)
+
+        group = self.cmd_groups.get(cmd_id)
+        if group is not None:
+            key = self._cmd_key(self.cmd_keys[cmd_id], uid, ip, connection)
+            if not group.consume(key, now):
+                return self._reject(cmd_id, "cmd")
+        if self.uid_group is not None and uid is not None and not self.uid_group.consume(uid, now):
+            return self._reject(cmd_id, "uid")
+        if self.ip_group is not None and not self.ip_group.consume(ip, now):
+            return self._reject(cmd_id, "ip")
+        return True
+
+    @staticmethod
+    def _cmd_key(key_type: str, uid: int, ip: str, connection):
+        if key_type == KEY_UID and uid is not None:
+            return uid
+        if key_type == KEY_CONNECTION and connection is not None:
+            return connection
+        return ip
+
+    def _reject(self, cmd_id: int, scope: str) -> bool:
+        self.rejected_by_cmd[cmd_id] = self.rejected_by_cmd.get(cmd_id, 0) + 1
+        self.rejected_by_scope[scope] += 1
+        return False
+
+    def _sweep(self, now: float):
+        self.last_sweep = now
+        groups = list(self.cmd_groups.values())
+        if self.ip_group is not None:
+            groups.append(self.ip_group)
+        if self.uid_group is not None:
+            groups.append(self.uid_group)
+        for group in groups:
+            group.sweep(now)
+
+    def get_stats(self) -> dict:
+        return {
+            "rejected": sum(self.rejected_by_scope.values()),
+            "rejected_by_scope": dict(self.rejected_by_scope),
+            "rejected_by_cmd": dict(self.rejected_by_cmd),
+            "buckets": sum(len(group.buckets) for group in self.cmd_groups.values())
+                       + (len(self.ip_group.buckets) if self.ip_group else 0)
+                       + (len(self.uid_group.buckets) if self.uid_group else 0),
+        }
+
+
+with open('config/rate_limit.json', 'r') as file:
+    rate_limit_config = json.load(file)
+
+rate_limiter = RateLimiter(rate_limit_config)
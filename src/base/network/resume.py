@@ -0,0 +1,52 @@
+import collections
+import hmac
+import secrets
+import time
+
+from src.base.network.packets import packet_pb2
+from src.config.settings import settings
+
+
+def seq_suffix(seq: int) -> bytes:
+    """Bytes that set Packet.seq when appended to a serialized Packet. Protobuf merges
+    concatenated messages, so a frame built once can be numbered per recipient."""
+    return packet_pb2.Packet(seq=seq).SerializeToString()
+
+
+class ResumeState:
+    """Sequence counter and replay buffer of one logged in user, kept for a grace period
+    after the connection drops so the client can resume instead of logging in again."""
+    __slots__ = ('uid', 'token', 'next_seq', 'buffer', 'disconnected_at')
+
+    def __init__(self, uid: int, buffer_size: int = None):
+        self.uid = uid
+        self.token = secrets.token_urlsafe(24)
+        self.next_seq = 1
+        self.buffer: collections.deque[tuple[int, bytes]] = collections.deque(
+            maxlen=int(buffer_size or settings.RESUME_BUFFER_SIZE))
+        self.disconnected_at = 0.0  # monotonic time the connection dropped, 0 while connected
+
+    def number(self, frame: bytes) -> bytes:
+        """Gives the frame the next seq and keeps it for replay."""
+        seq = self.next_seq
+        self.next_seq += 1
+        frame = frame + seq_suffix(seq)
+        self.buffer.append((seq, frame))
+        return frame
+
+    def check_token(self, token: str) -> bool:
+        return hmac.compare_digest(self.token, token)
+
+    def is_expired(self) -> bool:
+        return bool(self.disconnected_at) and time.monotonic() - self.disconnected_at > int(settings.RESUME_GRACE_SECONDS)
+
+    def can_replay_from(self, last_seq: int) -> bool:
+        """True if every packet after last_seq is still buffered."""
+        if last_seq >= self.next_seq:
+            return False
+        if last_seq == self.next_seq - 1:
+            return True
+        return bool(self.buffer) and self.buffer[0][0] <= last_seq + 1
+
+    def frames_after(self, last_seq: int) -> list[bytes]:
+        return [frame for seq, frame in self.buffer if seq > last_seq]
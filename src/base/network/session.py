@@ -0,0 +1,62 @@
+import functools
+import itertools
+import time
+from fastapi import WebSocket
+
+from src.base.network.inbound_queue import InboundQueue
+from src.base.network.outbound_queue import OutboundQueue
+from src.base.network.resume import ResumeState
+
+_conn_ids = itertools.count(1)
+
+
+class Session:
+    """Per-connection state. Everything tied to one WebSocket lives here and is cleaned up in close()."""
+    __slots__ = (
+        'websocket',
+        'conn_id',
+        'ip',
+        'uid',
+        'auth_expires_at',
+        'resume',
+        'outbound_queue',
+        'inbound_queue',
+        'connected_at',
+        # ping state, see heartbeat.py
+        'wheel_slot',
+        'pong_count',
+        'missed_pings',
+    )
+
+    def __init__(self, websocket: WebSocket, packet_handler):
+        self.websocket = websocket
+        self.conn_id = next(_conn_ids)  # never reused, unlike id(); keys per connection rate limits
+        self.ip = websocket.client.host if websocket.client else ""
+        self.uid: int = None  # set once the connection is logged in
+        self.auth_expires_at = 0.0  # unix time the login expires, same lifetime as the session token
+        self.resume: ResumeState = None  # numbers and buffers sent packets while logged in
+        self.outbound_queue = OutboundQueue(websocket)
+        self.inbound_queue = InboundQueue(functools.partial(packet_handler, self))  # packet_handler(session, packet)
+        self.connected_at = time.time()
+        self.wheel_slot = -1
+        self.pong_count = 0
+        self.missed_pings = 0
+
+    def start(self):
+        self.outbound_queue.start()
+        self.inbound_queue.start()
+
+    def is_authenticated(self) -> bool:
+        return self.uid is not None and time.time() < self.auth_expires_at
+
+    def send_frame(self, frame: bytes, sequenced: bool = True) -> bool:
+        if sequenced and self.resume is not None:
+            frame = self.resume.number(frame)
+        return self.outbound_queue.put(frame)
+
+    def close(self):
+        self.inbound_queue.close()
+        self.outbound_queue.close()
+
+    def __repr__(self):
+        return f"Session(uid={self.uid}, websocket={self.websocket})"
@@ -17,22 +17,13 @@ from src.base.payment import paypal_pay
 with open('config/shop.json', 'r') as file:
     config = json.load(file)
 
-async def on_receive_packet(uid, cmd_id, payload):
-    match cmd_id:
-        case CMDs.PAYMENT_GOOGLE_CONSUME:
-            print("PAYMENT_GOOGLE_CONSUME")
-            await _handle_google_consume(uid, payload)
-        case CMDs.PAYMENT_APPLE_CONSUME:
-            print("PAYMENT_APPLE_CONSUME")
-            await _handle_apple_consume(uid, payload)
-        case CMDs.PAYMENT_PAYPAL_REQUEST_ORDER:
-            await _handle_paypal_request_order(uid, payload)
-        case _:
-            pass
-
-async def _handle_apple_consume(uid, payload):
-    pkg = packet_pb2.PaymentAppleConsume()
-    pkg.ParseFromString(payload)
+def register_cmds(router):
+    # receipt verification calls the store servers, keep the number of requests in flight bounded
+    router.register(CMDs.PAYMENT_GOOGLE_CONSUME, _handle_google_consume, packet_pb2.PaymentGoogleConsume, max_concurrency=16)
+    router.register(CMDs.PAYMENT_APPLE_CONSUME, _handle_apple_consume, packet_pb2.PaymentAppleConsume, max_concurrency=16)
+    router.register(CMDs.PAYMENT_PAYPAL_REQUEST_ORDER, _handle_paypal_request_order, packet_pb2.PaymentPaypalRequestOrder, max_concurrency=16)
+
+async def _handle_apple_consume(uid, pkg):
     print(f"User {uid} consume apple payment {pkg.receipt_data}")
     receipt_data = pkg.receipt_data
     pack_id = pkg.pack_id
@@ -93,9 +84,7 @@ async def _send_finished_apple_transaction(uid, product_id):
     pkg.pack_id = product_id
     await game_vars.get_game_client().send_packet(uid, CMDs.PAYMENT_APPLE_FINISHED_TRANSACTION, pkg)
 
-async def _handle_google_consume(uid, payload):
-    pkg = packet_pb2.PaymentGoogleConsume()
-    pkg.ParseFromString(payload)
+async def _handle_google_consume(uid, pkg):
     print(f"User {uid} consume google payment {pkg.purchase_token}")
     purchase_token = pkg.purchase_token
     pack_id = pkg.sku
@@ -212,9 +201,7 @@ async def send_shop_config(uid, platform):
     await game_vars.get_game_client().send_packet(uid, CMDs.SHOP_CONFIG, pkg)
     print(f"Send shop config to user {uid}", CMDs.SHOP_CONFIG)
 
-async def _handle_paypal_request_order(uid, payload):
-    pkg = packet_pb2.PaymentPaypalRequestOrder()
-    pkg.ParseFromString(payload)
+async def _handle_paypal_request_order(uid, pkg):
     pack_id = pkg.pack_id
     
     pack_info = get_pack_info(pack_id)
@@ -38,6 +38,22 @@ class RedisSettings(DatabaseSettings):
     REDIS_PORT: Optional[str] = os.getenv("REDIS_PORT", "6379")
     REDIS_TTL: Optional[int] = os.getenv("REDIS_TTL", 3600)
 
+class NetworkSettings(BaseSettings):
+    # Outbound queue per connection, see src/base/network/outbound_queue.py
+    SEND_QUEUE_HIGH_WATER: Optional[int] = os.getenv("SEND_QUEUE_HIGH_WATER", 256)  # frames queued before policy applies
+    SEND_QUEUE_POLICY: Optional[str] = os.getenv("SEND_QUEUE_POLICY", "drop")  # drop | close
+    SEND_QUEUE_BACKLOG_TIMEOUT: Optional[int] = os.getenv("SEND_QUEUE_BACKLOG_TIMEOUT", 30)  # seconds backed up before close
+    # Packet batching, only for clients that set Login.support_packet_batch
+    ENABLE_PACKET_BATCH: Optional[bool] = os.getenv("ENABLE_PACKET_BATCH", "true") == "true"
+    PACKET_BATCH_WINDOW_MS: Optional[int] = os.getenv("PACKET_BATCH_WINDOW_MS", 5)  # 0 = flush at the end of the current loop tick
+    PACKET_BATCH_MAX_FRAMES: Optional[int] = os.getenv("PACKET_BATCH_MAX_FRAMES", 32)
+    # Session resume, see src/base/network/resume.py
+    RESUME_GRACE_SECONDS: Optional[int] = os.getenv("RESUME_GRACE_SECONDS", 60)  # how long a dropped session can be resumed
+    RESUME_BUFFER_SIZE: Optional[int] = os.getenv("RESUME_BUFFER_SIZE", 128)  # sent packets kept for replay
+    # Inbound queue per connection, see src/base/network/inbound_queue.py
+    RECV_QUEUE_MAX_PENDING: Optional[int] = os.getenv("RECV_QUEUE_MAX_PENDING", 64)  # packets waiting for the worker
+    RECV_QUEUE_POLICY: Optional[str] = os.getenv("RECV_QUEUE_POLICY", "pause")  # drop | disconnect | pause
+
 class CommonSettings(BaseSettings):
     ENABLE_CHEAT: Optional[bool] = os.getenv("ENABLE_CHEAT") == "true"
     DEV_MODE: Optional[bool] = os.getenv("DEV_MODE") == "true"
@@ -50,11 +66,15 @@ class CommonSettings(BaseSettings):
     JWT_SECRET_KEY: Optional[str] = os.getenv("JWT_SECRET_KEY")  # Replace with a secure secret key
     TELEGRAM_BOT_TOKEN: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
     PAYPAL_CLIENT_SECRET: Optional[str] = os.getenv("PAYPAL_CLIENT_SECRET")
+    USER_CACHE_MAX_SIZE: Optional[int] = os.getenv("USER_CACHE_MAX_SIZE", 20000)  # cached UserInfo, online users come on top
+    BOT_POOL_WORKERS: Optional[int] = os.getenv("BOT_POOL_WORKERS", 2)  # processes for bot searches, 0 = search on the event loop
+    BOT_POOL_MAX_PENDING: Optional[int] = os.getenv("BOT_POOL_MAX_PENDING", 16)  # searches in flight before bots fall back to a cheap policy
 
 class Settings(
     EnvironmentSettings,
     PostgresSettings,
     RedisSettings,
+    NetworkSettings,
     CommonSettings,
 ):
     pass
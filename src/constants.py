@@ -12,6 +12,10 @@ LOGIN_UID_CHEAT = 10
 
 LOGIN_ERROR_SUCCESS = 0
 LOGIN_ERROR_UNAUTHORIZED = 1
+
+RESUME_ERROR_SUCCESS = 0
+RESUME_ERROR_INVALID = 1  # unknown uid, wrong token or grace period over
+RESUME_ERROR_TOO_OLD = 2  # missed packets are no longer buffered
 AVATAR_IDS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
 CHAT_EMO_IDS = [1,2,3,4,5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
 
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("bot_pool")  # Name your logger
+
+
+class BotPool:
+    """Worker processes for bot searches, so a thinking bot never blocks the event loop.
+
+    submit() returns an asyncio future of the result, or None when the pool is off (workers = 0) or
+    saturated (max_pending searches in flight); the bot then decides on the loop. Searches of a
+    match are cancelled with cancel_match() when it ends, those not started yet never run. A search
+    counts as in flight until its worker is done with it, cancelled or not.
+    """
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor: ProcessPoolExecutor = None  # started on the first search
+        self.pending: dict[int, set[asyncio.Future]] = {}  # match_id -> results not delivered yet
+        self.pending_count = 0  # searches queued or running in the executor
+
+        # metrics
+        self.submitted_count = 0
+        self.saturated_count = 0
+        self.cancelled_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def submit(self, match_id: int, fn, *args):
+        if not self.enabled:
+            return None
+        if self.pending_count >= self.max_pending:
+            self.saturated_count += 1
+            return None
+        if self.executor is None:
+            # spawn: workers only import the search, not the server
+            self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        loop = asyncio.get_running_loop()
+        try:
+            job = self.executor.submit(fn, *args)
+        except BrokenProcessPool:
+            logger.error("Bot pool broken, restarting it")
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            return None
+
+        self.submitted_count += 1
+        self.pending_count += 1
+        future = asyncio.wrap_future(job, loop=loop)
+        self.pending.setdefault(match_id, set()).add(future)
+        future.add_done_callback(lambda f: self._on_result(match_id, f))
+        # a running search cannot be stopped, its worker stays busy until the job is done
+        job.add_done_callback(lambda j: self._call_in_loop(loop, self._on_job_done, match_id, j))
+        return future
+
+    def cancel_match(self, match_id: int):
+        """Drops the results of the match's searches, those not started yet never run."""
+        for future in self.pending.pop(match_id, ()):
+            if future.cancel():
+                self.cancelled_count += 1
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def get_stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending_count,
+            "submitted_count": self.submitted_count,
+            "saturated_count": self.saturated_count,
+            "cancelled_count": self.cancelled_count,
+        }
+
+    @staticmethod
+    def _call_in_loop(loop: asyncio.AbstractEventLoop, fn, *args):
+        # job callbacks run on the executor's thread
+        try:
+            loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            pass  # the loop is closed, the server is shutting down
+
+    def _on_job_done(self, match_id: int, job):
+        self.pending_count -= 1
+        if not job.cancelled() and job.exception() is not None:
+            logger.error(f"Bot search of match {match_id} failed: {job.exception()}")
+
+    def _on_result(self, match_id: int, future: asyncio.Future):
+        searches = self.pending.get(match_id)
+        if searches is not None:
+            searches.discard(future)
+            if not searches:
+                del self.pending[match_id]
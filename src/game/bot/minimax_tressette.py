@@ -1,3 +1,502 @@
+import random
+import time
+
+from src.game.tressette_bitboard import (
+    CARD_BITS, CARD_STRENGTHS, CARD_VALUES, SUIT_MASKS, legal_moves, strongest_card, to_cards,
+)
+
+# Score of a won game, on top of the point difference, so any win beats any lost game.
+WIN_SCORE = 1000
+LAST_TRICK_BONUS = 3  # thirds of a point
+TT_SIZE_BITS = 16  # transposition table slots, 2 ** TT_SIZE_BITS
+BUDGET_CHECK_NODES = 128  # nodes between two looks at the clock
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+_MASK64 = (1 << 64) - 1
+_rng = random.Random(0x7E55E77E)
+HAND_KEYS = [[_rng.getrandbits(64) for _ in range(40)] for _ in range(2)]  # side -> card -> key
+LEAD_KEYS = [_rng.getrandbits(64) for _ in range(40)]  # card led, waiting for the reply
+SCORE_KEYS = [[_rng.getrandbits(64) for _ in range(256)] for _ in range(2)]  # side -> score -> key
+TO_MOVE_KEY = _rng.getrandbits(64)  # xor-ed in when side 1 is to move
+TARGET_KEYS = [_rng.getrandbits(64) for _ in range(256)]  # point_to_win -> key
+
+# card -> cards of its suit that take it, the weakest first
+STRONGER_IN_SUIT = [
+    sorted((other for other in range(card & 3, 40, 4) if CARD_STRENGTHS[other] > CARD_STRENGTHS[card]), key=CARD_STRENGTHS.__getitem__)
+    for card in range(40)
+]
+
+
+def ordered_moves(hand: int, opp_hand: int, lead_card: int, tt_move: int = -1) -> list[int]:
+    """Legal moves, best first for the cutoffs: the transposition table move, then winning leads
+    and captures by points, then the strongest leads and the cheapest discards."""
+    if lead_card == -1:
+        # strength of the opponent's best card per suit, -1 if void
+        tops = [
+            CARD_STRENGTHS[strongest_card(opp_hand & SUIT_MASKS[suit])] if opp_hand & SUIT_MASKS[suit] else -1
+            for suit in range(4)
+        ]
+
+        def order(card):
+            if CARD_STRENGTHS[card] > tops[card & 3]:
+                # the opponent cannot take it
+                return (0, -CARD_VALUES[card], -CARD_STRENGTHS[card])
+            return (1, -CARD_STRENGTHS[card], CARD_VALUES[card])
+
+        moves = sorted(to_cards(hand), key=order)
+    else:
+        lead_suit = lead_card & 3
+        lead_strength = CARD_STRENGTHS[lead_card]
+        trick_value = CARD_VALUES[lead_card]
+
+        def order(card):
+            if card & 3 == lead_suit and CARD_STRENGTHS[card] > lead_strength:
+                # capture: most points first, then the cheapest winner
+                return (0, -(trick_value + CARD_VALUES[card]), CARD_STRENGTHS[card])
+            # discard: cheapest first
+            return (1, CARD_VALUES[card], CARD_STRENGTHS[card])
+
+        moves = sorted(to_cards(legal_moves(hand, lead_suit)), key=order)
+    if tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+    return moves
+
+
+class TranspositionTable:
+    """Fixed size table of search results, indexed by the low bits of the Zobrist key and replaced
+    on collision. Keys cover both hands, scores, the card led and the remaining draw order, so
+    a table can be kept across moves, matches and bots."""
+    def __init__(self, size_bits: int = TT_SIZE_BITS):
+        self.mask = (1 << size_bits) - 1
+        self.slots: list = [None] * (1 << size_bits)  # (key, depth, flag, value, move)
+
+    def get(self, key):
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def put(self, key, depth, flag, value, move):
+        self.slots[key & self.mask] = (key, depth, flag, value, move)
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+
+
+shared_table = TranspositionTable()
+
+
+class SearchBudgetExceeded(Exception):
+    pass
+
+
+class AlphaBetaSearch:
+    """Alpha-beta search of a solo tressette round, side 0 is the bot.
+
+    The position is updated in place by make/unmake, along with its Zobrist key. Depth counts
+    tricks, as in the original minimax: the search stops after `depth` tricks and scores the
+    position by the point difference.
+    """
+    def __init__(self, hands, scores, draws, point_to_win, table: TranspositionTable):
+        self.hands = list(hands)  # side -> bitboard
+        self.scores = list(scores)  # side -> thirds of a point
+        self.draws = draws  # side -> cards drawn after each trick, in order
+        self.num_draws = min(len(draws[0]), len(draws[1]))
+        self.drawn = 0
+        self.point_to_win = point_to_win
+        self.table = table
+        self.lead_card = -1
+        self.to_move = 0
+        self.nodes = 0
+
+        # budget, see iterative_deepening
+        self.node_budget = None
+        self.deadline = None
+        self.next_check = BUDGET_CHECK_NODES
+
+        # key of the remaining draw order, so positions of different deals never match
+        self.draw_keys = [hash((tuple(draws[0][k:]), tuple(draws[1][k:]))) & _MASK64 for k in range(self.num_draws + 1)]
+        key = TARGET_KEYS[point_to_win & 255] ^ self.draw_keys[0]
+        for side in (0, 1):
+            for card in to_cards(self.hands[side]):
+                key ^= HAND_KEYS[side][card]
+            key ^= SCORE_KEYS[side][self.scores[side] & 255]
+        self.key = key
+
+    def set_lead(self, card):
+        """The opponent led `card`, the bot replies."""
+        self.lead_card = card
+        self.key ^= LEAD_KEYS[card]
+
+    def best_move(self, depth: int) -> tuple[int, int]:
+        """(card, value) for the bot, searching `depth` tricks."""
+        value = self._search(depth, -WIN_SCORE * 2, WIN_SCORE * 2)
+        entry = self.table.get(self.key)
+        move = entry[4] if entry is not None else -1
+        if move == -1:
+            move = self._ordered_moves(-1)[0]
+        return move, value
+
+    def iterative_deepening(self, max_depth: int, time_budget: float = None, node_budget: int = None) -> tuple[int, int]:
+        """(card, depth): searches 1, 2, ... max_depth tricks until the budget runs out, seconds of
+        wall clock and/or nodes, and returns the best card of the deepest search completed.
+        Each iteration orders its moves by the transposition table entries of the previous one."""
+        self.node_budget = node_budget
+        self.deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        self.next_check = BUDGET_CHECK_NODES
+        # deeper than the tricks left, the search sees the whole round
+        tricks_left = max(bin(self.hands[0]).count("1"), bin(self.hands[1]).count("1")) + self.num_draws
+        best_move, best_depth = -1, 0
+        for depth in range(1, min(max_depth, tricks_left) + 1):
+            try:
+                move, _ = self.best_move(depth)
+            except SearchBudgetExceeded:
+                break
+            best_move, best_depth = move, depth
+        if best_move == -1:
+            best_move = self._ordered_moves(-1)[0]
+        return best_move, best_depth
+
+    def _check_budget(self):
+        self.next_check = self.nodes + BUDGET_CHECK_NODES
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            raise SearchBudgetExceeded()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchBudgetExceeded()
+
+    def _evaluate(self, side):
+        return self.scores[side] - self.scores[1 - side]
+
+    def _ordered_moves(self, tt_move):
+        return ordered_moves(self.hands[self.to_move], self.hands[1 - self.to_move], self.lead_card, tt_move)
+
+    def _search(self, depth, alpha, beta):
+        """Value of the position for the side to move."""
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self._check_budget()
+        side = self.to_move
+        if self.lead_card == -1:
+            if not self.hands[0] and not self.hands[1]:
+                # end of round, partial points are dropped
+                return self.scores[side] // 3 * 3 - self.scores[1 - side] // 3 * 3
+            if depth <= 0:
+                return self._evaluate(side)
+
+        alpha_orig = alpha
+        key = self.key
+        tt_move = -1
+        entry = self.table.get(key)
+        if entry is not None:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                value = entry[3]
+                flag = entry[2]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value > alpha:
+                    alpha = value
+                elif flag == UPPER and value < beta:
+                    beta = value
+                if alpha >= beta:
+                    return value
+
+        best_value = -WIN_SCORE * 2
+        best_move = -1
+        for card in self._ordered_moves(tt_move):
+            value = self._play(card, depth, alpha, beta)
+            if value > best_value:
+                best_value = value
+                best_move = card
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.put(key, depth, flag, best_value, best_move)
+        return best_value
+
+    def _play(self, card, depth, alpha, beta):
+        """Plays card for the side to move and returns the value of the result for that side."""
+        side = self.to_move
+        other = 1 - side
+        bit = CARD_BITS[card]
+        hand_keys = HAND_KEYS[side]
+        self.hands[side] ^= bit
+        self.key ^= hand_keys[card]
+
+        lead_card = self.lead_card
+        if lead_card == -1:
+            # lead, the other side replies
+            self.lead_card = card
+            self.to_move = other
+            self.key ^= LEAD_KEYS[card] ^ TO_MOVE_KEY
+            value = -self._search(depth, -beta, -alpha)
+            self.key ^= LEAD_KEYS[card] ^ TO_MOVE_KEY
+            self.to_move = side
+            self.lead_card = -1
+        else:
+            value = self._resolve_trick(lead_card, card, depth, alpha, beta)
+
+        self.key ^= hand_keys[card]
+        self.hands[side] ^= bit
+        return value
+
+    def _resolve_trick(self, lead_card, card, depth, alpha, beta):
+        side = self.to_move  # replied with card
+        leader = 1 - side
+        if card & 3 == lead_card & 3 and CARD_STRENGTHS[card] > CARD_STRENGTHS[lead_card]:
+            winner = side
+        else:
+            winner = leader
+        points = CARD_VALUES[lead_card] + CARD_VALUES[card]
+
+        drawn = self.drawn
+        draw = drawn < self.num_draws
+        if not draw and not self.hands[0] and not self.hands[1]:
+            points += LAST_TRICK_BONUS
+
+        # make
+        old_key = self.key
+        old_score = self.scores[winner]
+        new_score = old_score + points
+        self.scores[winner] = new_score
+        key = old_key ^ LEAD_KEYS[lead_card] ^ SCORE_KEYS[winner][old_score & 255] ^ SCORE_KEYS[winner][new_score & 255]
+        if draw:
+            card0 = self.draws[0][drawn]
+            card1 = self.draws[1][drawn]
+            self.hands[0] |= CARD_BITS[card0]
+            self.hands[1] |= CARD_BITS[card1]
+            key ^= HAND_KEYS[0][card0] ^ HAND_KEYS[1][card1] ^ self.draw_keys[drawn] ^ self.draw_keys[drawn + 1]
+            self.drawn = drawn + 1
+        if winner != side:
+            key ^= TO_MOVE_KEY
+        self.key = key
+        self.lead_card = -1
+        self.to_move = winner
+
+        if new_score >= self.point_to_win:
+            # game over, the winner of the trick wins the game
+            value = WIN_SCORE + self._evaluate(winner)
+        elif winner == side:
+            value = self._search(depth - 1, alpha, beta)
+        else:
+            value = self._search(depth - 1, -beta, -alpha)
+
+        # unmake
+        self.to_move = side
+        self.lead_card = lead_card
+        if draw:
+            self.hands[0] ^= CARD_BITS[card0]
+            self.hands[1] ^= CARD_BITS[card1]
+            self.drawn = drawn
+        self.scores[winner] = old_score
+        self.key = old_key
+        return value if winner == side else -value
+
+
+class EndgameSolver:
+    """Exact solver of the last tricks of a solo round, once the draw pile is empty.
+
+    Both hands are known, so the rest of the round is a small perfect information game. Values are
+    relative to the current scores and to the side to move: a position is keyed by the hands of the
+    side to move and of the other, the card led, their scores modulo 3 (partial points dropped at
+    the end of the round) and the points each still needs to win the game, the same for every need
+    above the points left. Results are kept across calls, so both players of an endgame, move after
+    move, reuse each other's work. Of two cards next to each other in a suit, in the same hand and
+    worth the same, only the stronger is tried.
+
+    Positions with up to SMALL_CARDS cards each are kept in `table` for the process lifetime, larger
+    ones in `memo`, cleared when it grows past max_entries. Tabulating every small position up front
+    is out of reach (about 2e11 with 5 cards each), the table fills as endgames are played.
+    """
+    SMALL_CARDS = 5
+
+    def __init__(self, max_entries: int = 200_000, max_table_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.max_table_entries = max_table_entries
+        self.memo: dict = {}  # key -> (flag, value, move)
+        self.table: dict = {}
+        self.nodes = 0
+        self.node_budget = None
+        self.deadline = None
+        self.next_check = BUDGET_CHECK_NODES
+
+    def best_move(self, hands, scores, point_to_win, lead_card=-1, time_budget: float = None, node_budget: int = None) -> tuple[int, int]:
+        """(card, value) for side 0, to move; value is the final point difference, in thirds,
+        plus WIN_SCORE for a won game, as in AlphaBetaSearch. Raises SearchBudgetExceeded when the
+        budget runs out first, what was solved is kept for the next call."""
+        self.nodes = 0
+        self.node_budget = node_budget
+        self.deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        self.next_check = BUDGET_CHECK_NODES
+        self.hands = list(hands)
+        self.mods = [scores[0] % 3, scores[1] % 3]
+        self.needs = [point_to_win - scores[0], point_to_win - scores[1]]
+        self.lead_card = lead_card
+        self.to_move = 0
+        self.left = LAST_TRICK_BONUS + sum(CARD_VALUES[card] for card in to_cards(hands[0] | hands[1]))
+        if lead_card != -1:
+            self.left += CARD_VALUES[lead_card]
+        if len(self.memo) > self.max_entries:
+            self.memo.clear()
+        if len(self.table) > self.max_table_entries:
+            self.table.clear()
+        value = self._solve(-WIN_SCORE * 2, WIN_SCORE * 2)
+        entry = self._get(self._key())
+        move = entry[2] if entry is not None else ordered_moves(self.hands[0], self.hands[1], lead_card)[0]
+        return move, value + scores[0] - scores[1]
+
+    def _key(self):
+        side = self.to_move
+        other = 1 - side
+        left = self.left + 1
+        needs = self.needs
+        return (self.hands[side], self.hands[other], self.lead_card, self.mods[side], self.mods[other],
+                min(needs[side], left), min(needs[other], left))
+
+    def _check_budget(self):
+        self.next_check = self.nodes + BUDGET_CHECK_NODES
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            raise SearchBudgetExceeded()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchBudgetExceeded()
+
+    def _distinct_moves(self, tt_move):
+        """ordered_moves without the weaker of two equivalent cards."""
+        side = self.to_move
+        hand = self.hands[side]
+        in_play = hand | self.hands[1 - side]
+        if self.lead_card != -1:
+            in_play |= CARD_BITS[self.lead_card]
+        moves = []
+        for card in ordered_moves(hand, self.hands[1 - side], self.lead_card, tt_move):
+            for stronger in STRONGER_IN_SUIT[card]:
+                if in_play & CARD_BITS[stronger]:
+                    if hand & CARD_BITS[stronger] and CARD_VALUES[stronger] == CARD_VALUES[card]:
+                        card = -1
+                    break
+            if card != -1:
+                moves.append(card)
+        return moves
+
+    def _get(self, key):
+        entry = self.table.get(key)
+        if entry is None:
+            entry = self.memo.get(key)
+        return entry
+
+    def _put(self, key, entry):
+        if bin(key[0]).count("1") <= self.SMALL_CARDS and bin(key[1]).count("1") <= self.SMALL_CARDS:
+            self.table[key] = entry
+        else:
+            self.memo[key] = entry
+
+    def _solve(self, alpha, beta):
+        """Value for the side to move, relative to the current scores."""
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self._check_budget()
+        side = self.to_move
+        key = self._key()
+        entry = self._get(key)
+        tt_move = -1
+        if entry is not None:
+            flag, value, tt_move = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER and value > alpha:
+                alpha = value
+            elif flag == UPPER and value < beta:
+                beta = value
+            if alpha >= beta:
+                return value
+
+        alpha_orig = alpha
+        best_value = -WIN_SCORE * 2
+        best_move = -1
+        hands = self.hands
+        for card in self._distinct_moves(tt_move):
+            hands[side] ^= CARD_BITS[card]
+            if self.lead_card == -1:
+                self.lead_card = card
+                self.to_move = 1 - side
+                value = -self._solve(-beta, -alpha)
+                self.to_move = side
+                self.lead_card = -1
+            else:
+                value = self._resolve_trick(card, alpha, beta)
+            hands[side] ^= CARD_BITS[card]
+
+            if value > best_value:
+                best_value = value
+                best_move = card
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._put(key, (flag, best_value, best_move))
+        return best_value
+
+    def _resolve_trick(self, card, alpha, beta):
+        side = self.to_move  # replied with card
+        lead_card = self.lead_card
+        if card & 3 == lead_card & 3 and CARD_STRENGTHS[card] > CARD_STRENGTHS[lead_card]:
+            winner = side
+        else:
+            winner = 1 - side
+        points = CARD_VALUES[lead_card] + CARD_VALUES[card]
+        hands = self.hands
+        round_over = not hands[0] and not hands[1]
+        if round_over:
+            points += LAST_TRICK_BONUS
+
+        if points >= self.needs[winner]:
+            # game over
+            value = WIN_SCORE + points
+        else:
+            self.left -= points
+            old_mod = self.mods[winner]
+            mod = (old_mod + points) % 3
+            if round_over:
+                # partial points dropped: the winner loses its new remainder, the loser its old one
+                value = points - mod + self.mods[1 - winner]
+            else:
+                self.needs[winner] -= points
+                self.mods[winner] = mod
+                self.lead_card = -1
+                self.to_move = winner
+                if winner == side:
+                    child = self._solve(alpha - points, beta - points)
+                else:
+                    child = self._solve(-beta - points, -alpha - points)
+                value = child + points
+                self.to_move = side
+                self.lead_card = lead_card
+                self.mods[winner] = old_mod
+                self.needs[winner] += points
+            self.left += points
+        return value if winner == side else -value
+
+
+endgame_solver = EndgameSolver()
+
+
 def find_optimal_card(
     leading_player,
     bot_score,
@@ -6,279 +505,63 @@ def find_optimal_card(
     player_cards,
     next_bot_cards,
     next_player_cards,
-    get_suit,
-    get_score,
-    get_stronger_card,
     point_to_win,
     leading_card=None,
-    max_depth=2,  # <-- added depth parameter
+    max_depth=2,
+    table: TranspositionTable = None,
+    time_budget: float = None,
+    node_budget: int = None,
 ):
     """
-    A MINIMAX-style function with limited depth search.
-    
-    If we reach `depth == 0` (or run out of cards), 
-    we estimate a score instead of continuing recursion.
+    Best card for the bot, by alpha-beta search of the next `max_depth` tricks.
+
+    leading_player is "bot" when the bot leads, "player" when it replies to leading_card.
+    next_*_cards are the cards each side draws after each trick, in order. Results are kept in
+    `table`, by default one shared by all bots of the process.
+    With a time_budget (seconds) or node_budget the search deepens one trick at a time and stops
+    when the budget runs out, with the best card of the deepest search completed.
     """
+    if leading_player == "bot" or leading_card is None:
+        leading_card = -1
+    return search_move((
+        sum(CARD_BITS[c] for c in bot_cards), sum(CARD_BITS[c] for c in player_cards),
+        bytes(next_bot_cards), bytes(next_player_cards), bot_score, player_score, point_to_win,
+        leading_card, max_depth, time_budget, node_budget,
+    ), table)
 
-    # Simple memo to avoid recomputing states
-    memo = {}
-
-    def heuristic(bot_score, player_score, bot_cards, player_cards):
-        """
-        Simple heuristic used when we reach `depth == 0`.
-        For example, just compute:
-        - current bot_score
-        - plus sum of bot's card values
-        - minus player's potential if you want
-        Here we do a naive approach: bot_score - player_score.
-        """
-        return bot_score - player_score
-
-    def play_hand(
-        leading_player,
-        bot_score,
-        player_score,
-        bot_cards,
-        player_cards,
-        next_bot_cards,
-        next_player_cards,
-        leading_card,
-        depth,
-    ):
-        """
-        Return: (best_final_bot_score, best_final_player_score, best_move)
-        'best_move' is relevant only if 'leading_player' == 'bot' on this call.
-        """
-
-        # If out of cards, or if we've reached depth limit, use heuristic or final scores.
-        if not bot_cards and not player_cards:
-            # End of round, no further moves
-            return bot_score, player_score, None
-        
-        if depth <= 0:
-            # Return an approximate outcome, using a quick heuristic difference
-            # We only need to return a numeric measure, but for consistency we
-            # store that measure in bot_score, and keep player's score secondary.
-            h_value = heuristic(bot_score, player_score, bot_cards, player_cards)
-            # We'll interpret it as if final_bot_score = h_value. 
-            # The true player score is still unknown, so store partial data.
-            return h_value, player_score, None
-
-        memo_key = (
-            leading_player,
-            bot_score,
-            player_score,
-            tuple(bot_cards),
-            tuple(player_cards),
-            tuple(next_bot_cards),
-            tuple(next_player_cards),
-            leading_card,
-            depth,
-        )
-        if memo_key in memo:
-            return memo[memo_key]
-
-        # --- BOT LEADS ---
-        if leading_player == "bot":
-            best_final_bot_score = float("-inf")
-            best_final_player_score = float("-inf")
-            best_bot_move = None
-
-            for bot_card in bot_cards:
-                lead_suit = get_suit(bot_card)
-                # Player must follow suit if possible
-                valid_responses = [
-                    c for c in player_cards if get_suit(c) == lead_suit
-                ] or player_cards
-
-                # Player tries to minimize bot's final score
-                worst_bot_score_for_this_move = float("inf")
-                worst_player_score_for_this_move = float("-inf")
-
-                for p_card in valid_responses:
-                    # Calculate trick points
-                    points = get_score(bot_card) + get_score(p_card)
-                    if get_suit(bot_card) == get_suit(p_card):
-                        winner = get_stronger_card(bot_card, p_card)
-                        if winner == bot_card:
-                            new_bot_score = bot_score + points
-                            new_player_score = player_score
-                            next_leader = "bot"
-                        else:
-                            new_bot_score = bot_score
-                            new_player_score = player_score + points
-                            next_leader = "player"
-                    else:
-                        # Different suit => leading card (bot_card) wins
-                        new_bot_score = bot_score + points
-                        new_player_score = player_score
-                        next_leader = "bot"
-
-                    # Check immediate 21
-                    if new_bot_score >= point_to_win or new_player_score >= point_to_win:
-                        # If it's possibly last trick: last trick bonus
-                        if len(bot_cards) == 1 and len(player_cards) == 1:
-                            if next_leader == "bot":
-                                new_bot_score += 3
-                            else:
-                                new_player_score += 3
-                        final_bot_s, final_player_s = new_bot_score, new_player_score
-                    else:
-                        # Remove used cards
-                        new_bot_cards = [c for c in bot_cards if c != bot_card]
-                        new_player_cards = [c for c in player_cards if c != p_card]
-
-                        # Draw if possible
-                        if next_bot_cards and next_player_cards:
-                            new_bot_cards.append(next_bot_cards[0])
-                            new_player_cards.append(next_player_cards[0])
-                            nb_remaining = next_bot_cards[1:]
-                            np_remaining = next_player_cards[1:]
-                        else:
-                            nb_remaining = next_bot_cards
-                            np_remaining = next_player_cards
-
-                        # Recurse with depth-1
-                        final_bot_s, final_player_s, _ = play_hand(
-                            next_leader,
-                            new_bot_score,
-                            new_player_score,
-                            new_bot_cards,
-                            new_player_cards,
-                            nb_remaining,
-                            np_remaining,
-                            leading_card=None,  # new leader picks a card
-                            depth=depth - 1,
-                        )
-
-                    # The player wants to produce the worst outcome for the bot
-                    if final_bot_s < worst_bot_score_for_this_move:
-                        worst_bot_score_for_this_move = final_bot_s
-                        worst_player_score_for_this_move = final_player_s
-
-                # Bot tries to pick the move that yields the best final_bot_score
-                if worst_bot_score_for_this_move > best_final_bot_score:
-                    best_final_bot_score = worst_bot_score_for_this_move
-                    best_final_player_score = worst_player_score_for_this_move
-                    best_bot_move = bot_card
-
-            memo[memo_key] = (best_final_bot_score, best_final_player_score, best_bot_move)
-            return memo[memo_key]
-
-        # --- PLAYER LEADS ---
-        else:
-            # If leading_card is None, the player picks a lead from their hand.
-            if leading_card is None:
-                # Player tries to *minimize* bot's final outcome
-                worst_bot_score = float("inf")
-                worst_player_score = float("-inf")
-                # The "best_move" concept only applies to bot leading,
-                # so we set it to None here
-                best_bot_move = None
-
-                for p_card in player_cards:
-                    new_bot_s, new_player_s, _ = play_hand(
-                        "player",
-                        bot_score,
-                        player_score,
-                        bot_cards,
-                        player_cards,
-                        next_bot_cards,
-                        next_player_cards,
-                        leading_card=p_card,  # The actual lead
-                        depth=depth,
-                    )
-
-                    if new_bot_s < worst_bot_score:
-                        worst_bot_score = new_bot_s
-                        worst_player_score = new_player_s
-
-                memo[memo_key] = (worst_bot_score, worst_player_score, best_bot_move)
-                return memo[memo_key]
 
-            else:
-                # leading_card is known
-                p_card = leading_card
-                lead_suit = get_suit(p_card)
-                # Bot must respond with same suit if possible
-                valid_bot_cards = [c for c in bot_cards if get_suit(c) == lead_suit] or bot_cards
-
-                best_final_bot_score = float("-inf")
-                best_final_player_score = float("-inf")
-                best_bot_move = None
-
-                for bot_card in valid_bot_cards:
-                    points = get_score(p_card) + get_score(bot_card)
-                    if get_suit(p_card) == get_suit(bot_card):
-                        winner = get_stronger_card(p_card, bot_card)
-                        if winner == bot_card:
-                            new_bot_score = bot_score + points
-                            new_player_score = player_score
-                            next_leader = "bot"
-                        else:
-                            new_bot_score = bot_score
-                            new_player_score = player_score + points
-                            next_leader = "player"
-                    else:
-                        # Player's card automatically wins
-                        new_bot_score = bot_score
-                        new_player_score = player_score + points
-                        next_leader = "player"
-
-                    if new_bot_score >= point_to_win or new_player_score >= point_to_win:
-                        if len(bot_cards) == 1 and len(player_cards) == 1:
-                            if next_leader == "bot":
-                                new_bot_score += 3
-                            else:
-                                new_player_score += 3
-                        final_bot_s, final_player_s = new_bot_score, new_player_score
-                    else:
-                        new_bot_cards = [c for c in bot_cards if c != bot_card]
-                        new_player_cards = [c for c in player_cards if c != p_card]
-
-                        # Draw
-                        if next_bot_cards and next_player_cards:
-                            new_bot_cards.append(next_bot_cards[0])
-                            new_player_cards.append(next_player_cards[0])
-                            nb_remaining = next_bot_cards[1:]
-                            np_remaining = next_player_cards[1:]
-                        else:
-                            nb_remaining = next_bot_cards
-                            np_remaining = next_player_cards
-
-                        final_bot_s, final_player_s, _ = play_hand(
-                            next_leader,
-                            new_bot_score,
-                            new_player_score,
-                            new_bot_cards,
-                            new_player_cards,
-                            nb_remaining,
-                            np_remaining,
-                            leading_card=None,
-                            depth=depth - 1,
-                        )
-
-                    # From the bot’s perspective, we want to maximize final_bot_s
-                    if final_bot_s > best_final_bot_score:
-                        best_final_bot_score = final_bot_s
-                        best_final_player_score = final_player_s
-                        best_bot_move = bot_card
-
-                memo[memo_key] = (best_final_bot_score, best_final_player_score, best_bot_move)
-                return memo[memo_key]
-
-    # Kick off the search
-    final_bot_score, final_player_score, bot_move = play_hand(
-        leading_player,
-        bot_score,
-        player_score,
-        bot_cards,
-        player_cards,
-        next_bot_cards,
-        next_player_cards,
-        leading_card,
-        depth=max_depth,
-    )
+def search_move(state: tuple, table: TranspositionTable = None) -> int:
+    """
+    Best card for the bot from a compact state, the entry point of bot pool workers.
 
-    # If leading_player=='bot', bot_move is what we choose to play right now.
-    return bot_move
+    state is (bot_hand, opp_hand, bot_draws, opp_draws, bot_score, opp_score, point_to_win,
+    leading_card, max_depth, time_budget, node_budget): hands as bitboards, draws as bytes of
+    card ids, leading_card -1 when the bot leads. Once the draw pile is empty the endgame solver
+    answers exactly, whatever the depth, unless the budget runs out first; the depth limited
+    search then gets what is left of the budget.
+    """
+    (bot_hand, opp_hand, bot_draws, opp_draws, bot_score, opp_score, point_to_win,
+     leading_card, max_depth, time_budget, node_budget) = state
+    if not bot_draws and not opp_draws:
+        try:
+            card, _ = endgame_solver.best_move(
+                (bot_hand, opp_hand), (bot_score, opp_score), point_to_win, leading_card, time_budget, node_budget,
+            )
+            return card
+        except SearchBudgetExceeded:
+            # too big to solve within the budget this time, the solver keeps its memo for the next move
+            if time_budget is not None:
+                time_budget = max(0.0, endgame_solver.deadline - time.perf_counter())
+            if node_budget is not None:
+                node_budget = max(0, node_budget - endgame_solver.nodes)
+    search = AlphaBetaSearch(
+        (bot_hand, opp_hand), (bot_score, opp_score), (bot_draws, opp_draws), point_to_win,
+        table if table is not None else shared_table,
+    )
+    if leading_card != -1:
+        search.set_lead(leading_card)
+    if time_budget is None and node_budget is None:
+        card, _ = search.best_move(max_depth)
+    else:
+        card, _ = search.iterative_deepening(max_depth, time_budget, node_budget)
+    return card
@@ -0,0 +1,147 @@
+"""Determinized Monte Carlo (PIMC) for solo tressette, from what the bot may see.
+
+The bot does not know the opponent's hand nor the draw order. pimc_move() samples deals of the
+hidden cards consistent with what was shown, plays every legal card against every deal with a
+cheap rollout policy to the end of the round, and picks the card with the best mean result.
+Deals are rows of NumPy arrays, all candidates times all samples roll out at once.
+"""
+import numpy as np
+
+from src.game.bot.minimax_tressette import LAST_TRICK_BONUS, WIN_SCORE
+from src.game.tressette_bitboard import FULL_DECK, NUM_CARDS, CARD_STRENGTHS, CARD_VALUES, legal_moves, to_cards
+
+STRENGTHS = np.array(CARD_STRENGTHS)
+VALUES = np.array(CARD_VALUES)
+SUITS = np.arange(NUM_CARDS) % 4
+SUIT_CARDS = SUITS[None, :] == np.arange(4)[:, None]  # suit -> cards of the suit
+
+# rollout policy: lead the cheapest card, take the trick with the weakest winner, else discard the cheapest
+CHEAPEST_PRIORITY = -(VALUES * 100 + STRENGTHS)
+WINNER_PRIORITY = 10_000 - STRENGTHS
+TIE_NOISE = 0.5  # random tie break between cards of the same priority
+
+
+def sample_deals(rng: np.random.Generator, unknown: np.ndarray, opp_hidden: int, void_suits: int, samples: int):
+    """(opp_cards, pile): for each sample the opponent's hidden cards, (samples, opp_hidden), and
+    the draw pile, (samples, rest), drawn from the unknown cards. The opponent gets no card of a
+    suit it showed it lacks: its hidden cards were all dealt before it showed it."""
+    keys = rng.random((samples, len(unknown)))
+    void = np.array([bool(void_suits >> suit & 1) for suit in SUITS[unknown]], dtype=bool)
+    keys[:, void] += 2  # taken last, only if the deal cannot be consistent
+    order = np.argsort(keys, axis=1)
+    opp_cards = unknown[order[:, :opp_hidden]]
+    pile = unknown[order[:, opp_hidden:]]
+    # the void cards were pushed back, shuffle the pile again
+    pile = np.take_along_axis(pile, np.argsort(rng.random(pile.shape), axis=1), axis=1)
+    return opp_cards, pile
+
+
+def _pick(priority: np.ndarray, allowed: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    scores = np.where(allowed, priority + rng.random(allowed.shape) * TIE_NOISE, -np.inf)
+    return np.argmax(scores, axis=1)
+
+
+def rollout(hands, pile, scores, leader, lead_card, first_card, point_to_win, rng) -> np.ndarray:
+    """Final point difference for side 0 of each row, plus WIN_SCORE for a won game, after playing
+    the round out with the rollout policy.
+
+    hands (rows, 2, 40) bool, pile (rows, cards) in draw order, scores (rows, 2) in thirds,
+    leader (rows,). In the first trick side 0 plays first_card (rows,), out of its hand already:
+    it leads when lead_card (rows,) is -1, else it replies to lead_card, led by side 1.
+    """
+    rows = np.arange(len(hands))
+    scores = scores.copy()
+    game_winner = np.full(len(hands), -1)
+    forced = first_card
+    num_draws = pile.shape[1] // 2
+
+    # every row holds as many cards as the others, all rows end the round together
+    for trick in range(NUM_CARDS // 2):
+        follower = 1 - leader
+        # lead
+        if forced is None:
+            if not hands[0].any():
+                break
+            lead_card = _pick(CHEAPEST_PRIORITY[None, :], hands[rows, leader], rng)
+            hands[rows, leader, lead_card] = False
+        elif lead_card[0] == -1:
+            lead_card = forced  # side 0 leads, its card is out of its hand already
+
+        # reply
+        follower_hand = hands[rows, follower]
+        lead_suit = SUITS[lead_card]
+        same_suit = follower_hand & SUIT_CARDS[lead_suit]
+        legal = np.where(same_suit.any(axis=1)[:, None], same_suit, follower_hand)
+        winning = same_suit & (STRENGTHS[None, :] > STRENGTHS[lead_card][:, None])
+        priority = np.where(winning, WINNER_PRIORITY[None, :], CHEAPEST_PRIORITY[None, :])
+        reply = _pick(priority, legal, rng)
+        if forced is not None:
+            reply = np.where(follower == 0, forced, reply)
+        hands[rows, follower, reply] = False
+        forced = None
+
+        # score
+        takes = (SUITS[reply] == lead_suit) & (STRENGTHS[reply] > STRENGTHS[lead_card])
+        winner = np.where(takes, follower, leader)
+        points = VALUES[lead_card] + VALUES[reply]
+        if trick < num_draws:
+            hands[rows, 0, pile[:, 2 * trick]] = True
+            hands[rows, 1, pile[:, 2 * trick + 1]] = True
+        else:
+            round_over = ~hands.any(axis=(1, 2))
+            points = points + np.where(round_over, LAST_TRICK_BONUS, 0)
+        scores[rows, winner] += points
+        reached = (game_winner == -1) & (scores[rows, winner] >= point_to_win)
+        game_winner = np.where(reached, winner, game_winner)
+
+        leader = winner
+
+    # partial points are dropped at the end of the round
+    diff = (scores[:, 0] // 3 - scores[:, 1] // 3) * 3
+    return diff + np.where(game_winner == 0, WIN_SCORE, 0) - np.where(game_winner == 1, WIN_SCORE, 0)
+
+
+def pimc_move(state: tuple) -> int:
+    """
+    Best card for the bot from what it may see, the entry point of bot pool workers.
+
+    state is (bot_hand, opp_shown, opp_hand_size, played_cards, opp_void_suits, lead_card,
+    bot_score, opp_score, point_to_win, samples, seed): bot_hand, opp_shown (cards of the
+    opponent's hand it has seen) and played_cards (this round, the card led included) as bitboards,
+    opp_void_suits with bit s set once the opponent did not follow suit s, lead_card -1 when the
+    bot leads.
+    """
+    (bot_hand, opp_shown, opp_hand_size, played_cards, opp_void_suits, lead_card,
+     bot_score, opp_score, point_to_win, samples, seed) = state
+    lead_suit = lead_card % 4 if lead_card != -1 else -1
+    candidates = to_cards(legal_moves(bot_hand, lead_suit))
+    if len(candidates) == 1:
+        return candidates[0]
+
+    rng = np.random.default_rng(seed)
+    unknown = np.array(to_cards(FULL_DECK & ~(bot_hand | opp_shown | played_cards)), dtype=np.int64)
+    opp_hidden = min(opp_hand_size - bin(opp_shown).count("1"), len(unknown))
+    opp_cards, pile = sample_deals(rng, unknown, opp_hidden, opp_void_suits, samples)
+
+    # one row per candidate and sample, the same deals for every candidate
+    num_rows = len(candidates) * samples
+    hands = np.zeros((samples, 2, NUM_CARDS), dtype=bool)
+    hands[:, 0, to_cards(bot_hand)] = True
+    hands[:, 1, to_cards(opp_shown)] = True
+    hands[np.arange(samples)[:, None], 1, opp_cards] = True
+    hands = np.tile(hands, (len(candidates), 1, 1))
+    first_card = np.repeat(np.array(candidates), samples)
+    hands[np.arange(num_rows), 0, first_card] = False
+
+    values = rollout(
+        hands,
+        np.tile(pile, (len(candidates), 1)),
+        np.tile(np.array([[bot_score, opp_score]]), (num_rows, 1)),
+        np.full(num_rows, 0 if lead_card == -1 else 1),
+        np.full(num_rows, lead_card),
+        first_card,
+        point_to_win,
+        rng,
+    )
+    means = values.reshape(len(candidates), samples).mean(axis=1)
+    return candidates[int(np.argmax(means))]
@@ -0,0 +1,100 @@
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+
+
+class RealClock:
+    """Wall clock time and timers of the running event loop."""
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def call_later(self, delay: float, callback, *args) -> asyncio.TimerHandle:
+        return asyncio.get_running_loop().call_later(delay, callback, *args)
+
+    async def sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
+class VirtualTimer:
+    __slots__ = ('when', 'callback', 'args', 'cancelled')
+
+    def __init__(self, when: float, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class VirtualClock:
+    """Clock for offline simulation: time only moves when run() jumps to the next timer.
+
+    run() waits until every task of the event loop is blocked, then fires the earliest timer at
+    its virtual time. Games with bots and delays of seconds run as fast as the CPU allows.
+    """
+    def __init__(self, start: float = None):
+        self._time = time.time() if start is None else start
+        self._timers: list[tuple[float, int, VirtualTimer]] = []
+        self._seq = itertools.count()
+        self.fired_count = 0
+
+    def time(self) -> float:
+        return self._time
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._time)
+
+    def call_later(self, delay: float, callback, *args) -> VirtualTimer:
+        timer = VirtualTimer(self._time + max(0.0, delay), callback, args)
+        heapq.heappush(self._timers, (timer.when, next(self._seq), timer))
+        return timer
+
+    async def sleep(self, delay: float):
+        future = asyncio.get_running_loop().create_future()
+        self.call_later(delay, lambda: future.done() or future.set_result(None))
+        await future
+
+    def pending_timers(self) -> int:
+        return sum(1 for _, _, timer in self._timers if not timer.cancelled)
+
+    async def _settle(self):
+        """Returns once no other task of the loop is ready to run."""
+        loop = asyncio.get_running_loop()
+        ready = getattr(loop, "_ready", None)
+        while True:
+            await asyncio.sleep(0)
+            if ready is None:
+                # no access to the ready queue, give the other tasks a fixed number of passes
+                for _ in range(64):
+                    await asyncio.sleep(0)
+                return
+            if not ready:
+                return
+
+    async def run(self, until: float = None, stop=None):
+        """Fires timers in time order until there are none left, virtual time reaches
+        `until`, or stop() returns True."""
+        while True:
+            await self._settle()
+            if stop is not None and stop():
+                return
+            while self._timers and self._timers[0][2].cancelled:
+                heapq.heappop(self._timers)
+            if not self._timers:
+                return
+            when = self._timers[0][0]
+            if until is not None and when > until:
+                self._time = until
+                return
+            _, _, timer = heapq.heappop(self._timers)
+            if when > self._time:
+                self._time = when
+            self.fired_count += 1
+            timer.callback(*timer.args)
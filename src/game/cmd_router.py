@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+import traceback
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("cmd_router")  # Name your logger
+
+
+class CmdRoute:
+    __slots__ = ('cmd_id', 'handler', 'pkt_type', 'semaphore', 'count', 'errors', 'in_flight', 'total_time', 'max_time')
+
+    def __init__(self, cmd_id: int, handler, pkt_type, max_concurrency: int):
+        self.cmd_id = cmd_id
+        self.handler = handler
+        self.pkt_type = pkt_type
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+        # timing
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class CmdRouter:
+    """Maps a cmd id to the one handler that owns it.
+
+    Modules register their cmds with register(). A handler is called as handler(uid, pkg) with the
+    payload already parsed into pkt_type, or as handler(uid) when the cmd has no payload.
+    """
+    def __init__(self):
+        self.routes: dict[int, CmdRoute] = {}
+
+    def register(self, cmd_id: int, handler, pkt_type=None, max_concurrency: int = 0):
+        """max_concurrency > 0 limits how many packets of this cmd are handled at the same time."""
+        if cmd_id in self.routes:
+            raise ValueError(f"Cmd {cmd_id} is already registered")
+        self.routes[cmd_id] = CmdRoute(cmd_id, handler, pkt_type, max_concurrency)
+
+    async def dispatch(self, uid: int, cmd_id: int, payload: bytes):
+        route = self.routes.get(cmd_id)
+        if route is None:
+            logger.info(f"No handler for cmd_id={cmd_id}")
+            return
+
+        if route.pkt_type is not None:
+            pkg = route.pkt_type()
+            pkg.ParseFromString(payload)
+            args = (uid, pkg)
+        else:
+            args = (uid,)
+
+        if route.semaphore is not None:
+            async with route.semaphore:
+                await self._call(route, args)
+        else:
+            await self._call(route, args)
+
+    async def _call(self, route: CmdRoute, args):
+        route.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await route.handler(*args)
+        except Exception as e:
+            route.errors += 1
+            logger.info(f"Error handling cmd_id={route.cmd_id}: {e}")
+            traceback.print_exc()
+        finally:
+            elapsed = time.perf_counter() - start
+            route.in_flight -= 1
+            route.count += 1
+            route.total_time += elapsed
+            if elapsed > route.max_time:
+                route.max_time = elapsed
+
+    def get_stats(self) -> dict:
+        """Per cmd counters, only cmds that were received at least once."""
+        stats = {}
+        for cmd_id, route in self.routes.items():
+            if route.count == 0 and route.in_flight == 0:
+                continue
+            stats[cmd_id] = {
+                "count": route.count,
+                "errors": route.errors,
+                "in_flight": route.in_flight,
+                "avg_ms": route.total_time / route.count * 1000 if route.count else 0,
+                "max_ms": route.max_time * 1000,
+            }
+        return stats
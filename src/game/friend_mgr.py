@@ -26,9 +26,7 @@ class FriendMgr:
         return []
     
 
-    async def remove_friend(self, uid: int, payload):
-        pkg = packet_pb2.RemoveFriend()
-        pkg.ParseFromString(payload)
+    async def remove_friend(self, uid: int, pkg):
         friend_id = pkg.uid
         async with PsqlOrm.get().session() as session:
             result = await session.execute(
@@ -47,10 +45,8 @@ class FriendMgr:
     async def get_friend_requests(self, uid: int) -> list:
         return []
     
-    async def accept_friend_request(self, uid: int, payload):
+    async def accept_friend_request(self, uid: int, pkg):
         print(f"User {uid} accept friend request")
-        pkg = packet_pb2.RequestFriendAccept()
-        pkg.ParseFromString(payload)
         friend_id = pkg.uid
         action = pkg.action
         async with PsqlOrm.get().session() as session:
@@ -80,24 +76,12 @@ class FriendMgr:
             accepted_pkg.gold = user_info.gold
             await game_vars.get_game_client().send_packet(friend_id, CMDs.NEW_FRIEND_ACCEPTED, accepted_pkg)
 
-    async def on_receive_packet(self, uid: int, cmd_id: int, payload):
-        match cmd_id:
-            case CMDs.SEARCH_FRIEND:
-                await self._handle_search_friend(uid, payload)
-                pass
-            case CMDs.ADD_FRIEND:
-                await self._handle_add_friend(uid, payload)
-            
-            case CMDs.ACCEPT_FRIEND_REQUEST:
-                await self.accept_friend_request(uid, payload)
-                pass
-
-            case CMDs.REMOVE_FRIEND:
-                await self.remove_friend(uid, payload)
-                pass
-            case CMDs.FRIEND_LIST:
-                await self.send_list_friends(uid)
-                pass
+    def register_cmds(self, router):
+        router.register(CMDs.SEARCH_FRIEND, self._handle_search_friend, packet_pb2.SearchFriend, max_concurrency=8)
+        router.register(CMDs.ADD_FRIEND, self._handle_add_friend, packet_pb2.AddFriend)
+        router.register(CMDs.ACCEPT_FRIEND_REQUEST, self.accept_friend_request, packet_pb2.RequestFriendAccept)
+        router.register(CMDs.REMOVE_FRIEND, self.remove_friend, packet_pb2.RemoveFriend)
+        router.register(CMDs.FRIEND_LIST, self.send_list_friends)
 
     async def send_list_friends(self, uid: int, send_recommend_if_empty=False):
         friend_ids = await self.get_friends(uid)
@@ -143,9 +127,7 @@ class FriendMgr:
         await game_vars.get_game_client().send_packet(uid, CMDs.FRIEND_LIST, pkg)
                 
 
-    async def _handle_search_friend(self, uid: int, payload):
-        pkg = packet_pb2.SearchFriend()
-        pkg.ParseFromString(payload)
+    async def _handle_search_friend(self, uid: int, pkg):
 
         search_uid = pkg.uid
         print(f"User {uid} search friend {search_uid}")
@@ -222,14 +204,12 @@ class FriendMgr:
 
         await game_vars.get_game_client().send_packet(uid, CMDs.FRIEND_REQUESTS, pkg)
 
-    async def _handle_add_friend(self, uid: int, payload):
+    async def _handle_add_friend(self, uid: int, pkg):
         count_friends = await self._count_friends(uid)
 
         if count_friends >= MAX_FRIENDS_NUMBER:
             print(f"User {uid} reach max friends number")
             return
-        pkg = packet_pb2.AddFriend()
-        pkg.ParseFromString(payload)
 
         friend_uid = pkg.uid
         print(f"User {uid} add friend {friend_uid}")
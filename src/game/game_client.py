@@ -8,6 +8,7 @@ from src.constants import *
 from src.game.game_vars import game_vars
 from src.game.users_info_mgr import users_info_mgr
 from src.game.cmds import CMDs
+from src.game.cmd_router import CmdRouter
 from src.game.tressette_config import config as tress_config
 from src.base.network.connection_manager import connection_manager
 logging.basicConfig(
@@ -18,25 +19,23 @@ logger = logging.getLogger("game_client")  # Name your logger
 
 class GameClient:
     def __init__(self):
-        pass
+        self.router = CmdRouter()
+        self.router.register(CMDs.LOGOUT, self._handle_user_logout)
+        self.router.register(CMDs.DELETE_ACCOUNT, self._handle_delete_account)
+        payment_mgr.register_cmds(self.router)
+        game_vars.get_game_mgr().register_cmds(self.router)
+        game_vars.get_sette_mezzo_mgr().register_cmds(self.router)
+        users_info_mgr.register_cmds(self.router)
+        game_vars.get_friend_mgr().register_cmds(self.router)
+        game_vars.get_customer_service_mgr().register_cmds(self.router)
+        game_vars.get_ranking_mgr().register_cmds(self.router)
+        game_vars.get_ads_mgr().register_cmds(self.router)
 
     async def on_receive_packet(self, uid, cmd_id, payload):
-        if cmd_id >= 4000 and cmd_id < 5000:
-            # PAYMENT
-            await payment_mgr.on_receive_packet(uid, cmd_id, payload)
-            return 
-        match cmd_id:
-            case CMDs.LOGOUT:
-                await self._handle_user_logout(uid)
-            case CMDs.DELETE_ACCOUNT:
-                await self._handle_delete_account(uid)
-            case _:
-                await game_vars.get_game_mgr().on_receive_packet(uid, cmd_id, payload)
-                await users_info_mgr.on_receive_packet(uid, cmd_id, payload)
-                await game_vars.get_friend_mgr().on_receive_packet(uid, cmd_id, payload)
-                await game_vars.get_customer_service_mgr().on_receive_packet(uid, cmd_id, payload)
-                await game_vars.get_ranking_mgr().on_receive_packet(uid, cmd_id, payload)
-                await game_vars.get_ads_mgr().on_receive_packet(uid, cmd_id, payload)
+        await self.router.dispatch(uid, cmd_id, payload)
+
+    def get_cmd_stats(self) -> dict:
+        return self.router.get_stats()
 
     async def user_login_success(self, uid, device_model, platform, device_country, app_version_code):
         user_info = await users_info_mgr.get_user_info(uid)
@@ -113,6 +112,14 @@ class GameClient:
     async def send_packet(self, uid, cmd_id, pkt):
         await connection_manager.send_packet_to_user(uid=uid, cmd_id=cmd_id, payload=pkt.SerializeToString())
 
+    async def send_payload(self, uid, cmd_id, payload: bytes):
+        """Packet serialized beforehand, e.g. kept in a cache."""
+        await connection_manager.send_packet_to_user(uid=uid, cmd_id=cmd_id, payload=payload)
+
+    async def broadcast_packet(self, uids, cmd_id, pkt, ignore_uids=()):
+        """Same packet to several users, serialized once."""
+        connection_manager.broadcast_packet_to_users(uids, cmd_id, pkt.SerializeToString(), ignore_uids)
+
      
     async def _handle_delete_account(self, uid):
         user_info = await users_info_mgr.get_user_info(uid)
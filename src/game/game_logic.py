@@ -1,16 +1,15 @@
-from src.game.tressette_constants import *
+from src.game.tressette_bitboard import CARD_STRENGTHS, CARD_VALUES, SUIT_MASKS, strongest_card, to_cards
 
-def pick_winning_card_first(A, B):
-    A_sorted = sorted(A, key=lambda card: TRESSETTE_CARD_STRONGS[card // 4])  # Sort A by strength
+def pick_winning_card_first(A: int, B: int):
+    # A and B are hands as bitboards
+    A_sorted = sorted(to_cards(A), key=CARD_STRENGTHS.__getitem__)  # Sort A by strength
 
     for card in A_sorted:
         suit = card % 4  # Get suit of current card
-        B_suit_cards = [b for b in B if b % 4 == suit]  # Get B's cards of same suit
-        
-        if not B_suit_cards or all(TRESSETTE_CARD_STRONGS[card // 4] > TRESSETTE_CARD_STRONGS[b // 4] for b in B_suit_cards):
+        B_suit_cards = B & SUIT_MASKS[suit]  # Get B's cards of same suit
+
+        if not B_suit_cards or CARD_STRENGTHS[card] > CARD_STRENGTHS[strongest_card(B_suit_cards)]:
             # If no matching suit in B, or this card beats all matching ones
             return card
 
-    return min(A, key=lambda c: (TRESSETTE_CARD_VALUES[c], TRESSETTE_CARD_STRONGS[c // 4]))
-
-
+    return min(to_cards(A), key=lambda c: (CARD_VALUES[c], CARD_STRENGTHS[c]))
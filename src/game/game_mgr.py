@@ -11,44 +11,29 @@ class GameMgr:
     def on_join_match(self, uid: int, match_id: int):
         pass
 
-    async def on_receive_packet(self, uid: int, cmd_id: int, payload):
-        if cmd_id >= 10000 and cmd_id < 11000: # sette mezzo game
-            await game_vars.get_sette_mezzo_mgr().on_receive_packet(uid, cmd_id, payload)
-            return
-        
-        match cmd_id:
-            case CMDs.QUICK_PLAY:
-                await game_vars.get_match_mgr().receive_quick_play(uid, payload)
-            case CMDs.REGISTER_LEAVE_GAME:
-                await game_vars.get_match_mgr().handle_register_leave_match(uid, payload)
-            case CMDs.PLAY_CARD:
-                await game_vars.get_match_mgr().user_play_card(uid, payload)
-            case CMDs.NEW_INGAME_CHAT_MESSAGE:
-                await game_vars.get_ingame_chat_mgr().on_chat_message(uid, payload)
-            case CMDs.CHAT_EMOTICON:
-                await game_vars.get_ingame_chat_mgr().on_chat_emoticon(uid, payload)
-            case CMDs.TABLE_LIST:
-                await game_vars.get_match_mgr().receive_request_table_list(uid)
-            case CMDs.CREATE_TABLE:
-                await game_vars.get_match_mgr().received_create_table(uid, payload)
-            case CMDs.JOIN_TABLE_BY_ID:
-                print("JOIN_TABLE_BY_ID")
-                await game_vars.get_match_mgr().receive_user_join_match(uid, payload)
-            case CMDs.CLAIM_SUPPORT:
-                await self._claim_support(uid)
-            case CMDs.INVITE_FRIEND_PLAY:
-                await self._receive_invite_friend_play(uid, payload)
-            case CMDs.CHEAT_ADD_BOT:
-                mat = await game_vars.get_match_mgr().get_match_of_user(uid)
-                if mat:
-                    await mat.cheat_add_bot()
-            case CMDs.GAME_ACTION_NAPOLI:
-                await game_vars.get_match_mgr().receive_game_action_napoli(uid, payload)
-            case CMDs.USER_RETURN_TO_TABLE:
-                await game_vars.get_match_mgr().receive_user_return_to_table(uid)
-            case CMDs.USER_MATCH_READY:
-                await game_vars.get_match_mgr().user_ready(uid)
-     
+    def register_cmds(self, router):
+        match_mgr = game_vars.get_match_mgr()
+        chat_mgr = game_vars.get_ingame_chat_mgr()
+        router.register(CMDs.QUICK_PLAY, match_mgr.receive_quick_play)
+        router.register(CMDs.REGISTER_LEAVE_GAME, match_mgr.handle_register_leave_match, packet_pb2.RegisterLeaveGame)
+        router.register(CMDs.PLAY_CARD, match_mgr.user_play_card, packet_pb2.PlayCard)
+        router.register(CMDs.NEW_INGAME_CHAT_MESSAGE, chat_mgr.on_chat_message, packet_pb2.InGameChatMessage)
+        router.register(CMDs.CHAT_EMOTICON, chat_mgr.on_chat_emoticon, packet_pb2.InGameChatEmoticon)
+        router.register(CMDs.TABLE_LIST, match_mgr.receive_request_table_list, max_concurrency=8)
+        router.register(CMDs.CREATE_TABLE, match_mgr.received_create_table, packet_pb2.CreateTable)
+        router.register(CMDs.JOIN_TABLE_BY_ID, match_mgr.receive_user_join_match, packet_pb2.JoinTableById)
+        router.register(CMDs.CLAIM_SUPPORT, self._claim_support)
+        router.register(CMDs.INVITE_FRIEND_PLAY, self._receive_invite_friend_play, packet_pb2.InviteFriendPlay)
+        router.register(CMDs.CHEAT_ADD_BOT, self._cheat_add_bot)
+        router.register(CMDs.GAME_ACTION_NAPOLI, match_mgr.receive_game_action_napoli)
+        router.register(CMDs.USER_RETURN_TO_TABLE, match_mgr.receive_user_return_to_table)
+        router.register(CMDs.USER_MATCH_READY, match_mgr.user_ready)
+
+    async def _cheat_add_bot(self, uid: int):
+        mat = await game_vars.get_match_mgr().get_match_of_user(uid)
+        if mat:
+            mat.mailbox.post(mat.cheat_add_bot)
+
     async def on_user_login(self, uid: int):
         # wait for 1 second, to let user handle login process
         await asyncio.sleep(1)
@@ -56,11 +41,17 @@ class GameMgr:
         if is_is_match:
             print(f"User {uid} is in a match, reconnecting")
             match = await game_vars.get_match_mgr().get_match_of_user(uid)
-            await match.user_reconnect(uid)
+            await match.mailbox.call(match.user_reconnect, uid)
             return
     async def on_user_disconnect(self, uid: int):
         await game_vars.get_match_mgr().user_disconnect(uid)
 
+    async def on_user_resume(self, uid: int):
+        # the replayed packets brought the client up to date, only stop auto playing for the user
+        match = await game_vars.get_match_mgr().get_match_of_user(uid)
+        if match:
+            match.mailbox.post(match.user_reconnect, uid, False)
+
     def check_can_receive_support(self, timestamp: int) -> bool:
         # Convert the given timestamp to a date
         last_support_date = datetime.fromtimestamp(timestamp).date()
@@ -98,9 +89,7 @@ class GameMgr:
         pkg.support_amount = GOLD_SUPPORT
         await game_vars.get_game_client().send_packet(uid, CMDs.CLAIM_SUPPORT, pkg)
 
-    async def _receive_invite_friend_play(self, uid: int, payload):
-        pkg = packet_pb2.InviteFriendPlay()
-        pkg.ParseFromString(payload)
+    async def _receive_invite_friend_play(self, uid: int, pkg):
         friend_uid = pkg.uid
         # get current room of user
         match = await game_vars.get_match_mgr().get_match_of_user(uid)
@@ -18,6 +18,8 @@ class GameVars:
         self.mission_mgr = None
         self.ranking_mgr = None
         self.ads_mgr = None
+        self.bot_pool = None
+        self.clock = None
 
     def get_game_client(self):
         if self.game_client is None:
@@ -111,6 +113,23 @@ class GameVars:
             self.ads_mgr = AdsMgr()
         return self.ads_mgr
     
+    def get_bot_pool(self):
+        if self.bot_pool is None:
+            from src.config.settings import settings
+            from src.game.bot.bot_pool import BotPool
+            self.bot_pool = BotPool(settings.BOT_POOL_WORKERS, settings.BOT_POOL_MAX_PENDING)
+        return self.bot_pool
+
+    def get_clock(self):
+        if self.clock is None:
+            from src.game.clock import RealClock
+            self.clock = RealClock()
+        return self.clock
+
+    def set_clock(self, clock):
+        """Replaces the clock of the match engine, e.g. with a VirtualClock for simulation."""
+        self.clock = clock
+    
     # this function is called when the server starts
     async def init_game_vars(self):
         await self.get_ranking_mgr().init_season()
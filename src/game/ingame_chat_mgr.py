@@ -7,10 +7,8 @@ from src.constants import CHAT_EMO_IDS
 
 class InGameChatMgr:
 
-    async def on_chat_message(self, uid, payload):
+    async def on_chat_message(self, uid, pkg):
         try:
-            pkg = packet_pb2.InGameChatMessage()
-            pkg.ParseFromString(payload)
             message = pkg.chat_message
             print(f"User {uid} sent message: {message}")    
             # get the room and broadcast the message
@@ -25,10 +23,8 @@ class InGameChatMgr:
             print(f"Error on_chat_message: {e}")
 
 
-    async def on_chat_emoticon(self, uid, payload):
+    async def on_chat_emoticon(self, uid, pkg):
         try:
-            pkg = packet_pb2.InGameChatEmoticon()
-            pkg.ParseFromString(payload)
             emoticon = pkg.emoticon
             # check emoticon
             if emoticon not in CHAT_EMO_IDS:
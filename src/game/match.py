@@ -12,10 +12,15 @@ from src.base.network.packets import packet_pb2
 from src.config.settings import settings
 from src.constants import *
 from src.game import game_logic
-from src.game.bot.minimax_tressette import find_optimal_card
+from src.game import tressette_bitboard as bitboard
+from src.game.bot.minimax_tressette import search_move
+from src.game.bot.pimc_tressette import pimc_move
 from src.game.users_info_mgr import users_info_mgr
 from src.game.cmds import CMDs
 from src.game.game_vars import game_vars
+from src.game.match_mailbox import MatchMailbox
+from src.game.match_flow import MatchFlow, get_timing
+from src.game.settlement import Settlement
 from datetime import datetime, timedelta
 from src.game.tressette_config import config as tress_config
 import uuid
@@ -49,8 +54,8 @@ SERVER_SCORE_ONE_POINT = 3
 TIME_AUTO_PLAY = tress_config.get("time_thinking_in_turn")
 TIME_AUTO_PLAY_SEVERE = min(3, TIME_AUTO_PLAY)
 TAX_PERCENT = tress_config.get("tax_percent")
+BOT_SEARCH = tress_config.get("bot_search", {})  # bot_model -> search depth and budgets
 TIME_START_TO_DEAL = 3.5 # seconds
-TIME_DRAW_CARD = 3.5 # seconds
 TIME_MATCH_MAXIMUM = 60 * 60 # 1 hour -> after this match will be destroyed
 SCORE_WIN_GAME_ELEVEN = 11 * SERVER_SCORE_ONE_POINT
 SCORE_WIN_GAME_TWENTY_ONE = 21 * SERVER_SCORE_ONE_POINT
@@ -62,6 +67,16 @@ BOT_MODEL_MEDIUM = 1
 BOT_MODEL_ADVANCE = 2
 BOT_MODEL_SUPER = 3
 BOT_MODEL_SUPER_V2 = 4
+BOT_MODEL_PIMC = 5
+
+
+# state -> states the match can move to
+TRESSETTE_TRANSITIONS = {
+    MatchState.WAITING: (MatchState.PREPARING_START,),
+    MatchState.PREPARING_START: (MatchState.WAITING, MatchState.PLAYING),
+    MatchState.PLAYING: (MatchState.ENDED,),
+    MatchState.ENDED: (MatchState.WAITING,),
+}
 
 
 class LeaveMatchErrors(Enum):
@@ -76,12 +91,17 @@ logging.basicConfig(
 logger = logging.getLogger("game_match")  # Name your logger
 
 class MatchPlayer:
+    __slots__ = ('uid', 'name', 'avatar', 'gold', 'cards', 'hand', 'points', 'score_last_trick', 'team_id', 'is_bot',
+                 'match_mgr', 'gold_change', 'is_in_game', 'bet', 'auto_play_count', 'is_auto_play', 'napoli_claimed',
+                 'is_ready', 'shown_cards', 'void_suits')
+
     def __init__(self, uid: int, match_mgr: "Match"):
         self.uid = uid
         self.name = ""
         self.avatar = ""
         self.gold = 0
-        self.cards = [] # id of cards
+        self.cards = [] # id of cards, sette mezzo
+        self.hand = 0 # tressette cards, bit i set = holds card i, see tressette_bitboard
         self.points = 0
         self.score_last_trick = 0
         self.team_id = -1
@@ -90,10 +110,18 @@ class MatchPlayer:
         self.gold_change = 0
         self.is_in_game = False
         self.bet = 0
+        self.auto_play_count = 0 # consecutive auto play count
+        self.is_auto_play = False # auto play, server will not wait for this player
+        self.napoli_claimed = False
+        self.is_ready = False
+        # what the other players saw of the hand this round, for fair bots
+        self.shown_cards = 0 # cards of the hand they have seen: drawn, napoli
+        self.void_suits = 0 # bit s set: did not follow suit s
 
     
     def reset_game(self):
         self.cards.clear()
+        self.hand = 0
         self.points = 0
         self.score_last_trick = 0
 
@@ -101,16 +129,10 @@ class MatchPlayer:
         pass
 
     async def auto_play(self):
-        if len(self.cards) == 0:
+        if not self.hand:
             return
-        card_id = self.cards[0]
-        cur_hand_suit = self.match_mgr.hand_suit
-        if cur_hand_suit != -1:
-            # find suitable card
-            for card in self.cards:
-                if card % 4 == cur_hand_suit:
-                    card_id = card
-                    break
+        # any card that follows the suit of the hand, the hand has no order to pick the first of
+        card_id = random.choice(bitboard.to_cards(bitboard.legal_moves(self.hand, self.match_mgr.hand_suit)))
 
         await self.match_mgr._play_card(self.uid, card_id=card_id, auto=True)
     
@@ -118,6 +140,7 @@ class MatchPlayer:
         pass
 
 class MatchBot(MatchPlayer):
+    __slots__ = ()
     bot_model = 'C'
     def __init__(self, uid, match_mgr):
         super().__init__(uid, match_mgr)
@@ -126,12 +149,14 @@ class MatchBot(MatchPlayer):
     async def on_turn(self):
         print('Bot on turn')
         # play a card
-        if len(self.cards) == 0:
+        if not self.hand:
             return
         card_id = self.get_card_to_play()
         # wait for 1 second
         time_thinking = random.randrange(1, 3)
-        await asyncio.sleep(time_thinking)
+        self.match_mgr.mailbox.post_after(time_thinking, self._play_turn, card_id)
+
+    async def _play_turn(self, card_id):
         await self.match_mgr._play_card(self.uid, card_id=card_id, auto=False)
 
         # send back to client current cards for testing
@@ -141,55 +166,49 @@ class MatchBot(MatchPlayer):
     async def _send_cheat_view_card(self):
         print('Send cheat view card')
         pkg = packet_pb2.CheatViewCardBot()
-        pkg.cards.extend(self.cards)
+        pkg.cards.extend(bitboard.to_cards(self.hand))
         await self.match_mgr.broadcast_pkg(CMDs.CHEAT_VIEW_CARD_BOT, pkg)
     
     def get_card_to_play(self) -> int:
-        card_id = self.cards[0]
+        return random.choice(bitboard.to_cards(bitboard.legal_moves(self.hand, self.match_mgr.hand_suit)))
+
+    def _get_card_to_follow(self, cards_on_table) -> int:
+        strong_card = max(cards_on_table, key=bitboard.CARD_STRENGTHS.__getitem__)
+
         cur_hand_suit = self.match_mgr.hand_suit
-        if cur_hand_suit != -1:
-            # find suitable card
-            for card in self.cards:
-                if card % 4 == cur_hand_suit:
-                    card_id = card
-                    break
-        return card_id
+        cards_valid = bitboard.to_cards(self.hand & bitboard.SUIT_MASKS[cur_hand_suit])
+
+        if not cards_valid:
+            return bitboard.cheapest_card(self.hand)
+
+        # Find the smallest valid card
+        min_card = min(cards_valid, key=bitboard.CARD_VALUES.__getitem__)
+
+        # Find the smallest card that can win
+        winning_cards = [card for card in cards_valid if bitboard.beats(card, strong_card)]
+
+        return min(winning_cards, key=bitboard.CARD_VALUES.__getitem__) if winning_cards else min_card
     
     def random_chat(self):
         if random.random() < 0.1:  # 10% chance to send a chat
-            async def delayed_chat():
-                await asyncio.sleep(random.uniform(0.5, 3))  # Random delay between 0.5s and 3s
-                await self.match_mgr.broadcast_chat_emoticon(self.uid, random.choice(CHAT_EMO_IDS))
-            
-            asyncio.create_task(delayed_chat())  # Run in background
+            # Random delay between 0.5s and 3s
+            self.match_mgr.mailbox.post_after(random.uniform(0.5, 3), self.match_mgr.broadcast_chat_emoticon,
+                                              self.uid, random.choice(CHAT_EMO_IDS))
 
     
 class MatchBotIntermediate(MatchBot):
+    __slots__ = ()
     bot_model = 'A'
     def get_card_to_play(self) -> int:
         cards_on_table = [card for card in self.match_mgr.cards_compare if card != -1]
 
         if not cards_on_table:
-            return self.cards[0]  # Play the first card if nothing is on the table
-
-        strong_card = max(cards_on_table, key=lambda c: TRESSETTE_CARD_STRONGS[c // 4])
+            return random.choice(bitboard.to_cards(self.hand))  # Play any card if nothing is on the table
 
-        cur_hand_suit = self.match_mgr.hand_suit
-        cards_valid = [card for card in self.cards if card % 4 == cur_hand_suit]
-
-        if not cards_valid:
-            weakest_card = min(self.cards, key=lambda c: (TRESSETTE_CARD_VALUES[c], TRESSETTE_CARD_STRONGS[c // 4]))
-            return weakest_card
-
-        # Find the smallest valid card
-        min_card = min(cards_valid, key=lambda c: TRESSETTE_CARD_VALUES[c])
-
-        # Find the smallest card that can win
-        winning_cards = [card for card in cards_valid if TRESSETTE_CARD_STRONGS[card // 4] > TRESSETTE_CARD_STRONGS[strong_card // 4]]
-
-        return min(winning_cards, key=lambda c: TRESSETTE_CARD_VALUES[c]) if winning_cards else min_card
+        return self._get_card_to_follow(cards_on_table)
 
 class MatchBotAdvance(MatchBot):
+    __slots__ = ()
     bot_model = 'B'
     def _pick_best_card(self):
         try :
@@ -199,14 +218,13 @@ class MatchBotAdvance(MatchBot):
                 if p.uid != self.uid:
                     opponent = p
                     break
-            opponent_cards = opponent.cards
-            should_player_card = game_logic.pick_winning_card_first(self.cards, opponent_cards)
+            should_player_card = game_logic.pick_winning_card_first(self.hand, opponent.hand)
             # play card that can win, if can not win, play weakest and smallest card
             return should_player_card
 
         except Exception as e:
             print(e)
-            return self.cards[0]
+            return random.choice(bitboard.to_cards(self.hand))
     
     def get_card_to_play(self) -> int:
         cards_on_table = [card for card in self.match_mgr.cards_compare if card != -1]
@@ -214,92 +232,117 @@ class MatchBotAdvance(MatchBot):
         if not cards_on_table:
             return self._pick_best_card()  # Play the first card if nothing is on the table
 
-        strong_card = max(cards_on_table, key=lambda c: TRESSETTE_CARD_STRONGS[c // 4])
-
-        cur_hand_suit = self.match_mgr.hand_suit
-        cards_valid = [card for card in self.cards if card % 4 == cur_hand_suit]
-
-        if not cards_valid:
-            weakest_card = min(self.cards, key=lambda c: (TRESSETTE_CARD_VALUES[c], TRESSETTE_CARD_STRONGS[c // 4]))
-            return weakest_card
-
-        # Find the smallest valid card
-        min_card = min(cards_valid, key=lambda c: TRESSETTE_CARD_VALUES[c])
-
-        # Find the smallest card that can win
-        winning_cards = [card for card in cards_valid if TRESSETTE_CARD_STRONGS[card // 4] > TRESSETTE_CARD_STRONGS[strong_card // 4]]
-
-        return min(winning_cards, key=lambda c: TRESSETTE_CARD_VALUES[c]) if winning_cards else min_card
+        return self._get_card_to_follow(cards_on_table)
 
 class MatchBotSuper(MatchBot):
+    __slots__ = ()
     bot_model = 'D'
-    max_depth = 2
+    max_depth = 4  # without a bot_search config
+    search_fn = staticmethod(search_move)  # get_search_state() -> card, runs on the bot pool
    
     
-    def get_card_to_play(self) -> int:
-        # only for solo mode
-        bot_cards = self.cards.copy()
-        opp_cards = []
-        for p in self.match_mgr.players:
-            if p.uid != self.uid:
-                opp_cards = p.cards.copy()
-                break
-        bot_future_cards = []
-        opp_future_cards = []
-        i = 0
-        for c in self.match_mgr.cards:
-            if i % 2 == 0:
-                opp_future_cards.append(c)
-            else:
-                bot_future_cards.append(c)
-            i += 1
-        if len(self.match_mgr.cards_compare) > 0:
-            current_card = self.match_mgr.cards_compare[0]
+    async def on_turn(self):
+        print('Bot on turn')
+        if not self.hand:
+            return
+        time_thinking = random.randrange(1, 3)
+        bot_pool = game_vars.get_bot_pool()
+        if not bot_pool.enabled:
+            self.match_mgr.mailbox.post_after(time_thinking, self._play_turn, self.get_card_to_play())
+            return
+
+        search = bot_pool.submit(self.match_mgr.match_id, self.search_fn, self.get_search_state())
+        if search is None:
+            # every worker is busy, the intermediate policy answers right away
+            self.match_mgr.mailbox.post_after(time_thinking, self._play_turn, MatchBotIntermediate.get_card_to_play(self))
+            return
+        # the search runs while the bot pretends to think, the mailbox goes on meanwhile
+        think_until = game_vars.get_clock().time() + time_thinking
+        search.add_done_callback(lambda f: self._on_search_done(f, think_until))
+
+    def _on_search_done(self, search: asyncio.Future, think_until: float):
+        if search.cancelled():
+            return  # the match ended
+        delay = max(0.0, think_until - game_vars.get_clock().time())
+        self.match_mgr.mailbox.post_after(delay, self._play_searched_turn, search)
+
+    async def _play_searched_turn(self, search: asyncio.Future):
+        if search.exception() is not None:
+            card_id = MatchBotIntermediate.get_card_to_play(self)
         else:
-            current_card = None
+            card_id = search.result()
+        await self._play_turn(card_id)
 
-        if current_card == -1:
-            current_card = None
-        
-        bot_score = self.match_mgr.team_scores[self.team_id]
-        player_score = self.match_mgr.team_scores[1 - self.team_id]
-        leading_player = 'player' if current_card is not None else 'bot'
+    def get_card_to_play(self) -> int:
+        return self.search_fn(self.get_search_state())
+
+    def get_search_state(self) -> tuple:
+        """Compact state of the search, see search_move. Only for solo mode."""
+        match = self.match_mgr
+        seat = match.players.index(self)
+        opp = match.players[1 - seat]
+        # after each trick the players draw in seat order
+        bot_future_cards = match.cards[seat::2]
+        opp_future_cards = match.cards[1 - seat::2]
+        current_card = match.cards_compare[1 - seat] if match.cards_compare else -1
+
+        bot_score = match.team_scores[self.team_id]
+        player_score = match.team_scores[1 - self.team_id]
+        search = BOT_SEARCH.get(self.bot_model, {})
         if settings.DEV_MODE:
-            print("leading_player", leading_player)
             print("bot_score", bot_score)
             print("player_score", player_score)
-            print("bot_cards", bot_cards)
-            print("opp_cards", opp_cards)
+            print("bot_cards", bitboard.to_cards(self.hand))
+            print("opp_cards", bitboard.to_cards(opp.hand))
             print("bot_future_cards", bot_future_cards)
             print("opp_future_cards", opp_future_cards)
             print("current_card", current_card)
-            print("max_depth", self.max_depth)
-            print("point_to_win", self.match_mgr.point_to_win)
-
-        card = find_optimal_card(
-            leading_player,
-            self.match_mgr.team_scores[self.team_id],
-            self.match_mgr.team_scores[1 - self.team_id], 
-            bot_cards, opp_cards, bot_future_cards, opp_future_cards,
-            get_suit=get_suit,
-            get_score=get_score,
-            get_stronger_card=get_stronger_card,
-            point_to_win=self.match_mgr.point_to_win,
-            leading_card=current_card,
-            max_depth=self.max_depth,
-            )
-        return card
+            print("search", search)
+            print("point_to_win", match.point_to_win)
+
+        time_budget_ms = search.get("time_budget_ms")
+        return (
+            self.hand, opp.hand, bytes(bot_future_cards), bytes(opp_future_cards),
+            bot_score, player_score, match.point_to_win, current_card,
+            search.get("max_depth", self.max_depth),
+            time_budget_ms / 1000 if time_budget_ms is not None else None,
+            search.get("node_budget"),
+        )
   
 class MatchBotSuperV2(MatchBotSuper):
-    max_depth = 3
+    __slots__ = ()
+    max_depth = 6
     bot_model = 'E'
 
+class MatchBotPimc(MatchBotSuper):
+    """Plays fair: sees only its hand, the cards played, the opponent's shown cards and voids."""
+    __slots__ = ()
+    bot_model = 'F'
+    samples = 32  # without a bot_search config
+    search_fn = staticmethod(pimc_move)
+
+    def get_search_state(self) -> tuple:
+        """What a player at this seat knows, see pimc_move. Only for solo mode."""
+        match = self.match_mgr
+        seat = match.players.index(self)
+        opp = match.players[1 - seat]
+        current_card = match.cards_compare[1 - seat] if match.cards_compare else -1
+        search = BOT_SEARCH.get(self.bot_model, {})
+        return (
+            self.hand, opp.shown_cards, bitboard.count(opp.hand), match.played_cards, opp.void_suits, current_card,
+            match.team_scores[self.team_id], match.team_scores[1 - self.team_id], match.point_to_win,
+            search.get("samples", self.samples), random.getrandbits(32),
+        )
+
 class Match(ABC):
+    __slots__ = ()
     players: list[MatchPlayer]
     game_mode: int
     match_id: int
+    mailbox: MatchMailbox  # every change to the match runs as a command of this mailbox
+    flow: MatchFlow
     @abstractmethod
-    async def user_play_card(self, uid, payload):
+    async def user_play_card(self, uid, pkg):
         pass
 
     @abstractmethod
@@ -311,13 +354,52 @@ class Match(ABC):
         pass
 
     @abstractmethod
-    async def user_reconnect(self, uid):
+    async def user_reconnect(self, uid, send_game_info=True):
+        """Stops auto playing for the user. send_game_info is False after a session resume, the
+        client already got every packet it missed."""
         pass
 
     @abstractmethod
     async def loop(self):
         pass
 
+    @abstractmethod
+    def next_deadline(self):
+        """Unix time loop() has something to do next, None if it only waits for players."""
+        pass
+
+    def schedule_loop(self):
+        """Asks the match manager to run loop() at next_deadline()."""
+        when = self.next_deadline()
+        if when is not None:
+            game_vars.get_match_mgr().schedule_match(self, when)
+
+    async def fast_forward(self):
+        """Runs the pending step of the game flow now. Must run in the mailbox."""
+        await self.flow.fast_forward()
+
+    def is_open_for_quick_play(self) -> bool:
+        """True if quick play may seat a player here, see MatchIndex."""
+        return False
+
+    def notify_changed(self):
+        """Tells the match manager that state, seats or visibility changed, it keeps its indexes."""
+        game_vars.get_match_mgr().on_match_changed(self)
+
+    def snapshot(self) -> dict:
+        """Current state of the match, JSON serializable."""
+        snapshot = self.flow.snapshot()
+        snapshot.update({
+            "match_id": self.match_id,
+            "game_mode": self.game_mode,
+            "uids": [player.uid for player in self.players],
+            "points": [player.points for player in self.players],
+            "cards": [bitboard.to_cards(player.hand) or list(player.cards) for player in self.players],
+            "current_turn": self.current_turn,
+            "time_auto_play": self.time_auto_play,
+        })
+        return snapshot
+
     @abstractmethod
     async def broadcast_chat_emoticon(self, uid, emoticon):
         pass
@@ -343,9 +425,18 @@ class Match(ABC):
         pass
 
 class TressetteMatch(Match):
+    # per player state (auto play, napoli, ready) lives in the seats, see MatchPlayer
+    __slots__ = ('match_id', 'mailbox', 'start_time', 'end_time', 'game_mode', 'player_mode', 'players', 'cards',
+                 'win_player', 'hand_suit', 'bet', 'state', 'flow', 'current_turn', 'time_auto_play',
+                 'register_leave_uids', 'win_team', 'team_scores', 'pot_value', 'cur_round', 'is_end_round',
+                 'unique_match_id', 'cards_compare', 'timer_gen_bot', 'unique_game_id', 'is_public', 'hand_in_round',
+                 'enable_bet_win_score', 'game_ready', 'point_to_win', 'current_hand', 'time_start', 'win_card',
+                 'win_score', 'played_cards')
+
     def __init__(self, match_id, bet, player_mode, point_mode):
         self.match_id = match_id
-        self.start_time = datetime.now()
+        self.mailbox = MatchMailbox(match_id)
+        self.start_time = game_vars.get_clock().now()
         self.end_time = None
         self.game_mode = TRESSETTE_MODE
         self.player_mode = player_mode
@@ -354,10 +445,10 @@ class TressetteMatch(Match):
         self.win_player = None
         self.hand_suit = -1
         self.bet = bet
-        self.auto_play_count_by_uid = {} # consecutive auto play count
-        self.users_auto_play = {} # uids that are auto play, server will not wait for them
         self.state = MatchState.WAITING
+        self.flow = MatchFlow(self, TRESSETTE_TRANSITIONS)
         self.current_turn = -1
+        self.time_auto_play = -1
         self.register_leave_uids = set()
         self.win_team = -1
         self.team_scores = [0, 0]
@@ -366,14 +457,17 @@ class TressetteMatch(Match):
         self.is_end_round = False
         self.unique_match_id = str(uuid.uuid4())
         self.cards_compare = []
-        self.task_gen_bot = None
+        self.timer_gen_bot = None
         self.unique_game_id = ""
         self.is_public = True
-        self.napoli_claimed_status = {}
         self.hand_in_round = -1
         self.enable_bet_win_score = True
         self.game_ready = True
-        self.user_ready_status = {}
+        self.current_hand = -1
+        self.time_start = -1
+        self.win_card = -1
+        self.win_score = 0
+        self.played_cards = 0 # bitboard of the cards played this round
 
         
         self.point_to_win = point_mode * 3 # 11, 21
@@ -385,27 +479,25 @@ class TressetteMatch(Match):
 
     def set_public(self, is_public):
         self.is_public = is_public
+        self.notify_changed()
+
+    def is_open_for_quick_play(self) -> bool:
+        # bet 0 is for review
+        return self.is_public and self.bet != 0 and self.state == MatchState.WAITING and not self.check_room_full()
     
     async def loop(self):
         try:
             if self.state == MatchState.PLAYING:
                 # check overtime
-                if datetime.now() - self.start_time > timedelta(seconds=TIME_MATCH_MAXIMUM):
+                if game_vars.get_clock().now() - self.start_time > timedelta(seconds=TIME_MATCH_MAXIMUM):
                     await self.end_game()
                     return
                 
                 # check auto play
-                if self.current_turn != -1 and self.time_auto_play != -1 and datetime.now().timestamp() > self.time_auto_play:
+                if self.current_turn != -1 and self.time_auto_play != -1 and game_vars.get_clock().time() > self.time_auto_play:
                     player = self.players[self.current_turn]
                     if player:
                         await player.auto_play()
-            elif self.state == MatchState.PREPARING_START:
-                if self.time_start != -1 and datetime.now().timestamp() > self.time_start:
-                    if self.check_room_full():
-                        await self.start_game()
-                    else:
-                        self.state = MatchState.WAITING
-                        self.time_start = -1
             elif self.state == MatchState.WAITING:
                 if self.game_ready and self.check_room_full():
                     await self._prepare_start_game()
@@ -413,6 +505,17 @@ class TressetteMatch(Match):
             traceback.print_exc()
             raise e
 
+    def next_deadline(self):
+        if self.state == MatchState.PLAYING:
+            when = self.start_time.timestamp() + TIME_MATCH_MAXIMUM
+            if self.current_turn != -1 and self.time_auto_play != -1:
+                when = min(when, self.time_auto_play)
+            return when
+        elif self.state == MatchState.WAITING:
+            if self.game_ready and self.check_room_full():
+                return game_vars.get_clock().time()
+        return None
+
     async def user_join(self, user_id, is_bot=False):
         # check user in match
         for player in self.players:
@@ -434,7 +537,6 @@ class TressetteMatch(Match):
             print('Match is full')
             return
         
-        self.user_ready_status[user_id] = True
         if is_bot:
             bot_model = BOT_MODEL_MEDIUM
 
@@ -457,7 +559,7 @@ class TressetteMatch(Match):
                                 bot_model = BOT_MODEL_STUPID
                         else:
                             if win_rate > 0.6:
-                                bot_model = random.choice([BOT_MODEL_MEDIUM, BOT_MODEL_SUPER, BOT_MODEL_SUPER_V2])
+                                bot_model = random.choice([BOT_MODEL_MEDIUM, BOT_MODEL_SUPER, BOT_MODEL_SUPER_V2, BOT_MODEL_PIMC])
                             elif win_rate > 0.4:
                                 bot_model = BOT_MODEL_MEDIUM
                             else:
@@ -478,6 +580,9 @@ class TressetteMatch(Match):
             elif bot_model == BOT_MODEL_SUPER_V2:
                 print("bot model super v2...")
                 match_player = MatchBotSuperV2(user_id, self)
+            elif bot_model == BOT_MODEL_PIMC:
+                print("bot model pimc...")
+                match_player = MatchBotPimc(user_id, self)
             else:
                 print("bot model advance...")
                 match_player = MatchBotAdvance(user_id, self)
@@ -491,6 +596,7 @@ class TressetteMatch(Match):
         match_player.name = user_data.name
         match_player.gold = user_data.gold
         match_player.avatar = user_data.avatar
+        match_player.is_ready = True
         # calculate team id
         if self.player_mode == PLAYER_SOLO_MODE:
             match_player.team_id = slot_idx
@@ -499,6 +605,7 @@ class TressetteMatch(Match):
 
         seat_server_id = slot_idx
         self.players[slot_idx] = match_player
+        self.notify_changed()
         team_id = match_player.team_id
 
         pkg = packet_pb2.NewUserJoinMatch()
@@ -524,6 +631,7 @@ class TressetteMatch(Match):
                 self._clear_coroutine_gen_bot()
             else:
                 await self._check_and_gen_bot()
+        self.schedule_loop()
 
     async def _check_and_gen_bot(self):
         print("check and gen bott")
@@ -544,12 +652,12 @@ class TressetteMatch(Match):
                 return # not gen bot if ccu > 100
             
         print("check and3 g2en bott")
-        if self.task_gen_bot is not None:
-            self.task_gen_bot.cancel()
+        if self.timer_gen_bot is not None:
+            self.timer_gen_bot.cancel()
 
         print("check and g2en 2bott")
         time_delay_gen_bot = await self._get_ideal_delay_bot_time()
-        self.task_gen_bot = asyncio.create_task(self._coroutine_gen_bot(time_delay_gen_bot))
+        self.timer_gen_bot = self.mailbox.post_after(time_delay_gen_bot, self._gen_bot)
     
     async def _get_ideal_delay_bot_time(self):
         # only for solo mode
@@ -576,15 +684,17 @@ class TressetteMatch(Match):
             return random.randint(3, 15)
         return random.randint(3, 15)
     
-    async def _coroutine_gen_bot(self, time_delay_gen_bot):
-        await asyncio.sleep(time_delay_gen_bot)
+    async def _gen_bot(self):
+        self.timer_gen_bot = None
+        if self.state != MatchState.WAITING or self.check_room_full():
+            return
         bot_uid = game_vars.get_bots_mgr().get_free_bot_uid()
         await self.user_join(bot_uid, is_bot=True)
 
     def _clear_coroutine_gen_bot(self):
-        if self.task_gen_bot is not None:
-            self.task_gen_bot.cancel()
-            self.task_gen_bot = None
+        if self.timer_gen_bot is not None:
+            self.timer_gen_bot.cancel()
+            self.timer_gen_bot = None
 
     async def _prepare_start_game(self):
         # before really start game, check if all players are ready
@@ -593,7 +703,7 @@ class TressetteMatch(Match):
         for player in self.players:
             if player.uid == -1 or player.is_bot:
                 continue
-            if not self.user_ready_status.get(player.uid, False):
+            if not player.is_ready:
                 print('Not all players are ready')
                 is_all_ready = False
                 # Kick user out of match
@@ -603,8 +713,10 @@ class TressetteMatch(Match):
             print('Not all players are ready')
             return
         
-        self.state = MatchState.PREPARING_START
-        self.time_start = datetime.now().timestamp() + TIME_START_TO_DEAL
+        self.flow.transition(MatchState.PREPARING_START)
+        delay = get_timing("start_to_deal")
+        self.time_start = game_vars.get_clock().time() + delay
+        self.flow.schedule("start_game", delay, self._start_game_if_full)
         # Send to all players that game is starting, wait for 3 seconds
         pkg = packet_pb2.PrepareStartGame()
         pkg.time_start = int(self.time_start)
@@ -612,6 +724,13 @@ class TressetteMatch(Match):
 
         await self.broadcast_pkg(CMDs.PREPARE_START_GAME, pkg)
 
+    async def _start_game_if_full(self):
+        if self.check_room_full():
+            await self.start_game()
+        else:
+            self.flow.transition(MatchState.WAITING)
+            self.time_start = -1
+
 
     def check_can_join(self, uid: int):
         if self.state == MatchState.WAITING:
@@ -670,7 +789,7 @@ class TressetteMatch(Match):
             game_info.is_vips.append(is_player_vip)
 
             if player.uid == uid:
-                game_info.my_cards.extend(player.cards)
+                game_info.my_cards.extend(bitboard.to_cards(player.hand))
         
         await game_vars.get_game_client().send_packet(uid, CMDs.GAME_INFO, game_info)
 
@@ -686,9 +805,11 @@ class TressetteMatch(Match):
             if player.uid == uid:
                 self.players[i] = MatchPlayer(-1, self)
                 break
+        self.notify_changed()
 
         if not self.check_room_full() and self.state == MatchState.PREPARING_START:
-            self.state = MatchState.WAITING
+            self.flow.cancel()
+            self.flow.transition(MatchState.WAITING)
             self.time_start = -1
 
         await self._check_and_gen_bot()
@@ -703,10 +824,9 @@ class TressetteMatch(Match):
                                                                               self.player_mode, self.game_mode])
 
         print('Start game')
-        self.state = MatchState.PLAYING
+        self.flow.transition(MatchState.PLAYING)
         self.game_ready = False
-        self.user_ready_status.clear()
-        self.start_time = datetime.now()
+        self.start_time = game_vars.get_clock().now()
         self.current_turn = 0
         self.current_hand = -1
         self.time_auto_play = -1
@@ -715,15 +835,14 @@ class TressetteMatch(Match):
         self.win_player = None
         self.win_card = -1
         self.win_score = 0
-        self.auto_play_count_by_uid.clear()
         self.register_leave_uids.clear()
         self.win_team = -1
         self.team_scores = [0, 0]
         self.pot_value = 0
         self.cur_round = 1
         self.is_end_round = False
-        self.napoli_claimed_status.clear()
         self.hand_in_round = -1
+        self.schedule_loop()  # overtime
 
         # Init player golds
         for player in self.players:
@@ -736,8 +855,11 @@ class TressetteMatch(Match):
         for player in self.players:
             player.points = 0
             player.score_last_trick = 0
-            player.cards.clear()
+            player.hand = 0
             player.gold_change = 0
+            player.is_ready = False
+            player.auto_play_count = 0
+            player.napoli_claimed = False
 
             # get pot user need to contribute
             pot_user_need_to_contribute = self.bet
@@ -764,17 +886,17 @@ class TressetteMatch(Match):
         await self.broadcast_pkg(CMDs.START_GAME, pkg)
 
         # effect put pot value
-        await asyncio.sleep(3 if self.bet > 0 else 1)
-        await self.deal_card()
+        self.flow.schedule("deal", self._get_put_pot_time(), self._deal_first_hand, "first_hand")
 
-        # wait for 2 seconds
-        await asyncio.sleep(1.6)
-        await self._handle_new_hand()
+    def _get_put_pot_time(self):
+        return get_timing("put_pot" if self.bet > 0 else "put_pot_no_bet")
+
+    async def _deal_first_hand(self, timing_new_hand):
+        await self.deal_card()
+        self.flow.schedule("new_hand", get_timing(timing_new_hand), self._handle_new_hand)
 
-    async def user_play_card(self, uid, payload):
+    async def user_play_card(self, uid, pkg):
         print(f"Receive play card from user {uid}")
-        pkg = packet_pb2.PlayCard()
-        pkg.ParseFromString(payload)
         card_id = pkg.card_id
         await self._play_card(uid, card_id, auto=False)
     
@@ -806,34 +928,34 @@ class TressetteMatch(Match):
         
         # check whether user has the card
         player = self.players[self.current_turn]
-        if card_id not in player.cards:
+        if not 0 <= card_id < bitboard.NUM_CARDS or not player.hand & bitboard.CARD_BITS[card_id]:
             logger.error(f"User {uid} does not have card {card_id}")
             await self._send_card_play_response(uid, PlayCardErrors.NOT_FOUND_CARD)
             return
         
         if self.hand_suit == -1:
             self.hand_suit = card_id % 4
-        else:
-            card_suit = card_id % 4
-            if card_suit != self.hand_suit:
-                for card in player.cards:
-                    if card % 4 == self.hand_suit:
-                        logger.error(f"User {uid} must play card with suit {self.hand_suit}")
-                        await self._send_card_play_response(uid, PlayCardErrors.INVALID_SUIT)
-                        return
+        elif not bitboard.legal_moves(player.hand, self.hand_suit) & bitboard.CARD_BITS[card_id]:
+            logger.error(f"User {uid} must play card with suit {self.hand_suit}")
+            await self._send_card_play_response(uid, PlayCardErrors.INVALID_SUIT)
+            return
 
         # Now user can play card
         if not auto:
-            self.users_auto_play.pop(uid, None)
-            self.auto_play_count_by_uid.pop(uid, None)
+            player.is_auto_play = False
+            player.auto_play_count = 0
         else:
-            self.auto_play_count_by_uid[uid] = self.auto_play_count_by_uid.get(uid, 0) + 1
-            if self.auto_play_count_by_uid[uid] >= 3:
-                self.users_auto_play[uid] = True
+            player.auto_play_count += 1
+            if player.auto_play_count >= 3:
+                player.is_auto_play = True
             
         # remove card from player
         print('remove card id: ', card_id, ' auto: ', auto)
-        player.cards.remove(card_id)
+        player.hand &= ~bitboard.CARD_BITS[card_id]
+        player.shown_cards &= ~bitboard.CARD_BITS[card_id]
+        if card_id % 4 != self.hand_suit:
+            player.void_suits |= 1 << self.hand_suit
+        self.played_cards |= bitboard.CARD_BITS[card_id]
         self.cards_compare[self.current_turn] = card_id
         self.time_auto_play = -1
 
@@ -861,15 +983,16 @@ class TressetteMatch(Match):
             await self.broadcast_pkg(CMDs.PLAY_CARD, pkg)
 
             # next uid
-            next_uid = self.players[self.current_turn].uid
-            await self.players[self.current_turn].on_turn()
+            next_player = self.players[self.current_turn]
+            await next_player.on_turn()
 
-            if next_uid in self.users_auto_play:
+            if next_player.is_auto_play:
                 # people that are auto play
-                self.time_auto_play = TIME_AUTO_PLAY_SEVERE + int(datetime.now().timestamp())
+                self.time_auto_play = TIME_AUTO_PLAY_SEVERE + int(game_vars.get_clock().time())
             else:
                 # normal people
-                self.time_auto_play = TIME_AUTO_PLAY + int(datetime.now().timestamp())
+                self.time_auto_play = TIME_AUTO_PLAY + int(game_vars.get_clock().time())
+            self.schedule_loop()
 
     def check_done_hand(self):
         for card in self.cards_compare:
@@ -877,23 +1000,29 @@ class TressetteMatch(Match):
                 return False
         return True
 
-    async def user_reconnect(self, uid):
+    async def user_reconnect(self, uid, send_game_info=True):
        # remove state auto play if has
-       self.auto_play_count_by_uid.pop(uid, None)
-       self.users_auto_play.pop(uid, None)
+       player = self.get_player(uid)
+       if player:
+           player.auto_play_count = 0
+           player.is_auto_play = False
 
-       await self._send_game_info(uid)
+       if send_game_info:
+           await self._send_game_info(uid)
 
     async def deal_card(self):
         self.cards = TRESSETTE_CARDS.copy()
         random.shuffle(self.cards)
         print(f"Cards: {self.cards}")
         for i, player in enumerate(self.players):
-            player.cards = self.cards[i*10: (i+1)*10]
+            player.hand = bitboard.from_cards(self.cards[i*10: (i+1)*10])
+            player.shown_cards = 0
+            player.void_suits = 0
+        self.played_cards = 0
 
         # TEST CARDS, DONT USE THIS FUNCTION LIVE
         # if settings.DEV_MODE:
-        #     self.players[0].cards = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        #     self.players[0].hand = bitboard.from_cards([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
         
         # remove cards dealt
         self.cards = self.cards[10 * len(self.players):]
@@ -904,7 +1033,7 @@ class TressetteMatch(Match):
             if player.is_bot:
                 continue
             pkg = packet_pb2.DealCard()
-            pkg.cards.extend(player.cards)
+            pkg.cards.extend(bitboard.to_cards(player.hand))
             pkg.remain_cards = len(self.cards)
             await game_vars.get_game_client().send_packet(player.uid, CMDs.DEAL_CARD, pkg)
     
@@ -924,7 +1053,7 @@ class TressetteMatch(Match):
         self.current_hand += 1
 
         # check is end round
-        if len(self.players[0].cards) == 0: # test = 9
+        if not self.players[0].hand: # test = 9
             # logic end round
             self.is_end_round = True
         else:
@@ -956,13 +1085,15 @@ class TressetteMatch(Match):
             pkg.user_points.append(player.points)
 
         # send to others
-        await asyncio.sleep(0.5)
+        self.flow.schedule("end_hand", get_timing("end_hand"), self._send_end_hand, pkg)
 
+    async def _send_end_hand(self, pkg):
         await self.broadcast_pkg(CMDs.END_HAND, pkg)
 
         # effect show win cards
-        await asyncio.sleep(2)
-        
+        self.flow.schedule("show_win_cards", get_timing("show_win_cards"), self._after_end_hand)
+
+    async def _after_end_hand(self):
         # # draw new cards
         if self._is_end_game():
             await self.end_game()
@@ -972,8 +1103,9 @@ class TressetteMatch(Match):
             # Still has cards to draw
             if len(self.cards) > 0:
                 await self._handle_draw_card()
-                await asyncio.sleep(TIME_DRAW_CARD)
-            await self._handle_new_hand()
+                self.flow.schedule("new_hand", get_timing("draw_card"), self._handle_new_hand)
+            else:
+                await self._handle_new_hand()
         else:
             # create new round
             await self._on_end_round()
@@ -984,14 +1116,14 @@ class TressetteMatch(Match):
     
     async def _on_end_round(self):
         # wait for 2 seconds
-        await asyncio.sleep(2)
-        await self._on_new_round()
+        self.flow.schedule("new_round", get_timing("end_round"), self._on_new_round)
 
     async def _on_new_round(self):
         self.cur_round += 1
         self.is_end_round = False
-        self.napoli_claimed_status.clear()
         self.hand_in_round = -1
+        for player in self.players:
+            player.napoli_claimed = False
 
         # When new round start, all redudant points need to be removed, example 3, 1/3 -> 3, 4 2/3 -> 4
         for player in self.players:
@@ -1020,10 +1152,7 @@ class TressetteMatch(Match):
 
         await self.broadcast_pkg(CMDs.NEW_ROUND, pkg)
 
-        await asyncio.sleep(3 if self.bet > 0 else 1)
-        await self.deal_card()
-        await asyncio.sleep(2)
-        await self._handle_new_hand()
+        self.flow.schedule("deal", self._get_put_pot_time(), self._deal_first_hand, "new_round_hand")
 
     def _is_end_game(self):
         # check if one team reach 21 * 3 points then end game
@@ -1041,7 +1170,8 @@ class TressetteMatch(Match):
         draw_cards = []
         for player in self.players:
             new_card = self._draw_card()
-            player.cards.append(new_card)
+            player.hand |= bitboard.CARD_BITS[new_card]
+            player.shown_cards |= bitboard.CARD_BITS[new_card]
             draw_cards.append(new_card)
         
         # send to users
@@ -1061,17 +1191,18 @@ class TressetteMatch(Match):
         else:
             self.current_turn = 0
 
-        if self.win_player and self.win_player.uid in self.users_auto_play:
+        if self.win_player and self.win_player.is_auto_play:
             # people that are auto play
-            self.time_auto_play = TIME_AUTO_PLAY_SEVERE + datetime.now().timestamp()
+            self.time_auto_play = TIME_AUTO_PLAY_SEVERE + game_vars.get_clock().time()
         else:
-            self.time_auto_play = TIME_AUTO_PLAY + datetime.now().timestamp()
+            self.time_auto_play = TIME_AUTO_PLAY + game_vars.get_clock().time()
 
         print(f"New hand")
         pkg = packet_pb2.NewHand()
         pkg.current_turn = self.current_turn
 
         await self.broadcast_pkg(CMDs.NEW_HAND, pkg)
+        self.schedule_loop()
 
         await self.players[self.current_turn].on_turn()
 
@@ -1083,28 +1214,20 @@ class TressetteMatch(Match):
         return self.state == MatchState.WAITING or self.state == MatchState.PREPARING_START
     
     def get_win_card_in_hand(self):
-        # valid cards in hand, same defined suit
-        cards_valid = []
-        for card in self.cards_compare:
-            if card % 4 == self.hand_suit:
-                cards_valid.append(card)
-
-        win_card = cards_valid[0]
-        for card in cards_valid:
-            if TRESSETTE_CARD_STRONGS[card // 4] > TRESSETTE_CARD_STRONGS[win_card // 4]:
-                win_card = card
-        return win_card
+        # strongest card of the defined suit
+        return bitboard.trick_winner(bitboard.from_cards(self.cards_compare), self.hand_suit)
 
     def get_win_score_in_hand(self):
-        total_score = 0
-        for card in self.cards_compare:
-            total_score += TRESSETTE_CARD_VALUES[card]
-        return total_score
+        return bitboard.points(bitboard.from_cards(self.cards_compare))
 
         
 
     async def end_game(self):
-        self.state = MatchState.ENDED
+        self.flow.transition(MatchState.ENDED)
+        # steps of the game still waiting to run (bot turns, next hand)
+        self.flow.cancel()
+        self.mailbox.cancel_timers()
+        game_vars.get_bot_pool().cancel_match(self.match_id)
 
         if self.team_scores[0] > self.team_scores[1]:
             self.win_team = 0
@@ -1127,6 +1250,8 @@ class TressetteMatch(Match):
 
         pot_received_one_player = int(self.pot_value // (self.player_mode / 2))
 
+        # balances of all players are stored in one transaction, see Settlement
+        settlement = Settlement('gold', 'game_count', 'win_count', 'exp')
         # add gold
         for player in self.players:
             if player.team_id == self.win_team:
@@ -1146,23 +1271,25 @@ class TressetteMatch(Match):
             user_info.game_count += 1
             added_exp = int(game_exp.calculate_exp_gain(self.bet))
 
-            if player.team_id == self.win_team:
+            is_win = player.team_id == self.win_team
+            if is_win:
                 user_info.add_gold(gold_received)
                 user_info.win_count += 1
                 added_exp = added_exp * 2
 
-                await game_vars.get_ranking_mgr().on_user_win_game(player.uid)
-
             user_info.add_exp(added_exp)
             gold_debt = game_vars.get_debt_mgr().get_debt_ingame(player.uid)
             user_info.add_gold(-gold_debt)
             # reset debt
             game_vars.get_debt_mgr().remove_debt_ingame(player.uid)
 
-            await user_info.commit_to_database('gold', 'game_count', 'win_count', 'exp')
-            await user_info.send_update_money()
+            settlement.add(user_info, ranking_win=is_win)
             write_log(player.uid, "end_game", "", [self.unique_match_id, self.unique_game_id, self.bet, player.gold_change])
 
+        # raises if the balances could not be stored, clients are then not told they changed
+        await settlement.commit()
+        await settlement.notify()
+
         uids = []
         score_totals = []
         score_last_tricks = []
@@ -1191,20 +1318,24 @@ class TressetteMatch(Match):
 
         await self.broadcast_pkg(CMDs.END_GAME, pkg)
         
-        await asyncio.sleep(3)
+        self.flow.schedule("show_result", get_timing("end_game_result"), self._after_end_game)
 
-        self.state = MatchState.WAITING
+    async def _after_end_game(self):
+        self.flow.transition(MatchState.WAITING)
         # for user register exit room, or auto play, or disconnect
         await self.update_users_staying_endgame() 
 
         #reset game: score
         for player in self.players:
             player.points = 0
-            player.cards.clear()
+            player.hand = 0
 
         # next game
-        await asyncio.sleep(9)
+        self.flow.schedule("game_ready", get_timing("next_game"), self._set_game_ready)
+
+    async def _set_game_ready(self):
         self.game_ready = True
+        self.schedule_loop()
 
     async def update_users_staying_endgame(self):
         # Remove all bots
@@ -1229,7 +1360,7 @@ class TressetteMatch(Match):
             await game_vars.get_match_mgr().handle_user_leave_match(uid)    
 
         # kick user auto playing consecutively more than 3 times
-        for uid in self.users_auto_play:
+        for uid in [player.uid for player in self.players if player.is_auto_play]:
             await game_vars.get_match_mgr().handle_user_leave_match(uid)
 
         # Kick user not has enough gold
@@ -1255,12 +1386,8 @@ class TressetteMatch(Match):
                 await game_vars.get_match_mgr().handle_user_leave_match(uid)
     
     async def broadcast_pkg(self, cmd_id, pkg, ignore_uids=[]):
-        for player in self.players:
-            if player.is_bot or player.uid == -1:
-                continue
-            if player.uid in ignore_uids:
-                continue
-            await game_vars.get_game_client().send_packet(player.uid, cmd_id, pkg)
+        uids = [player.uid for player in self.players if not player.is_bot and player.uid != -1]
+        await game_vars.get_game_client().broadcast_packet(uids, cmd_id, pkg, ignore_uids)
 
     async def broadcast_chat_message(self, uid, message):
         pkg = packet_pb2.InGameChatMessage()
@@ -1295,29 +1422,19 @@ class TressetteMatch(Match):
             bot_uid = game_vars.get_bots_mgr().get_free_bot_uid()
             await self.user_join(bot_uid, is_bot=True)
 
-    async def receive_game_action_napoli(self, uid, payload):
-        if self.napoli_claimed_status.get(uid):
+    async def receive_game_action_napoli(self, uid):
+        p = self.get_player(uid)
+        if p is None or p.napoli_claimed:
             return
-    
-        p = None
-        for player in self.players:
-            if player.uid == uid:
-                p = player
-                break
-        if p is None:
-            return
-        napoli_sets = self.find_napoli(p.cards)
-        if len(napoli_sets) == 0:
+        napoli_suits = self.find_napoli(p.hand)
+        if len(napoli_suits) == 0:
             return
-        
-        napoli_suits = []
-        for napoli_set in napoli_sets:
-            set_suit = napoli_set[0] % 4
-            napoli_suits.append(set_suit)
 
-        self.napoli_claimed_status[uid] = True
+        p.napoli_claimed = True
+        for suit in napoli_suits:
+            p.shown_cards |= p.hand & bitboard.NAPOLI_MASKS[suit]
         # add 3 (1 point) for each napoli set
-        point_add = len(napoli_sets) * SERVER_SCORE_ONE_POINT
+        point_add = len(napoli_suits) * SERVER_SCORE_ONE_POINT
         p.points += point_add
 
         # send to all users
@@ -1328,26 +1445,25 @@ class TressetteMatch(Match):
 
         await self.broadcast_pkg(CMDs.GAME_ACTION_NAPOLI, pkg)
 
-    def find_napoli(self, hand):
-        napoli_sets = []
-        
-        # Check for Napoli in each suit
-        for suit in range(4):
-            ace = suit
-            two = suit + 4
-            three = suit + 8
-
-            if ace in hand and two in hand and three in hand:
-                napoli_sets.append([ace, two, three])
-        
-        return napoli_sets
+    def find_napoli(self, hand: int) -> list[int]:
+        # suits the hand has the ace, two and three of
+        return bitboard.napoli_suits(hand)
     
+    def get_player(self, uid) -> MatchPlayer:
+        for player in self.players:
+            if player.uid == uid:
+                return player
+        return None
+
     def user_return_to_table(self, uid):
-        self.users_auto_play.pop(uid, None)
+        player = self.get_player(uid)
+        if player:
+            player.is_auto_play = False
 
     def user_ready(self, uid):
         print("user " + str(uid) + " is ready to play")
-        self.user_ready_status[uid] = True
-        pass
+        player = self.get_player(uid)
+        if player:
+            player.is_ready = True
 
 
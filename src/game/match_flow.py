@@ -0,0 +1,116 @@
+import collections
+import logging
+
+from src.game.game_vars import game_vars
+from src.game.tressette_config import config as tress_config
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("match_flow")  # Name your logger
+
+# Delays between the steps of a game (seconds), mostly client animations.
+# Overridden by "match_flow_timings" in config/tressette_game_config.json and at runtime by set_timing.
+DEFAULT_TIMINGS = {
+    "start_to_deal": 3.5,
+    "put_pot": 3,
+    "put_pot_no_bet": 1,
+    "first_hand": 1.6,
+    "end_hand": 0.5,
+    "show_win_cards": 2,
+    "draw_card": 3.5,
+    "end_round": 2,
+    "new_round_hand": 2,
+    "end_game_result": 3,
+    "next_game": 9,
+    "sette_mezzo_first_turn": 1,
+    "sette_mezzo_bursted": 0.5,
+    "sette_mezzo_show_banker_card": 0.5,
+    "sette_mezzo_banker_think": 1,
+    "sette_mezzo_end_game": 1,
+    "sette_mezzo_next_game": 1.5,
+}
+
+timings = dict(DEFAULT_TIMINGS)
+timings.update(tress_config.get("match_flow_timings", {}))
+
+
+def get_timing(name: str) -> float:
+    return timings[name]
+
+
+def set_timing(name: str, value: float):
+    if name not in timings:
+        raise KeyError(f"Unknown timing {name}")
+    timings[name] = value
+
+
+class MatchFlow:
+    """Lifecycle of one match as an explicit state machine.
+
+    States change only through transition(), checked against the table of allowed transitions.
+    Between two states the game goes through timed steps (deal, end hand, new round...); a match
+    has at most one pending step, which can be inspected, fast-forwarded or cancelled.
+    """
+    def __init__(self, match, transitions: dict):
+        self.match = match
+        self.transitions = transitions  # state -> states it can move to
+        self.step: str = None  # name of the pending step
+        self.step_due = 0.0  # unix time the pending step runs
+        self._step_fn = None
+        self._step_args = ()
+        self._handle = None
+        self.history = collections.deque(maxlen=16)  # (unix time, from state, to state)
+
+    def transition(self, new_state):
+        old_state = self.match.state
+        if new_state not in self.transitions.get(old_state, ()):
+            raise ValueError(f"Match {self.match.match_id}: invalid transition {old_state.name} -> {new_state.name}")
+        self.match.state = new_state
+        self.history.append((game_vars.get_clock().time(), old_state.name, new_state.name))
+        self.match.notify_changed()
+
+    def schedule(self, step: str, delay: float, fn, *args):
+        """Runs `await fn(*args)` as the match's next step after delay seconds."""
+        if self.step is not None:
+            logger.warning(f"Match {self.match.match_id}: step {step} replaces pending step {self.step}")
+            self.cancel()
+        self.step = step
+        self.step_due = game_vars.get_clock().time() + delay
+        self._step_fn = fn
+        self._step_args = args
+        self._handle = self.match.mailbox.post_after(delay, self._run_step, step)
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+        self.step = None
+        self._step_fn = None
+        self._step_args = ()
+        self._handle = None
+
+    async def fast_forward(self):
+        """Runs the pending step now instead of waiting for its timer. Must run in the mailbox."""
+        if self.step is not None:
+            await self._run_step(self.step)
+
+    async def _run_step(self, step: str):
+        if self.step != step:
+            return  # cancelled, or already run by fast_forward
+        fn, args = self._step_fn, self._step_args
+        if self._handle is not None:
+            self._handle.cancel()
+        self.step = None
+        self._step_fn = None
+        self._step_args = ()
+        self._handle = None
+        await fn(*args)
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.match.state.name,
+            "step": self.step,
+            "step_due_in": max(0.0, self.step_due - game_vars.get_clock().time()) if self.step else None,
+            "history": list(self.history),
+        }
@@ -0,0 +1,80 @@
+import bisect
+
+
+class MatchIndex:
+    """Tables a quick play can join, bucketed by (game_mode, player_mode, bet).
+
+    A match is in the index while match.is_open_for_quick_play() holds; the match manager calls
+    update() whenever a match changes state, gains or loses a player or changes visibility, so
+    quick play is a bisect on the sorted bets instead of a scan of every match.
+    """
+    def __init__(self):
+        self.buckets: dict[tuple, dict[int, object]] = {}  # key -> match_id -> match, oldest first
+        self.bets: dict[tuple[int, int], list[int]] = {}  # (game_mode, player_mode) -> sorted bets of non empty buckets
+        self.keys: dict[int, tuple] = {}  # match_id -> key the match is indexed under
+
+    def update(self, match):
+        key = (match.game_mode, match.player_mode, match.bet) if match.is_open_for_quick_play() else None
+        old_key = self.keys.get(match.match_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._remove(match.match_id, old_key)
+        if key is not None:
+            self._add(match, key)
+
+    def remove(self, match):
+        old_key = self.keys.get(match.match_id)
+        if old_key is not None:
+            self._remove(match.match_id, old_key)
+
+    def find_closest(self, game_mode: int, player_mode: int, target_bet: float, max_bet: float):
+        """Open match with the bet closest to target_bet and not above max_bet, None if there is none."""
+        bets = self.bets.get((game_mode, player_mode))
+        if not bets:
+            return None
+        i = bisect.bisect_right(bets, target_bet)
+        best_bet = None
+        if i > 0 and bets[i - 1] <= max_bet:
+            best_bet = bets[i - 1]
+        if i < len(bets) and bets[i] <= max_bet:
+            if best_bet is None or bets[i] - target_bet < target_bet - best_bet:
+                best_bet = bets[i]
+        if best_bet is None:
+            return None
+        return self._first(game_mode, player_mode, best_bet)
+
+    def find_any(self, game_mode: int):
+        """Oldest open match of the lowest bet of any player mode, None if there is none."""
+        for (mode, player_mode), bets in self.bets.items():
+            if mode == game_mode:
+                return self._first(mode, player_mode, bets[0])
+        return None
+
+    def get_stats(self) -> dict:
+        return {
+            "open_matches": len(self.keys),
+            "buckets": len(self.buckets),
+        }
+
+    def _first(self, game_mode, player_mode, bet):
+        return next(iter(self.buckets[(game_mode, player_mode, bet)].values()))
+
+    def _add(self, match, key):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+            bisect.insort(self.bets.setdefault(key[:2], []), key[2])
+        bucket[match.match_id] = match
+        self.keys[match.match_id] = key
+
+    def _remove(self, match_id, key):
+        del self.keys[match_id]
+        bucket = self.buckets[key]
+        bucket.pop(match_id, None)
+        if not bucket:
+            del self.buckets[key]
+            bets = self.bets[key[:2]]
+            bets.remove(key[2])
+            if not bets:
+                del self.bets[key[:2]]
@@ -0,0 +1,124 @@
+import asyncio
+import collections
+import logging
+import time
+import traceback
+
+from src.game.game_vars import game_vars
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("match_mailbox")  # Name your logger
+
+
+class MailboxTimer:
+    """Timer of post_after(). Cancelling it also forgets it in the mailbox."""
+    __slots__ = ('mailbox', 'handle')
+
+    def __init__(self, mailbox: 'MatchMailbox'):
+        self.mailbox = mailbox
+        self.handle = None  # the clock's timer
+
+    def cancel(self):
+        if self.handle is not None:
+            self.handle.cancel()
+        self.mailbox.timers.discard(self)
+
+
+class MatchMailbox:
+    """Commands of one match, run one after another on the mailbox's own task.
+
+    Everything that changes a match (packets, auto play, bots, delayed steps of the game flow)
+    goes through post(), post_after() or call(), so two commands never interleave at an await.
+    The task is started when a command is posted and exits once the mailbox is empty.
+    """
+    command_timer = None  # when set, called as command_timer(fn, seconds) after every command
+
+    def __init__(self, match_id):
+        self.match_id = match_id
+        self.queue: collections.deque = collections.deque()  # (fn, args, future or None)
+        self.timers: set[MailboxTimer] = set()
+        self.closed = False
+        self._task: asyncio.Task = None
+
+        # metrics
+        self.processed_count = 0
+        self.max_queue_len = 0
+
+    def post(self, fn, *args):
+        """Queues `await fn(*args)` and returns immediately."""
+        self._push(fn, args, None)
+
+    def post_after(self, delay: float, fn, *args) -> MailboxTimer:
+        """Queues `await fn(*args)` after delay seconds on the game clock. The returned timer can be cancelled."""
+        if self.closed:
+            return None
+        timer = MailboxTimer(self)
+
+        def fire():
+            self.timers.discard(timer)
+            self.post(fn, *args)
+
+        timer.handle = game_vars.get_clock().call_later(delay, fire)
+        self.timers.add(timer)
+        return timer
+
+    async def call(self, fn, *args):
+        """Runs fn in turn with the other commands and returns its result. Called from a
+        command of this match, fn runs right away since the mailbox is already ours."""
+        if self.in_mailbox() or self.closed:
+            return await fn(*args)
+        future = asyncio.get_running_loop().create_future()
+        self._push(fn, args, future)
+        return await future
+
+    def in_mailbox(self) -> bool:
+        return self._task is not None and asyncio.current_task() is self._task
+
+    def cancel_timers(self):
+        for timer in self.timers:
+            timer.handle.cancel()
+        self.timers.clear()
+
+    def close(self):
+        """Drops pending commands and timers, the match is destroyed."""
+        self.closed = True
+        self.cancel_timers()
+        while self.queue:
+            _, _, future = self.queue.popleft()
+            if future is not None and not future.done():
+                future.cancel()
+
+    def _push(self, fn, args, future):
+        if self.closed:
+            if future is not None:
+                future.cancel()
+            return
+        self.queue.append((fn, args, future))
+        if len(self.queue) > self.max_queue_len:
+            self.max_queue_len = len(self.queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self.queue:
+            fn, args, future = self.queue.popleft()
+            if future is not None and future.cancelled():
+                continue
+            command_timer = MatchMailbox.command_timer
+            start = time.perf_counter() if command_timer is not None else 0
+            try:
+                result = await fn(*args)
+                if future is not None:
+                    future.set_result(result)
+            except Exception as e:
+                if future is not None:
+                    future.set_exception(e)
+                else:
+                    logger.error(f"Error in command {getattr(fn, '__name__', fn)} of match {self.match_id}: {e}")
+                    traceback.print_exc()
+            self.processed_count += 1
+            if command_timer is not None:
+                command_timer(fn, time.perf_counter() - start)
@@ -13,6 +13,9 @@ from src.game.match import TRESSETTE_MODE, LeaveMatchErrors, Match, MatchState,
 from src.game.users_info_mgr import users_info_mgr
 from src.game.tressette_config import config as tress_config
 from src.game.modules.sette_mezzo.sette_mezzo_match import SetteMezzoMatch
+from src.game.match_scheduler import MatchScheduler
+from src.game.match_index import MatchIndex
+from src.game.table_list import TableListCache
 
 
 logging.basicConfig(
@@ -21,6 +24,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger("game_match")  # Name your logger
 
+RERUN_MIN_DELAY = 0.1  # seconds, floor between two runs of the same match loop
+
 class JoinMatchErrors(Enum):
     SUCCESS = 0
     MATCH_STARTED = 1
@@ -34,37 +39,36 @@ class MatchManager:
         self.start_match_id = 1000
         self.matches: dict[int, Match] = {}
         self.user_matchids: dict[int, int] = {}
-        self._task = None
+        self.scheduler = MatchScheduler(self._run_match)
+        self.match_index = MatchIndex()  # open tables for quick play
+        self.table_list = TableListCache()  # public tables for the lobby
 
     def start(self):
-        """Starts the match manager loop."""
-        if self._task is None or self._task.done():
-            self._task = asyncio.create_task(self._loop())
+        """Starts the match scheduler."""
+        self.scheduler.start()
 
     def stop(self):
-        """Stops the match manager loop."""
-        if self._task:
-            self._task.cancel()
+        """Stops the match scheduler."""
+        self.scheduler.stop()
 
-    async def _loop(self):
-        """The main loop to manage matches."""
-        try:
-            while True:
-                for match in list(self.matches.values()):  # Use list() to avoid mutation issues.
-                    asyncio.create_task(self._run_match(match))  # Fire and forget
-                
-                await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            logger.info("MatchManager loop has been stopped.")
-        except Exception as e:
-            logger.error(f"Unexpected error in MatchManager loop: {e}")
+    def schedule_match(self, match: Match, when: float):
+        """Runs match.loop() at `when` (unix time)."""
+        if match.match_id in self.matches:
+            self.scheduler.schedule(match, when)
 
     async def _run_match(self, match: Match):
         """Run a single match loop and handle errors."""
+        if self.matches.get(match.match_id) is not match:
+            return
         try:
-            await match.loop()
+            await match.mailbox.call(match.loop)
         except Exception as e:
             logger.error(f"Error in match loop for match {match.match_id}: {e}")
+        # next thing the match waits for, not sooner than RERUN_MIN_DELAY
+        # so a deadline loop() could not act on is not retried in a tight loop
+        when = match.next_deadline()
+        if when is not None:
+            self.schedule_match(match, max(when, game_vars.get_clock().time() + RERUN_MIN_DELAY))
 
     async def _create_match(self, bet, player_mode = PLAYER_SOLO_MODE, is_private = False, point_mode = 11) -> Match:
         match_id = self.start_match_id
@@ -72,6 +76,8 @@ class MatchManager:
         match = TressetteMatch(match_id, bet, player_mode=player_mode, point_mode=point_mode)
         match.set_public(not is_private)
         self.matches[match_id] = match
+        self.match_index.update(match)
+        self.table_list.update(match)
         self.start_match_id += 1
         return match
 
@@ -80,12 +86,18 @@ class MatchManager:
         logger.info(f"Creating match {match_id}")
         match = SetteMezzoMatch(match_id)
         self.matches[match_id] = match
+        self.match_index.update(match)
+        self.table_list.update(match)
         self.start_match_id += 1
         return match
 
-    async def received_create_table(self, uid, payload):
-        create_table_pkg = packet_pb2.CreateTable()
-        create_table_pkg.ParseFromString(payload)
+    def on_match_changed(self, match: Match):
+        """Called by a match when its state, seats or visibility change."""
+        if self.matches.get(match.match_id) is match:
+            self.match_index.update(match)
+            self.table_list.update(match)
+
+    async def received_create_table(self, uid, create_table_pkg):
         bet = create_table_pkg.bet
         player_mode = create_table_pkg.player_mode
         point_mode = create_table_pkg.point_mode
@@ -147,54 +159,42 @@ class MatchManager:
                 if player.uid in self.user_matchids:
                     self.user_matchids.pop(player.uid)
             self.matches.pop(match_id)
+            self.match_index.remove(match)
+            self.table_list.remove(match)
+            self.scheduler.cancel(match)
+            match.mailbox.close()
+            game_vars.get_bot_pool().cancel_match(match_id)
             del match
 
     async def is_user_in_match(self, user_id):
         return user_id in self.user_matchids
     
     async def find_a_suitable_match_quickplay(self, gold) -> Match:
-        expect_match = None
         best_match = None
         best_diff = float('inf')
         should_choose_duo = random.choice([True, False]) # 50 %
-        
-        for match_id, match in self.matches.items():
-            # find terssette only
-            if match.game_mode != TRESSETTE_MODE:
-                continue
-            if not match.is_public:
-                continue
-    
-            if match.bet == 0:
-                # Bet = 0 is for review
+        player_modes = [PLAYER_SOLO_MODE, PLAYER_DUO_MODE] if should_choose_duo else [PLAYER_SOLO_MODE]
+
+        # Ensure user has enough gold to play: bet * multiplier <= gold
+        # Prioritize match with gold closest to 3 * min_gold_play
+        multiplier = tress_config.get('bet_multiplier_min')
+        for player_mode in player_modes:
+            match = self.match_index.find_closest(TRESSETTE_MODE, player_mode, gold / (3 * multiplier), gold / multiplier)
+            if match is None:
                 continue
+            diff = abs((3 * match.get_min_gold_play()) - gold)
+            if best_match is None or diff < best_diff:
+                best_match = match
+                best_diff = diff
 
-            if match.player_mode == PLAYER_DUO_MODE and not should_choose_duo:
-                continue
-            if match.state == MatchState.WAITING and not match.check_room_full():
-                # For current, only solo mode for quick play
-                min_gold = match.get_min_gold_play()
-                
-                # Ensure user has enough gold to play
-                if gold >= min_gold:
-                    # Prioritize match with gold closest to 2 * min_gold_play
-                    diff = abs((3 * min_gold) - gold)
-                    
-                    if best_match is None or diff < best_diff:
-                        best_match = match
-                        best_diff = diff
-                        
-        expect_match = best_match
-        return expect_match
+        return best_match
 
     
     async def user_join_match(self, match: Match, uid: int):
         self.user_matchids[uid] = match.match_id
-        await match.user_join(uid)
+        await match.mailbox.call(match.user_join, uid)
 
-    async def handle_register_leave_match(self, uid: int, payload):
-        leave_pkg = packet_pb2.RegisterLeaveGame()
-        leave_pkg.ParseFromString(payload)
+    async def handle_register_leave_match(self, uid: int, leave_pkg):
         status = leave_pkg.status
         # print(f"User {uid} leave game with status {status}")
         # leave_pkg.status = status.value
@@ -227,7 +227,7 @@ class MatchManager:
         if not match.can_quit_game(uid):
             return LeaveMatchErrors.MATCH_STARTED
         
-        await match.user_leave(uid, reason)
+        await match.mailbox.call(match.user_leave, uid, reason)
         self.user_matchids.pop(uid)
 
         if not match.check_has_real_players():
@@ -244,76 +244,16 @@ class MatchManager:
             if match.state == MatchState.WAITING:
                 await self.handle_user_leave_match(uid)
 
-    async def user_play_card(self, uid: int, payload):
+    async def user_play_card(self, uid: int, pkg):
         match = await self.get_match_of_user(uid)
         if match:
-            await match.user_play_card(uid, payload)
+            match.mailbox.post(match.user_play_card, uid, pkg)
 
     async def receive_request_table_list(self, uid):
-        matches = await self._prioritize_matches(self.matches, uid)  # Get the 20 matches closest to the user's gold
-        # priority table is waiting
-        match_ids = []
-        bets = []
-        player_modes = []
-        num_players = []
-        game_modes = []
-        avatars = []
-        uids = []
-
-        for match in matches:
-            # skip private match
-            if match.is_public is False:
-                continue
-            match_ids.append(match.match_id)
-            bets.append(match.bet)
-            player_modes.append(match.player_mode)
-            num_players.append(match.get_num_players())
-            game_modes.append(match.game_mode)
-
-            for player in match.players:
-                avatars.append(player.avatar)
-                uids.append(player.uid)
-
-        
-        print(f"Table list: {match_ids}")
-        pkg = packet_pb2.TableList()
-        pkg.table_ids.extend(match_ids)
-        pkg.bets.extend(bets)
-        pkg.player_modes.extend(player_modes)
-        pkg.num_players.extend(num_players)
-        pkg.game_modes.extend(game_modes)
-        pkg.avatars.extend(avatars)
-        pkg.player_uids.extend(uids)
-
-        # pkg = packet_pb2.TableList()
-        # pkg.table_ids.extend([1, 2, 3, 4, 5,6,7])
-        # pkg.bets.extend([100000, 2000000, 300000, 400000, 5000000, 400000, 5000000])
-        # pkg.player_modes.extend([2,2,4,4,2,2,2])
-        # pkg.num_players.extend([1,2,1,2,1,2,2])
-        # pkg.game_modes.extend([1,0,0,1,1,1,1])
-        # pkg.avatars.extend(["1", "2", "3", "4", "5", "6", "7", "8"])
-        # pkg.player_uids.extend([1, 2, -1, -1, 5, 6, 7, 8])
-
-        await game_vars.get_game_client().send_packet(uid, CMDs.TABLE_LIST, pkg)
-
-    async def _prioritize_matches(self, matches: dict[int, Match], uid: int) -> list[Match]:
-        MAX_MATCHES = 20  # Limit of prioritized matches
+        # the 20 public tables closest to the user's gold, waiting ones first
         user = await users_info_mgr.get_user_info(uid)
-        user_gold = user.gold
-
-        # Separate matches by state
-        waiting_matches = [match for match in matches.values() if match.state == MatchState.WAITING]
-        other_matches = [match for match in matches.values() if match.state != MatchState.WAITING]
-
-        # Sort matches by bet proximity to user's gold
-        waiting_matches.sort(key=lambda match: abs(match.bet * tress_config.get('bet_multiplier_min') - user_gold))
-        other_matches.sort(key=lambda match: abs(match.bet * tress_config.get('bet_multiplier_min') - user_gold))
-
-        # Combine matches, prioritizing waiting matches
-        prioritized_matches = waiting_matches + other_matches
-
-        # Return the top matches, limited to `MAX_MATCHES`
-        return prioritized_matches[:MAX_MATCHES]
+        payload = self.table_list.get_payload(user.gold)
+        await game_vars.get_game_client().send_payload(uid, CMDs.TABLE_LIST, payload)
 
     async def join_match(self, uid, match_id):
         match = await self.get_match(match_id)
@@ -336,7 +276,7 @@ class MatchManager:
         match = await self.get_match_of_user(uid)
         if match:
             print(f"User {uid} is in a match, reconnecting")
-            await match.user_reconnect(uid)
+            await match.mailbox.call(match.user_reconnect, uid)
             return
     
         user = await users_info_mgr.get_user_info(uid)
@@ -404,15 +344,11 @@ class MatchManager:
         join_pkg.error = status.value
         await game_vars.get_game_client().send_packet(uid, CMDs.JOIN_TABLE_BY_ID, join_pkg)
 
-    async def receive_user_join_match(self, uid, payload):
-        join_pkg = packet_pb2.JoinTableById()
-        join_pkg.ParseFromString(payload)
+    async def receive_user_join_match(self, uid, join_pkg):
         match_id = join_pkg.match_id
         await self._handle_user_join_by_match_id(uid, match_id)
 
-    async def receive_quick_play(self, uid, payload):
-        quick_play_pkg = packet_pb2.QuickPlay()
-        quick_play_pkg.ParseFromString(payload)
+    async def receive_quick_play(self, uid):
         await self._handle_quick_play(uid)
 
     def find_largest_bet_below(self, expect_bet):
@@ -426,10 +362,10 @@ class MatchManager:
         
         return suitable_bet
     
-    async def receive_game_action_napoli(self, uid, payload):
+    async def receive_game_action_napoli(self, uid):
         match = await self.get_match_of_user(uid)
         if match:
-            await match.receive_game_action_napoli(uid, payload)
+            match.mailbox.post(match.receive_game_action_napoli, uid)
 
     def get_gold_minimum_play(self):
         return tress_config.get('bets')[0] * tress_config.get('bet_multiplier_min')
@@ -0,0 +1,87 @@
+import asyncio
+import heapq
+import itertools
+import logging
+
+from src.game.game_vars import game_vars
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("match_scheduler")  # Name your logger
+
+
+class MatchScheduler:
+    """Deadline heap for all matches, served by one task.
+
+    A match registers the time its loop() has something to do (auto play, start countdown,
+    overtime) and run_match is called for it only once that time is reached. Each match has at
+    most one pending deadline, the earliest one; superseded heap entries are skipped when popped.
+    Times are read from the game clock, so the scheduler also runs under a VirtualClock.
+    """
+    def __init__(self, run_match):
+        self.run_match = run_match  # async callable, receives the match
+        self.heap: list[tuple[float, int, object]] = []  # (when, seq, match)
+        self.deadlines: dict[int, float] = {}  # match_id -> pending deadline
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task = None
+        self._timer = None  # clock timer that wakes _run at the head deadline
+
+        # metrics
+        self.fired_count = 0
+        self.max_lateness = 0.0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def schedule(self, match, when: float):
+        """Runs the match at `when` (unix time), unless an earlier run is already pending."""
+        pending = self.deadlines.get(match.match_id)
+        if pending is not None and pending <= when:
+            return
+        self.deadlines[match.match_id] = when
+        heapq.heappush(self.heap, (when, next(self._seq), match))
+        if self.heap[0][2] is match:
+            self._wakeup.set()
+
+    def cancel(self, match):
+        self.deadlines.pop(match.match_id, None)
+
+    async def _run(self):
+        try:
+            while True:
+                clock = game_vars.get_clock()
+                now = clock.time()
+                while self.heap and self.heap[0][0] <= now:
+                    when, _, match = heapq.heappop(self.heap)
+                    if self.deadlines.get(match.match_id) != when:
+                        continue  # cancelled or replaced by an earlier deadline
+                    del self.deadlines[match.match_id]
+                    self.fired_count += 1
+                    self.max_lateness = max(self.max_lateness, now - when)
+                    asyncio.create_task(self.run_match(match))
+
+                self._wakeup.clear()
+                if self.heap:
+                    self._timer = clock.call_later(self.heap[0][0] - now, self._wakeup.set)
+                await self._wakeup.wait()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+        except asyncio.CancelledError:
+            logger.info("MatchScheduler has been stopped.")
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": len(self.deadlines),
+            "heap_size": len(self.heap),
+            "fired": self.fired_count,
+            "max_lateness": self.max_lateness,
+        }
@@ -1,6 +1,7 @@
 
 
 from src.base.network.packets import packet_pb2
+from src.constants import LOGIN_GUEST
 from src.game.cmds import CMDs
 from src.game.game_vars import game_vars
 from src.postgres.orm import PsqlOrm
@@ -9,6 +10,9 @@ from sqlalchemy import update as sa_update
 
 
 class UserInfo:
+    __slots__ = ('uid', 'name', 'gold', 'level', 'avatar', 'avatar_third_party', 'is_active', 'last_time_received_support',
+                 'exp', 'game_count', 'win_count', 'received_startup', 'login_type', 'num_payments', 'time_show_ads',
+                 'time_ads_reward', 'num_claimed_ads')
     uid: int
     name: str
     gold: int
@@ -37,6 +41,14 @@ class UserInfo:
         self.is_active = is_active
         self.last_time_received_support = last_time_received_support
         self.received_startup = received_startup
+        self.exp = 0
+        self.game_count = 0
+        self.win_count = 0
+        self.login_type = LOGIN_GUEST
+        self.num_payments = 0
+        self.time_show_ads = 0
+        self.time_ads_reward = 0
+        self.num_claimed_ads = 0
 
         # Set default values
         if self.avatar_third_party is None:
@@ -1,26 +1,15 @@
 
 
-import time
 from src.base.network.packets import packet_pb2
 from src.game.cmds import CMDs
 from src.base.telegram import telegram_bot
 
-time_customer_by_uid = {}
 class CustomerServiceMgr:
-    async def on_receive_packet(self, uid: int, cmd_id: int, payload):
-        match cmd_id:
-            case CMDs.CUSTOMER_SERVICE_REPORT:
-                await self._handle_customer_service_report(uid, payload)
+    def register_cmds(self, router):
+        router.register(CMDs.CUSTOMER_SERVICE_REPORT, self._handle_customer_service_report, packet_pb2.CustomerServiceReport)
 
-    async def _handle_customer_service_report(self, uid: int, payload):
-        # check to prevent spam, each user only sent support in 24 hours
-        if uid in time_customer_by_uid:
-            if time_customer_by_uid[uid] + 24 * 3600 > time.time():
-                return
-        
-        time_customer_by_uid[uid] = time.time()
-        pkg = packet_pb2.CustomerServiceReport()
-        pkg.ParseFromString(payload)
+    async def _handle_customer_service_report(self, uid: int, pkg):
+        # one report per user in 24 hours, limited in config/rate_limit.json
         report_type = pkg.report_type
         report_content = pkg.report_content
 
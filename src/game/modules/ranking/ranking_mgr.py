@@ -6,6 +6,7 @@ import json
 import random
 
 from sqlalchemy import select
+from sqlalchemy import update as sa_update
 from src.base.network.packets import packet_pb2
 from src.game.users_info_mgr import users_info_mgr
 from src.game.cmds import CMDs
@@ -59,14 +60,9 @@ class RankingMgr:
 
         self.season_info = None
 
-    async def on_receive_packet(self, uid: int, cmd_id: int, payload):
-        match cmd_id:
-            case CMDs.RANKING_INFO:
-                await self.send_ranking_info(uid)
-            case CMDs.RANKING_CLAIM_REWARD:
-                print("Claim reward")
-                await self.claim_reward(uid, payload)
-        return
+    def register_cmds(self, router):
+        router.register(CMDs.RANKING_INFO, self.send_ranking_info)
+        router.register(CMDs.RANKING_CLAIM_REWARD, self.claim_reward, packet_pb2.RankingClaimReward)
     
     async def init_season(self):
         print("Initializing ranking season")
@@ -166,14 +162,17 @@ class RankingMgr:
                 player_db.score = score
                 await session.commit()
 
+        self._insert_sorted(player_to_update)
+
+    def _insert_sorted(self, player: RankingPlayerInfo):
         # Extract scores but negate them (to handle descending order as ascending)
         scores = [-p.score for p in self.players]
 
         # Find the correct insertion position
-        insert_pos = bisect.bisect_left(scores, -player_to_update.score)
+        insert_pos = bisect.bisect_left(scores, -player.score)
 
         # Insert player at the correct position
-        self.players.insert(insert_pos, player_to_update)
+        self.players.insert(insert_pos, player)
 
     async def add_player(self, uid: int):
         if not self.season_info:
@@ -272,9 +271,55 @@ class RankingMgr:
             return
         await self.update_user_score(uid, player.score + 1)
 
-    async def claim_reward(self, uid: int, payload):
-        claim_pkg = packet_pb2.RankingClaimReward()
-        claim_pkg.ParseFromString(payload)
+    async def stage_users_win_game(self, uids: list[int], session):
+        """on_user_win_game for the winners of one game, database side only: the changes are staged
+        on session and the caller commits them with the rest of the game's settlement. Returns what
+        to pass to apply_users_win_game() once the commit succeeded, None without a season."""
+        if not self.season_info:
+            return None
+        season_id = self.season_info.season_id
+        new_uids = [uid for uid in uids if uid not in self.player_map]
+        scored_uids = [uid for uid in uids if uid in self.player_map]
+        for uid in new_uids:
+            # add player to ranking
+            new_player = RankingPlayersSchema()
+            new_player.season_id = season_id
+            new_player.uid = uid
+            new_player.score = 0
+            session.add(new_player)
+
+        if scored_uids:
+            await session.execute(
+                sa_update(RankingPlayersSchema)
+                .where(
+                    (RankingPlayersSchema.uid.in_(scored_uids)) &
+                    (RankingPlayersSchema.season_id == self.season_info.season_id)
+                )
+                .values(score=RankingPlayersSchema.score + 1)
+            )
+        return season_id, new_uids, scored_uids
+
+    def apply_users_win_game(self, staged: tuple):
+        """Brings the ranking in memory in line with a committed stage_users_win_game()."""
+        season_id, new_uids, scored_uids = staged
+        if not self.season_info or self.season_info.season_id != season_id:
+            return  # a new season started meanwhile, it starts from the database
+        for uid in new_uids:
+            if uid not in self.player_map:
+                player = RankingPlayerInfo()
+                player.uid = uid
+                player.score = 0
+                self.players.append(player)
+                self.player_map[uid] = player
+        for uid in scored_uids:
+            player = self.player_map.get(uid)
+            if player is None:
+                continue
+            self.players.remove(player)
+            player.score += 1
+            self._insert_sorted(player)
+
+    async def claim_reward(self, uid: int, claim_pkg):
         season_id = claim_pkg.season_id
         print("Claim reward", season_id)
 
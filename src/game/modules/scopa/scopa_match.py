@@ -14,6 +14,7 @@ from src.constants import REASON_KICK_NOT_ENOUGH_GOLD
 from src.game.game_vars import game_vars
 from src.game.users_info_mgr import users_info_mgr
 from src.game.cmds import CMDs
+from src.game.match_mailbox import MatchMailbox
 from src.game.match import PLAYER_SOLO_MODE, TAX_PERCENT, TIME_AUTO_PLAY, TIME_START_TO_DEAL, Match, MatchPlayer, MatchState, PlayCardErrors
 from src.game.modules import game_exp
 
@@ -27,7 +28,8 @@ logger = logging.getLogger("scopa_match")  # Name your logger
 class ScopaMatch(Match):
     def __init__(self, match_id, bet, player_mode, point_mode):
         self.match_id = match_id
-        self.start_time = datetime.now()
+        self.mailbox = MatchMailbox(match_id)
+        self.start_time = game_vars.get_clock().now()
         self.end_time = None
         self.player_mode = player_mode
         self.players: list[MatchPlayer] = []
@@ -69,7 +71,7 @@ class ScopaMatch(Match):
             if self.state == MatchState.PLAYING:
                 pass
             elif self.state == MatchState.PREPARING_START:
-                if self.time_start != -1 and datetime.now().timestamp() > self.time_start:
+                if self.time_start != -1 and game_vars.get_clock().time() > self.time_start:
                     if self.check_room_full():
                         await self.start_game()
                     else:
@@ -79,10 +81,14 @@ class ScopaMatch(Match):
             traceback.print_exc()
             raise e
 
+    def next_deadline(self):
+        if self.state == MatchState.PREPARING_START and self.time_start != -1:
+            return self.time_start
+        return None
 
     def end_match(self):
         self.state = MatchState.ENDED
-        self.end_time = datetime.now()
+        self.end_time = game_vars.get_clock().now()
 
     async def user_join(self, user_id, is_bot=False):
         # check user in match
@@ -167,13 +173,14 @@ class ScopaMatch(Match):
 
     async def _prepare_start_game(self):
         self.state = MatchState.PREPARING_START
-        self.time_start = datetime.now().timestamp() + TIME_START_TO_DEAL
+        self.time_start = game_vars.get_clock().time() + TIME_START_TO_DEAL
         # Send to all players that game is starting, wait for 3 seconds
         pkg = packet_pb2.PrepareStartGame()
         pkg.time_start = int(self.time_start)
         print('Game is starting, wait for 3 seconds')
 
         await self.broadcast_pkg(CMDs.PREPARE_START_GAME, pkg)
+        self.schedule_loop()
 
 
     def check_can_join(self, uid: int):
@@ -264,7 +271,7 @@ class ScopaMatch(Match):
 
         print('Start game')
         self.state = MatchState.PLAYING
-        self.start_time = datetime.now()
+        self.start_time = game_vars.get_clock().now()
         self.current_turn = 0
         self.current_hand = -1
         self.time_auto_play = -1
@@ -329,10 +336,8 @@ class ScopaMatch(Match):
         await asyncio.sleep(2)
         await self._handle_new_hand()
 
-    async def user_play_card(self, uid, payload):
+    async def user_play_card(self, uid, pkg):
         print(f"Receive play card from user {uid}")
-        pkg = packet_pb2.PlayCard()
-        pkg.ParseFromString(payload)
         card_id = pkg.card_id
         await self._play_card(uid, card_id, auto=False)
     
@@ -350,12 +355,13 @@ class ScopaMatch(Match):
                 return False
         return True
 
-    async def user_reconnect(self, uid):
+    async def user_reconnect(self, uid, send_game_info=True):
        # remove state auto play if has
        self.auto_play_count_by_uid.pop(uid, None)
        self.users_auto_play.pop(uid, None)
 
-       await self._send_game_info(uid)
+       if send_game_info:
+           await self._send_game_info(uid)
 
     async def deal_card(self):
         self.cards = []
@@ -547,12 +553,8 @@ class ScopaMatch(Match):
                 await game_vars.get_match_mgr().handle_user_leave_match(uid)
     
     async def broadcast_pkg(self, cmd_id, pkg, ignore_uids=[]):
-        for player in self.players:
-            if player.is_bot or player.uid == -1:
-                continue
-            if player.uid in ignore_uids:
-                continue
-            await game_vars.get_game_client().send_packet(player.uid, cmd_id, pkg)
+        uids = [player.uid for player in self.players if not player.is_bot and player.uid != -1]
+        await game_vars.get_game_client().broadcast_packet(uids, cmd_id, pkg, ignore_uids)
 
     async def broadcast_chat_message(self, uid, message):
         pkg = packet_pb2.InGameChatMessage()
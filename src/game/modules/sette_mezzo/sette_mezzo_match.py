@@ -14,6 +14,9 @@ from src.constants import MIN_GOLD_PLAY_SETTE_MEZZO, REASON_KICK_NOT_ENOUGH_GOLD
 from src.game.game_vars import game_vars
 from src.game.users_info_mgr import users_info_mgr
 from src.game.cmds import CMDs
+from src.game.match_mailbox import MatchMailbox
+from src.game.match_flow import MatchFlow, get_timing
+from src.game.settlement import Settlement
 from src.game.match import PLAYER_SOLO_MODE, SETTE_MEZZO_MODE, TAX_PERCENT, TIME_AUTO_PLAY, TIME_START_TO_DEAL, TRESSETTE_CARDS, Match, MatchBot, MatchPlayer, MatchState, PlayCardErrors
 from src.game.modules import game_exp
 
@@ -27,7 +30,19 @@ TIME_THINKING = 10
 BANKER_DEFAULT_UID = -100
 BANKER_DEFAULT_TURN = -100
 TIME_BETTING = 10
+
+# state -> states the match can move to
+SETTE_MEZZO_TRANSITIONS = {
+    MatchState.WAITING: (MatchState.PREPARING_START,),
+    MatchState.PREPARING_START: (MatchState.WAITING, MatchState.BETTING),
+    MatchState.BETTING: (MatchState.PLAYING,),
+    MatchState.PLAYING: (MatchState.ENDED,),
+    MatchState.ENDED: (MatchState.WAITING,),
+}
+
 class SetteMezzoPlayer(MatchPlayer):
+    __slots__ = ('is_done_turn', 'is_bursted')
+
     # override auto play card
     def __init__(self, uid, match):
         super().__init__(uid, match)
@@ -43,7 +58,8 @@ class SetteMezzoMatch(Match):
     def __init__(self, match_id):
         self.bet = 0
         self.match_id = match_id
-        self.start_time = datetime.now()
+        self.mailbox = MatchMailbox(match_id)
+        self.start_time = game_vars.get_clock().now()
         self.end_time = None
         self.player_mode = 4
         self.players: list[SetteMezzoPlayer] = []
@@ -53,6 +69,7 @@ class SetteMezzoMatch(Match):
         self.auto_play_count_by_uid = {} # consecutive auto play count
         self.users_auto_play = {} # uids that are auto play, server will not wait for them
         self.state = MatchState.WAITING
+        self.flow = MatchFlow(self, SETTE_MEZZO_TRANSITIONS)
         self.current_turn = -1
         self.register_leave_uids = set()
         self.win_team = -1
@@ -80,31 +97,33 @@ class SetteMezzoMatch(Match):
 
     def set_public(self, is_public):
         self.is_public = is_public
+        self.notify_changed()
+
+    def is_open_for_quick_play(self) -> bool:
+        return not self.check_room_full()
     
     async def loop(self):
         try:
             if self.state == MatchState.PLAYING:
                 if self.current_turn != BANKER_DEFAULT_UID and self.current_turn != -1 and \
-                        self.time_auto_play != -1 and datetime.now().timestamp() > self.time_auto_play:
+                        self.time_auto_play != -1 and game_vars.get_clock().time() > self.time_auto_play:
                     player = self.playing_users[self.current_turn]
                     if player:
                         await player.auto_play()
-
-            elif self.state == MatchState.PREPARING_START:
-                if self.time_start != -1 and datetime.now().timestamp() > self.time_start:
-                    if self.check_has_real_players():
-                        await self.start_game()
-                    else:
-                        self.state = MatchState.WAITING
-                        self.time_start = -1
         except Exception as e:
             traceback.print_exc()
             raise e
 
+    def next_deadline(self):
+        if self.state == MatchState.PLAYING:
+            if self.current_turn != BANKER_DEFAULT_UID and self.current_turn != -1 and \
+                    self.time_auto_play != -1:
+                return self.time_auto_play
+        return None
 
     def end_match(self):
         self.state = MatchState.ENDED
-        self.end_time = datetime.now()
+        self.end_time = game_vars.get_clock().now()
 
     async def user_join(self, user_id, is_bot=False):
         # check user in match
@@ -144,6 +163,7 @@ class SetteMezzoMatch(Match):
 
         seat_server_id = slot_idx
         self.players[slot_idx] = match_player
+        self.notify_changed()
         team_id = match_player.team_id
 
         pkg = packet_pb2.SetteMezzoNewUserJoinMatch()
@@ -190,8 +210,9 @@ class SetteMezzoMatch(Match):
             self.task_gen_bot = None
 
     async def _prepare_start_game(self):
-        self.state = MatchState.PREPARING_START
-        self.time_start = datetime.now().timestamp() 
+        self.flow.transition(MatchState.PREPARING_START)
+        self.time_start = game_vars.get_clock().time() 
+        self.flow.schedule("start_game", 0, self._start_game_if_has_players)
         # Send to all players that game is starting, wait for 3 seconds
         # pkg = packet_pb2.SetteMezzoPrepareStartGame()
         # # print('Game is starting, wait for 3 seconds')
@@ -199,6 +220,13 @@ class SetteMezzoMatch(Match):
         # await self.broadcast_pkg(CMDs.SETTE_MEZZO_PREPARE_START_GAME, pkg)
 
 
+    async def _start_game_if_has_players(self):
+        if self.check_has_real_players():
+            await self.start_game()
+        else:
+            self.flow.transition(MatchState.WAITING)
+            self.time_start = -1
+
     def check_can_join(self, uid: int):
         if self.state == MatchState.WAITING:
             return True
@@ -276,6 +304,7 @@ class SetteMezzoMatch(Match):
             if player.uid == uid:
                 self.players[i] = SetteMezzoPlayer(-1, self)
                 break
+        self.notify_changed()
 
     async def start_game(self):
         self.unique_game_id = str(uuid.uuid4())
@@ -298,8 +327,8 @@ class SetteMezzoMatch(Match):
             return
 
         print('Start game Sette mezo')
-        self.state = MatchState.BETTING
-        self.start_time = datetime.now()
+        self.flow.transition(MatchState.BETTING)
+        self.start_time = game_vars.get_clock().now()
         self.current_turn = -1
         self.time_auto_play = -1
         self.win_player = None
@@ -311,7 +340,7 @@ class SetteMezzoMatch(Match):
         self.is_end_round = False
         self.hand_in_round = -1
         self.banker_cards = []
-        self.time_end_bet = int(datetime.now().timestamp() + TIME_BETTING)
+        self.time_end_bet = int(game_vars.get_clock().time() + TIME_BETTING)
 
         # Init player golds
         for player in self.playing_users:
@@ -334,9 +363,10 @@ class SetteMezzoMatch(Match):
         pkg.time_end_bet = self.time_end_bet
         pkg.playing_uids.extend(playing_uids)
         await self.broadcast_pkg(CMDs.SETTE_MEZZO_BETTING, pkg)
-        # Sleep for 5 seconds for betting
-        await asyncio.sleep(TIME_BETTING)
+        # Wait TIME_BETTING seconds for betting
+        self.flow.schedule("end_betting", TIME_BETTING, self._end_betting, players_gold)
 
+    async def _end_betting(self, players_gold):
         # before start playing game, need to auto bet for user with bet = 0
         for player in self.playing_users:
             if player.bet == 0:
@@ -345,7 +375,7 @@ class SetteMezzoMatch(Match):
                     bet_expect = 1000
                 await self.user_bet(player.uid, bet_expect)
 
-        self.state = MatchState.PLAYING
+        self.flow.transition(MatchState.PLAYING)
 
         # calculate maxgold banker win
         self.max_gold_banker_win = 0
@@ -377,19 +407,22 @@ class SetteMezzoMatch(Match):
 
         await self.broadcast_pkg(CMDs.SETTE_MEZZO_START_GAME, pkg)
 
-        # wait for 2 seconds
-        await asyncio.sleep(1)
+        # wait for 1 second
+        self.flow.schedule("first_turn", get_timing("sette_mezzo_first_turn"), self._first_turn)
+
+    async def _first_turn(self):
         # random current turn from playing users
         if len(self.playing_users) > 0:
             self.current_turn = random.randint(0, len(self.playing_users) - 1)
         else:
             self.current_turn = 0
         await self.players[self.current_turn].on_turn()
-        self.time_auto_play = TIME_THINKING + datetime.now().timestamp()
+        self.time_auto_play = TIME_THINKING + game_vars.get_clock().time()
+        self.schedule_loop()
         # send to user on turn
         await self.send_update_turn()
 
-    async def user_play_card(self, uid, payload):
+    async def user_play_card(self, uid, pkg):
         pass
     
     async def _send_card_play_response(self, uid, status: PlayCardErrors):
@@ -403,20 +436,20 @@ class SetteMezzoMatch(Match):
     def check_done_hand(self):
         return True
 
-    async def user_reconnect(self, uid):
+    async def user_reconnect(self, uid, send_game_info=True):
        # remove state auto play if has
        self.auto_play_count_by_uid.pop(uid, None)
        self.users_auto_play.pop(uid, None)
 
-       await self._send_game_info(uid)
+       if send_game_info:
+           await self._send_game_info(uid)
 
     async def end_hand(self):
         pass
     
     async def _on_end_round(self):
         # wait for 2 seconds
-        await asyncio.sleep(2)
-        await self._on_new_round()
+        self.flow.schedule("new_round", get_timing("end_round"), self._on_new_round)
 
     async def _on_new_round(self):
         pass
@@ -462,7 +495,8 @@ class SetteMezzoMatch(Match):
         return score
     
     async def end_game(self):
-        self.state = MatchState.ENDED
+        self.flow.transition(MatchState.ENDED)
+        self.flow.cancel()
 
         # banker score
         banker_score = self.get_score_cards(self.banker_cards)
@@ -470,6 +504,8 @@ class SetteMezzoMatch(Match):
             banker_score = 0
         
         results = []
+        # balances of all players are stored in one transaction, see Settlement
+        settlement = Settlement('gold', 'exp')
         for player in self.playing_users:
             if player.is_bot:
                 continue
@@ -501,8 +537,7 @@ class SetteMezzoMatch(Match):
                 write_log(player.uid, "end_game_sette_mezzo", "", [self.unique_match_id, self.unique_game_id, gold_change])
 
             user_info.add_exp(added_exp)
-            await user_info.commit_to_database('gold', 'exp')
-            await user_info.send_update_money()
+            settlement.add(user_info)
 
             results.append({
                 "uid": player.uid,
@@ -512,6 +547,9 @@ class SetteMezzoMatch(Match):
                 "gold_curent": user_info.gold,
             })
 
+        # raises if the balances could not be stored, clients are then not told they changed
+        await settlement.commit()
+        await settlement.notify()
 
         # send to users
         pkg = packet_pb2.SetteMezzoEndGame()
@@ -536,20 +574,22 @@ class SetteMezzoMatch(Match):
         for player in self.players:
             player.is_in_game = False
         
-        # wait for 0.5 seconds
-        await asyncio.sleep(1)
+        # wait for 1 second
+        self.flow.schedule("end_game", get_timing("sette_mezzo_end_game"), self._send_end_game, pkg)
+
+    async def _send_end_game(self, pkg):
         await self.broadcast_pkg(CMDs.SETTE_MEZZO_END_GAME, pkg)
         
-        await asyncio.sleep(1.5)
+        self.flow.schedule("show_result", get_timing("sette_mezzo_next_game"), self._after_end_game)
 
+    async def _after_end_game(self):
          # User can quit the room now
-        self.state = MatchState.WAITING 
+        self.flow.transition(MatchState.WAITING)
 
         # for user register exit room, or auto play, or disconnect
         await self.update_users_staying_endgame()
 
         # next game
-        await asyncio.sleep(0)
         if self.check_has_real_players():
             await self._prepare_start_game()
 
@@ -590,12 +630,8 @@ class SetteMezzoMatch(Match):
                 await game_vars.get_match_mgr().handle_user_leave_match(uid)
     
     async def broadcast_pkg(self, cmd_id, pkg, ignore_uids=[]):
-        for player in self.players:
-            if player.is_bot or player.uid == -1:
-                continue
-            if player.uid in ignore_uids:
-                continue
-            await game_vars.get_game_client().send_packet(player.uid, cmd_id, pkg)
+        uids = [player.uid for player in self.players if not player.is_bot and player.uid != -1]
+        await game_vars.get_game_client().broadcast_packet(uids, cmd_id, pkg, ignore_uids)
 
     async def broadcast_chat_message(self, uid, message):
         pkg = packet_pb2.InGameChatMessage()
@@ -709,10 +745,10 @@ class SetteMezzoMatch(Match):
         if score > 7.5:
             p.is_done_turn = True
             p.is_bursted = True
-            await asyncio.sleep(0.5)
-            await self.move_to_next_turn()
+            self.flow.schedule("next_turn", get_timing("sette_mezzo_bursted"), self.move_to_next_turn)
         else:
-            self.time_auto_play = datetime.now().timestamp() + TIME_THINKING
+            self.time_auto_play = game_vars.get_clock().time() + TIME_THINKING
+            self.schedule_loop()
             await p.on_turn()
             await self.send_update_turn()
 
@@ -750,9 +786,10 @@ class SetteMezzoMatch(Match):
             self.current_turn = 0
         
         p = self.playing_users[self.current_turn]
-        self.time_auto_play = datetime.now().timestamp() + TIME_THINKING
+        self.time_auto_play = game_vars.get_clock().time() + TIME_THINKING
         if p.is_done_turn:
             self.current_turn = BANKER_DEFAULT_TURN
+        self.schedule_loop()
         
         await p.on_turn()
         # send update turn to all players
@@ -763,22 +800,24 @@ class SetteMezzoMatch(Match):
 
         if self.current_turn == BANKER_DEFAULT_TURN:
             # banker turn
-            await asyncio.sleep(0.5)
-            pkg = packet_pb2.SetteMezzoShowBankerCard()
-            pkg.card_id = self.banker_cards[0]
-            await self.broadcast_pkg(CMDs.SETTE_MEZZO_SHOW_BANKER_CARD, pkg)
-
-            # check if all user bursted -> end game
-            all_bursted = True
-            for player in self.playing_users:
-                if not player.is_bursted:
-                    all_bursted = False
-                    break
-            if all_bursted:
-                # banker is bursted, end game
-                await self.end_game()
-            else:
-                await self.banker_play()
+            self.flow.schedule("show_banker_card", get_timing("sette_mezzo_show_banker_card"), self._show_banker_card)
+
+    async def _show_banker_card(self):
+        pkg = packet_pb2.SetteMezzoShowBankerCard()
+        pkg.card_id = self.banker_cards[0]
+        await self.broadcast_pkg(CMDs.SETTE_MEZZO_SHOW_BANKER_CARD, pkg)
+
+        # check if all user bursted -> end game
+        all_bursted = True
+        for player in self.playing_users:
+            if not player.is_bursted:
+                all_bursted = False
+                break
+        if all_bursted:
+            # banker is bursted, end game
+            await self.end_game()
+        else:
+            await self.banker_play()
 
     async def banker_hit(self):
         # banker hit
@@ -837,8 +876,10 @@ class SetteMezzoMatch(Match):
         return False
 
     async def banker_play(self):
+        self.flow.schedule("banker_play", get_timing("sette_mezzo_banker_think"), self._banker_decide)
+
+    async def _banker_decide(self):
         # banker score
-        await asyncio.sleep(1)
         should_stand = True
         banker_score = self.get_banker_score()
 
@@ -911,9 +952,7 @@ class SetteMezzoMatch(Match):
         pkg.play_turn_time = int(self.time_auto_play)
         await self.broadcast_pkg(CMDs.SETTE_MEZZO_UPDATE_TURN, pkg)
     
-    async def receive_user_bet(self, uid, payload):
-        pkg = packet_pb2.SetteMezzoUserBet()
-        pkg.ParseFromString(payload)
+    async def receive_user_bet(self, uid, pkg):
         bet = pkg.bet
         pkg.uid = uid
 
@@ -963,11 +1002,10 @@ class SetteMezzoMatch(Match):
 class SetteMezzoBot(MatchBot):
     async def on_turn(self):
         print(f"Bot {self.uid} turn")
-        # create a task to play
-        asyncio.create_task(self.user_play())
+        # play after 1 second
+        self.match_mgr.mailbox.post_after(1, self.user_play)
     
     async def user_play(self):
-        await asyncio.sleep(1)
         # stand
         should_stand = random.choice([True, False])
         if should_stand:
@@ -977,16 +1015,15 @@ class SetteMezzoBot(MatchBot):
         pass
 
     async def on_bet_start(self):
-        asyncio.create_task(self._on_bet())
+        self.match_mgr.mailbox.post_after(1, self._on_bet)
 
     async def _on_bet(self):
-        await asyncio.sleep(1)
         # bet
         bet = random.randint(10000, 1000000)
         await self.match_mgr.user_bet(self.uid, bet)
         # should continue to bet
         if random.choice([True, False]):
-            await self._on_bet()
+            self.match_mgr.mailbox.post_after(1, self._on_bet)
         else:
             return
 
@@ -9,33 +9,33 @@ from src.game.match import SETTE_MEZZO_MODE
 
 class SetteMezzoMgr:
     
-    async def on_receive_packet(self, uid: int, cmd_id: int, payload):
-        match cmd_id:
-            case CMDs.SETTE_MEZZO_QUICK_PLAY:
-                await self._quick_play(uid, payload)
-                pass
-            case CMDs.SETTE_MEZZO_ACTION_HIT:
-                mat = await game_vars.get_match_mgr().get_match_of_user(uid)
-                if mat:
-                    await mat.user_hit(uid, payload)
-            case CMDs.SETTE_MEZZO_ACTION_STAND:
-                mat = await game_vars.get_match_mgr().get_match_of_user(uid)
-                if mat:
-                    await mat.user_stand(uid, payload)
-            case CMDs.SETTE_MEZZO_USER_BET:
-                mat = await game_vars.get_match_mgr().get_match_of_user(uid)
-                if mat:
-                    await mat.receive_user_bet(uid, payload)
-
-    async def _quick_play(self, uid: int, payload):
-        quick_play_pkg = packet_pb2.SetteMezzoQuickPlay()
-        quick_play_pkg.ParseFromString(payload)
+    def register_cmds(self, router):
+        router.register(CMDs.SETTE_MEZZO_QUICK_PLAY, self._quick_play)
+        router.register(CMDs.SETTE_MEZZO_ACTION_HIT, self._user_hit)
+        router.register(CMDs.SETTE_MEZZO_ACTION_STAND, self._user_stand)
+        router.register(CMDs.SETTE_MEZZO_USER_BET, self._user_bet, packet_pb2.SetteMezzoUserBet)
 
+    async def _user_hit(self, uid: int):
+        mat = await game_vars.get_match_mgr().get_match_of_user(uid)
+        if mat:
+            mat.mailbox.post(mat.user_hit, uid, None)
+
+    async def _user_stand(self, uid: int):
+        mat = await game_vars.get_match_mgr().get_match_of_user(uid)
+        if mat:
+            mat.mailbox.post(mat.user_stand, uid, None)
+
+    async def _user_bet(self, uid: int, pkg):
+        mat = await game_vars.get_match_mgr().get_match_of_user(uid)
+        if mat:
+            mat.mailbox.post(mat.receive_user_bet, uid, pkg)
+
+    async def _quick_play(self, uid: int):
         match_mgr = game_vars.get_match_mgr()
         match = await match_mgr.get_match_of_user(uid)
         if match:
             print(f"User {uid} is in a match, reconnecting")
-            await match.user_reconnect(uid)
+            await match.mailbox.call(match.user_reconnect, uid)
             return
         
         user = await users_info_mgr.get_user_info(uid)
@@ -45,13 +45,7 @@ class SetteMezzoMgr:
         
         # find a match
         if not match:
-            for match_id, m in game_vars.get_match_mgr().matches.items():
-                if m.game_mode != SETTE_MEZZO_MODE:
-                    continue
-                if m.check_room_full():
-                    continue
-                match = m
-                break
+            match = match_mgr.match_index.find_any(SETTE_MEZZO_MODE)
         if not match:
             match = await game_vars.get_match_mgr().create_sette_mezzo_match()
         await game_vars.get_match_mgr().user_join_match(match, uid)
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import traceback
+
+from sqlalchemy import update as sa_update
+
+from src.game.game_vars import game_vars
+from src.game.models import UserInfo
+from src.postgres.orm import PsqlOrm
+from src.postgres.sql_models import UserInfoSchema
+
+logging.basicConfig(
+    level=logging.INFO,  # Set logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log format
+)
+logger = logging.getLogger("settlement")  # Name your logger
+
+COMMIT_ATTEMPTS = 3
+COMMIT_RETRY_DELAY = 0.2  # seconds, times the attempt number
+
+
+class Settlement:
+    """End of game changes of one table, written to the database in one transaction.
+
+    The match applies balances, stats and debt releases to the cached UserInfo, add()s each player,
+    then commit()s once: one UPDATE of user_info for all players plus the ranking score increments.
+    notify() sends the new balances once they are stored; commit() raises if they could not be.
+    """
+    def __init__(self, *fields: str):
+        self.fields = fields  # UserInfo fields written
+        self.users: list[UserInfo] = []
+        self.ranking_winners: list[int] = []  # uids whose ranking score goes up
+
+    def add(self, user_info: UserInfo, ranking_win: bool = False):
+        self.users.append(user_info)
+        if ranking_win:
+            self.ranking_winners.append(user_info.uid)
+
+    async def commit(self):
+        """Stores the changes, tried COMMIT_ATTEMPTS times before the last error is raised. The ranking
+        is updated in memory only once its rows are stored."""
+        if not self.users:
+            return
+        rows = [{"uid": user.uid, **{field: getattr(user, field) for field in self.fields}} for user in self.users]
+        for attempt in range(1, COMMIT_ATTEMPTS + 1):
+            try:
+                ranking = await self._commit_once(rows)
+                break
+            except Exception as e:
+                logger.error(f"Settlement of users {[user.uid for user in self.users]} failed, attempt {attempt}: {e}")
+                if attempt == COMMIT_ATTEMPTS:
+                    raise
+                await asyncio.sleep(COMMIT_RETRY_DELAY * attempt)
+        if ranking is not None:
+            game_vars.get_ranking_mgr().apply_users_win_game(ranking)
+
+    async def _commit_once(self, rows: list[dict]):
+        async with PsqlOrm.get().session() as session:
+            # bulk UPDATE by primary key, one executemany
+            await session.execute(sa_update(UserInfoSchema), rows)
+            ranking = None
+            if self.ranking_winners:
+                try:
+                    # a savepoint: a failed ranking update must not cost the players their balances
+                    async with session.begin_nested():
+                        ranking = await game_vars.get_ranking_mgr().stage_users_win_game(self.ranking_winners, session)
+                except Exception as e:
+                    logger.error(f"Ranking update of users {self.ranking_winners} failed: {e}")
+                    traceback.print_exc()
+                    ranking = None
+            await session.commit()
+            return ranking
+
+    async def notify(self):
+        for user in self.users:
+            await user.send_update_money()
@@ -0,0 +1,179 @@
+import contextlib
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from src.base.logs import logs_mgr
+from src.game.bot.bot_pool import BotPool
+from src.game.clock import VirtualClock
+from src.game.cmds import CMDs
+from src.game.game_vars import game_vars
+from src.game.match import PLAYER_SOLO_MODE, MatchState
+from src.game.match_mailbox import MatchMailbox
+from src.game.users_info_mgr import users_info_mgr
+
+REFILL_INTERVAL = 1  # virtual seconds between checks for tables that lost a bot
+START_TIME = 1_700_000_000  # virtual unix time the simulation starts at
+
+
+class NullGameClient:
+    """Game client without connections: serializes every packet like the real one, counts it
+    per cmd and drops it."""
+    def __init__(self):
+        self.packets_by_cmd: dict[int, int] = {}
+        self.bytes_sent = 0
+
+    async def send_packet(self, uid, cmd_id, pkt):
+        self._count(cmd_id, pkt)
+
+    async def send_payload(self, uid, cmd_id, payload):
+        self.packets_by_cmd[cmd_id] = self.packets_by_cmd.get(cmd_id, 0) + 1
+        self.bytes_sent += len(payload)
+
+    async def broadcast_packet(self, uids, cmd_id, pkt, ignore_uids=()):
+        self._count(cmd_id, pkt)
+
+    def _count(self, cmd_id, pkt):
+        self.packets_by_cmd[cmd_id] = self.packets_by_cmd.get(cmd_id, 0) + 1
+        self.bytes_sent += len(pkt.SerializeToString())
+
+
+def percentile(samples: list[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+
+class Simulation:
+    """Bot only TressetteMatch tables played on a VirtualClock, no websockets, database or timers.
+
+    Bots are kept in the users cache, so matches never reach Postgres; tables are private so no
+    bot is generated and a table that loses a bot at the end of a game is refilled here instead.
+    """
+    def __init__(self, games: int, tables: int, bet: int = 1000, player_mode: int = PLAYER_SOLO_MODE,
+                 point_mode: int = 11, seed: int = 0, trace_alloc: bool = False):
+        self.games = games
+        self.tables = tables
+        self.bet = bet
+        self.player_mode = player_mode
+        self.point_mode = point_mode
+        self.seed = seed
+        self.trace_alloc = trace_alloc
+        self.clock = VirtualClock(start=START_TIME)
+        self.client = NullGameClient()
+        self.matches = []
+        self.bot_uids: set[int] = set()
+        self.command_times: list[float] = []
+
+    async def run(self) -> dict:
+        random.seed(self.seed)
+        old_clock, old_client, old_bot_pool = game_vars.clock, game_vars.game_client, game_vars.bot_pool
+        game_vars.set_clock(self.clock)
+        game_vars.game_client = self.client
+        # bots search on the loop: worker processes take real time, the virtual clock would not wait
+        game_vars.bot_pool = BotPool(0, 0)
+        MatchMailbox.command_timer = self._on_command
+        logging.disable(logging.INFO)
+        if self.trace_alloc:
+            tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        # matches and bots print a lot, keep the report readable
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            try:
+                start = time.perf_counter()
+                await self._play()
+                elapsed = time.perf_counter() - start
+                return self._report(elapsed, blocks_before)
+            finally:
+                if self.trace_alloc:
+                    tracemalloc.stop()
+                self._cleanup()
+                logging.disable(logging.NOTSET)
+                MatchMailbox.command_timer = None
+                game_vars.set_clock(old_clock)
+                game_vars.game_client = old_client
+                game_vars.bot_pool = old_bot_pool
+
+    async def _play(self):
+        match_mgr = game_vars.get_match_mgr()
+        for _ in range(self.tables):
+            match = await match_mgr._create_match(self.bet, self.player_mode, True, self.point_mode)
+            self.matches.append(match)
+            await match.mailbox.call(self._fill, match)
+        self.clock.call_later(REFILL_INTERVAL, self._on_refill_timer)
+        await self.clock.run(stop=self._is_done)
+
+    def _is_done(self) -> bool:
+        return self.client.packets_by_cmd.get(CMDs.END_GAME, 0) >= self.games
+
+    def _on_refill_timer(self):
+        if self._is_done():
+            return
+        for match in self.matches:
+            if match.state == MatchState.WAITING and not match.check_room_full():
+                match.mailbox.post(self._fill, match)
+        self.clock.call_later(REFILL_INTERVAL, self._on_refill_timer)
+
+    async def _fill(self, match):
+        seated = {player.uid for player in match.players}
+        for uid in self.bot_uids - seated:
+            users_info_mgr.users.pop(uid, None)
+        self.bot_uids &= seated
+
+        bots_mgr = game_vars.get_bots_mgr()
+        while not match.check_room_full():
+            uid = bots_mgr.get_free_bot_uid()
+            user = bots_mgr.fake_data_for_bot(uid, match.bet)
+            users_info_mgr.users[uid] = user
+            self.bot_uids.add(uid)
+            await match.user_join(uid, is_bot=True)
+
+    def _on_command(self, fn, seconds: float):
+        self.command_times.append(seconds)
+
+    def _report(self, elapsed: float, blocks_before: int) -> dict:
+        games = self.client.packets_by_cmd.get(CMDs.END_GAME, 0)
+        hands = self.client.packets_by_cmd.get(CMDs.END_HAND, 0)
+        report = {
+            "games": games,
+            "hands": hands,
+            "tables": self.tables,
+            "player_mode": self.player_mode,
+            "wall_seconds": elapsed,
+            "virtual_seconds": self.clock.time() - START_TIME,
+            "games_per_sec": games / elapsed if elapsed else 0,
+            "hands_per_sec": hands / elapsed if elapsed else 0,
+            "commands": len(self.command_times),
+            "command_p50_us": percentile(self.command_times, 50) * 1e6,
+            "command_p99_us": percentile(self.command_times, 99) * 1e6,
+            "command_max_us": max(self.command_times, default=0) * 1e6,
+            "packets": sum(self.client.packets_by_cmd.values()),
+            "bytes": self.client.bytes_sent,
+            "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before,
+        }
+        if self.trace_alloc:
+            current, peak = tracemalloc.get_traced_memory()
+            report["traced_current_bytes"] = current
+            report["traced_peak_bytes"] = peak
+        return report
+
+    def _cleanup(self):
+        match_mgr = game_vars.get_match_mgr()
+        for match in self.matches:
+            match_mgr.destroy_match(match.match_id)
+        for uid in self.bot_uids:
+            users_info_mgr.users.pop(uid, None)
+            game_vars.get_bots_mgr().destroy_bot(uid)
+        self.bot_uids.clear()
+        self.matches.clear()
+        logs_mgr.log_buffer.clear()  # bot games only write logs nobody reads
+
+
+async def run_simulation(games: int, tables: int, **kwargs) -> dict:
+    """Plays `games` games over `tables` tables and returns the report. Several simulations of
+    one process must run on the same event loop, the match manager is bound to it."""
+    return await Simulation(games, tables, **kwargs).run()
@@ -0,0 +1,112 @@
+import bisect
+import math
+
+from src.base.network.packets import packet_pb2
+from src.game.match import MatchState
+from src.game.tressette_config import config as tress_config
+
+MAX_TABLES = 20  # tables sent in a TableList
+GOLD_BUCKETS_PER_DOUBLING = 4  # users whose gold differs by less than ~19% share a cached TableList
+
+
+def gold_bucket(gold: int) -> int:
+    return int(math.log2(max(gold, 1)) * GOLD_BUCKETS_PER_DOUBLING)
+
+
+def bucket_gold(bucket: int) -> float:
+    """Gold the TableList of a bucket is built for, the middle of the bucket."""
+    return 2 ** ((bucket + 0.5) / GOLD_BUCKETS_PER_DOUBLING)
+
+
+class TableListCache:
+    """Public tables sorted by bet, plus the serialized TableList of every gold bucket asked for.
+
+    Tables are listed waiting ones first, each group by proximity of bet * bet_multiplier_min to
+    the user's gold. The match manager calls update() when a match changes state, seats or
+    visibility; only a change to a public table drops the cached payloads.
+    """
+    def __init__(self):
+        self.waiting: list[tuple[int, int]] = []  # (bet, match_id) of public waiting tables
+        self.others: list[tuple[int, int]] = []  # (bet, match_id) of the other public tables
+        self.matches: dict[int, object] = {}  # match_id -> match, public tables only
+        self.entries: dict[int, tuple[bool, int]] = {}  # match_id -> (in waiting, bet) as stored in the lists
+        self.payloads: dict[int, bytes] = {}  # gold bucket -> serialized TableList
+
+        # metrics
+        self.hit_count = 0
+        self.build_count = 0
+
+    def update(self, match):
+        if not match.is_public and match.match_id not in self.entries:
+            return
+        self.remove(match)
+        if match.is_public:
+            entry = (match.state == MatchState.WAITING, match.bet)
+            bisect.insort(self.waiting if entry[0] else self.others, (match.bet, match.match_id))
+            self.matches[match.match_id] = match
+            self.entries[match.match_id] = entry
+        self.payloads.clear()
+
+    def remove(self, match):
+        entry = self.entries.pop(match.match_id, None)
+        if entry is None:
+            return
+        tables = self.waiting if entry[0] else self.others
+        del tables[bisect.bisect_left(tables, (entry[1], match.match_id))]
+        del self.matches[match.match_id]
+        self.payloads.clear()
+
+    def get_payload(self, gold: int) -> bytes:
+        """Serialized TableList for a user with this much gold."""
+        bucket = gold_bucket(gold)
+        payload = self.payloads.get(bucket)
+        if payload is not None:
+            self.hit_count += 1
+            return payload
+        self.build_count += 1
+        payload = self.build(bucket_gold(bucket)).SerializeToString()
+        self.payloads[bucket] = payload
+        return payload
+
+    def build(self, gold: float):
+        pkg = packet_pb2.TableList()
+        for match in self.closest_matches(gold):
+            pkg.table_ids.append(match.match_id)
+            pkg.bets.append(match.bet)
+            pkg.player_modes.append(match.player_mode)
+            pkg.num_players.append(match.get_num_players())
+            pkg.game_modes.append(match.game_mode)
+
+            for player in match.players:
+                pkg.avatars.append(player.avatar)
+                pkg.player_uids.append(player.uid)
+        return pkg
+
+    def closest_matches(self, gold: float, limit: int = MAX_TABLES) -> list:
+        target_bet = gold / tress_config.get('bet_multiplier_min')
+        match_ids = self._closest(self.waiting, target_bet, limit)
+        match_ids += self._closest(self.others, target_bet, limit - len(match_ids))
+        return [self.matches[match_id] for match_id in match_ids]
+
+    def get_stats(self) -> dict:
+        return {
+            "public_tables": len(self.entries),
+            "cached_payloads": len(self.payloads),
+            "hit_count": self.hit_count,
+            "build_count": self.build_count,
+        }
+
+    @staticmethod
+    def _closest(tables: list[tuple[int, int]], target_bet: float, limit: int) -> list[int]:
+        """match_ids of the `limit` tables with the bet closest to target_bet, walking out from it."""
+        result = []
+        high = bisect.bisect_left(tables, (target_bet, -1))
+        low = high - 1
+        while len(result) < limit and (low >= 0 or high < len(tables)):
+            if high >= len(tables) or (low >= 0 and target_bet - tables[low][0] <= tables[high][0] - target_bet):
+                result.append(tables[low][1])
+                low -= 1
+            else:
+                result.append(tables[high][1])
+                high += 1
+        return result
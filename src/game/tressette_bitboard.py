@@ -0,0 +1,93 @@
+"""Tressette cards as bits of an int: bit i is set when card i (rank i // 4, suit i % 4) is in the set.
+
+Hands, legal moves and tricks are masks, so following suit, winning a trick or finding a napoli
+is a few bit operations. Packets carry card ids, convert with to_cards() / from_cards() there.
+"""
+from src.game.tressette_constants import TRESSETTE_CARD_STRONGS, TRESSETTE_CARD_VALUES
+
+NUM_CARDS = 40
+FULL_DECK = (1 << NUM_CARDS) - 1
+
+CARD_BITS = [1 << card for card in range(NUM_CARDS)]
+SUIT_MASKS = [sum(CARD_BITS[card] for card in range(suit, NUM_CARDS, 4)) for suit in range(4)]
+RANK_MASKS = [0xF << (4 * rank) for rank in range(10)]
+CARD_STRENGTHS = [TRESSETTE_CARD_STRONGS[card // 4] for card in range(NUM_CARDS)]
+CARD_VALUES = [TRESSETTE_CARD_VALUES[card] for card in range(NUM_CARDS)]
+
+# ranks from the strongest (three) to the weakest (four)
+RANKS_BY_STRENGTH = sorted(TRESSETTE_CARD_STRONGS, key=TRESSETTE_CARD_STRONGS.get, reverse=True)
+# cards from the cheapest to give away (least points, then weakest) to the dearest
+CARDS_BY_COST = sorted(range(NUM_CARDS), key=lambda card: (CARD_VALUES[card], CARD_STRENGTHS[card]))
+# cards worth 3 (aces) and 1 (twos, threes, figures)
+ACE_MASK = sum(CARD_BITS[card] for card in range(NUM_CARDS) if CARD_VALUES[card] == 3)
+ONE_POINT_MASK = sum(CARD_BITS[card] for card in range(NUM_CARDS) if CARD_VALUES[card] == 1)
+# ace, two and three of a suit
+NAPOLI_MASKS = [CARD_BITS[suit] | CARD_BITS[suit + 4] | CARD_BITS[suit + 8] for suit in range(4)]
+
+
+def from_cards(cards) -> int:
+    mask = 0
+    for card in cards:
+        mask |= CARD_BITS[card]
+    return mask
+
+
+def to_cards(mask: int) -> list[int]:
+    """Card ids of the mask, ascending."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
+
+def count(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def lowest_card(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def legal_moves(hand: int, lead_suit: int) -> int:
+    """Cards of the hand that can be played on a trick led with lead_suit, -1 when leading."""
+    if lead_suit == -1:
+        return hand
+    return hand & SUIT_MASKS[lead_suit] or hand
+
+
+def strongest_card(mask: int) -> int:
+    """Strongest card of the mask by rank, -1 if empty. Among equal ranks the lowest suit."""
+    for rank in RANKS_BY_STRENGTH:
+        cards = mask & RANK_MASKS[rank]
+        if cards:
+            return lowest_card(cards)
+    return -1
+
+
+def cheapest_card(mask: int) -> int:
+    """Card of the mask worth the fewest points, the weakest among equal values, -1 if empty."""
+    for card in CARDS_BY_COST:
+        if mask >> card & 1:
+            return card
+    return -1
+
+
+def trick_winner(trick: int, lead_suit: int) -> int:
+    """Card that takes the trick: the strongest of the led suit."""
+    return strongest_card(trick & SUIT_MASKS[lead_suit])
+
+
+def points(mask: int) -> int:
+    """Value of the cards, in thirds of a point."""
+    return 3 * count(mask & ACE_MASK) + count(mask & ONE_POINT_MASK)
+
+
+def beats(card: int, other: int) -> bool:
+    """True if card, of the same suit, takes other."""
+    return CARD_STRENGTHS[card] > CARD_STRENGTHS[other]
+
+
+def napoli_suits(hand: int) -> list[int]:
+    return [suit for suit in range(4) if hand & NAPOLI_MASKS[suit] == NAPOLI_MASKS[suit]]
@@ -0,0 +1,80 @@
+import collections
+
+
+class UserCache:
+    """uid -> UserInfo, bounded: past max_size the least recently used users are dropped.
+
+    Users for which is_pinned(uid) is true (online, seated in a match) are never dropped, other
+    code holds on to their UserInfo; the cache can grow past max_size while they are pinned.
+    When a pass over the cache leaves it too large, the next one waits until the cache grows
+    by an eighth, so inserts stay O(1) amortized however many users are pinned.
+    """
+    def __init__(self, max_size: int, is_pinned=None):
+        self.max_size = max_size
+        self.is_pinned = is_pinned  # uid -> bool
+        self._users: collections.OrderedDict = collections.OrderedDict()
+        self._evict_above = max_size  # size past which the next eviction pass runs
+
+        # metrics
+        self.hit_count = 0
+        self.miss_count = 0
+        self.evicted_count = 0
+
+    def get(self, uid, default=None):
+        user = self._users.get(uid)
+        if user is None:
+            self.miss_count += 1
+            return default
+        self.hit_count += 1
+        self._users.move_to_end(uid)
+        return user
+
+    def __setitem__(self, uid, user):
+        self._users[uid] = user
+        self._users.move_to_end(uid)
+        if len(self._users) > self._evict_above:
+            self._evict()
+
+    def __getitem__(self, uid):
+        return self._users[uid]
+
+    def __contains__(self, uid) -> bool:
+        return uid in self._users
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __iter__(self):
+        return iter(self._users)
+
+    def pop(self, uid, default=None):
+        return self._users.pop(uid, default)
+
+    def values(self):
+        return self._users.values()
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._users),
+            "max_size": self.max_size,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "evicted_count": self.evicted_count,
+            "evict_above": self._evict_above,
+        }
+
+    def _evict(self):
+        # oldest first; a pinned user counts as just used and goes to the back
+        for _ in range(len(self._users)):
+            if len(self._users) <= self.max_size:
+                self._evict_above = self.max_size
+                return
+            uid = next(iter(self._users))
+            if self.is_pinned is not None and self.is_pinned(uid):
+                self._users.move_to_end(uid)
+                continue
+            del self._users[uid]
+            self.evicted_count += 1
+        # everyone left is pinned: wait for the cache to grow before looking again
+        size = len(self._users)
+        self._evict_above = max(self.max_size, size + max(1, size // 8))
@@ -6,6 +6,8 @@ import logging
 from src.base.network.packets import packet_pb2
 from src.config.settings import settings
 from src.game.models import UserInfo
+from src.game.game_vars import game_vars
+from src.game.user_cache import UserCache
 from src.postgres.sql_models import UserInfoSchema
 from src.postgres.orm import PsqlOrm
 from src.game.cmds import CMDs
@@ -17,8 +19,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("user_info_mgr")  # Name your logger
 
+
+def is_user_pinned(uid: int) -> bool:
+    """Online users and users seated in a match stay in the cache."""
+    from src.base.network.connection_manager import connection_manager  # imports this module
+    if connection_manager.check_user_active_online(uid):
+        return True
+    match_mgr = game_vars.match_mgr
+    return match_mgr is not None and uid in match_mgr.user_matchids
+
+
 class UsersInfoMgr:
-    users : dict[int, UserInfo] = {} # Store user info in memory for quick access uid -> UserInfo
+    users: UserCache = UserCache(settings.USER_CACHE_MAX_SIZE, is_user_pinned) # Store user info in memory for quick access uid -> UserInfo
     async def create_new_user(self) -> UserInfo:
         user_model = UserInfoSchema()
         user_model.name = "tressette player"
@@ -67,20 +79,12 @@ class UsersInfoMgr:
                 return user_inf
         return None
 
-    async def on_receive_packet(self, uid, cmd_id, payload):
-        match cmd_id:
-            case CMDs.CHANGE_AVATAR:
-                await self._handle_change_avatar(uid, payload)
-            case CMDs.CHANGE_USER_NAME:
-                await self._handle_change_user_name(uid, payload)
-            case CMDs.CHEAT_GOLD_USER:
-                await self._handle_cheat_gold_user(uid, payload)
-            case _:
-                pass
-
-    async def _handle_change_avatar(self, uid: int, payload):
-        pkg = packet_pb2.ChangeAvatar()
-        pkg.ParseFromString(payload)
+    def register_cmds(self, router):
+        router.register(CMDs.CHANGE_AVATAR, self._handle_change_avatar, packet_pb2.ChangeAvatar)
+        router.register(CMDs.CHANGE_USER_NAME, self._handle_change_user_name, packet_pb2.ChangeUserName)
+        router.register(CMDs.CHEAT_GOLD_USER, self._handle_cheat_gold_user, packet_pb2.CheatGoldUser)
+
+    async def _handle_change_avatar(self, uid: int, pkg):
         avatar_id = pkg.avatar_id
         user = await self.get_user_info(uid)
 
@@ -99,12 +103,10 @@ class UsersInfoMgr:
         # update changes to database
         await user.commit_avatar()
 
-    async def _handle_cheat_gold_user(self, uid: int, payload):
+    async def _handle_cheat_gold_user(self, uid: int, pkg):
         if not settings.ENABLE_CHEAT:
             return
 
-        pkg = packet_pb2.CheatGoldUser()
-        pkg.ParseFromString(payload)
         gold = pkg.gold
         user = await self.get_user_info(uid)
         user.add_gold(gold)
@@ -121,15 +123,13 @@ class UsersInfoMgr:
             return True
         return False
     
-    async def _handle_change_user_name(self, uid: int, payload):
+    async def _handle_change_user_name(self, uid: int, pkg):
         user = await self.get_user_info(uid)
 
         # only user with name "tressette player" can change name
         if user.name != "tressette player":
             logger.error(f"User {uid} try to change name {user.name}")
             return
-        pkg = packet_pb2.ChangeUserName()
-        pkg.ParseFromString(payload)
         new_name = pkg.name
         
         # valid new name